@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
-from typing import Any
 
 from pydantic import BaseModel
 
@@ -15,75 +16,75 @@ logger = logging.getLogger(__name__)
 class AnalystAgent(BaseAgent):
     """Evaluates trade theses using the scoring framework and selects contracts."""
 
-    @property
-    def role(self) -> str:
-        return (
-            "options trading analyst who scores trade theses on five dimensions: "
-            "information edge, volatility pricing, technical alignment, catalyst clarity, "
-            "and risk/reward ratio. You only recommend trades scoring 7.0+ overall. "
-            "You estimate expected stock moves and catalyst timelines so the system "
-            "can programmatically select the best contract from real market data."
-        )
+    ROLE = (
+        "options trading analyst who scores trade theses on five dimensions: "
+        "information edge, volatility pricing, technical alignment, catalyst clarity, "
+        "and risk/reward ratio. You only recommend trades scoring 7.0+ overall. "
+        "You estimate expected stock moves and catalyst timelines so the system "
+        "can programmatically select the best contract from real market data."
+    )
 
     @property
     def prompt_file(self) -> str:
         return "thesis_scoring.md"
 
+    @functools.cached_property
+    def _has_feedback(self) -> bool:
+        """Whether db offers cross-ticker feedback — checked once per agent."""
+        return hasattr(self.db, "feedback")
+
     async def gather_context(self, input_data: BaseModel) -> dict:
         """Fetch previous thesis history with outcomes for this ticker."""
         ticker = getattr(input_data, "ticker", None)
+        ctx = {"historical_context": "", "system_feedback": ""}
         if not ticker or not self.db:
-            return {"historical_context": "", "system_feedback": ""}
+            return ctx
 
-        ctx: dict[str, str] = {"historical_context": "", "system_feedback": ""}
+        # History and cross-ticker feedback touch disjoint rows — fetch concurrently
+        fetches = [self.db.get_thesis_history_with_outcomes(ticker, limit=5)]
+        if self._has_feedback:
+            fetches.append(self.db.feedback.build_analyst_feedback())
+        history, *feedback = await asyncio.gather(*fetches, return_exceptions=True)
 
-        try:
-            history = await self.db.get_thesis_history_with_outcomes(ticker, limit=5)
-            if history:
-                ctx["historical_context"] = self._format_history(history)
-        except Exception:
+        if isinstance(history, Exception):
             logger.debug("Could not fetch thesis history for %s (V016 may not be applied)", ticker)
+        elif history:
+            ctx["historical_context"] = self._format_history(history)
 
         # Cross-ticker feedback
-        if hasattr(self.db, "pool"):
-            try:
-                from db.feedback import FeedbackAggregator
-
-                aggregator = FeedbackAggregator(self.db.pool)
-                ctx["system_feedback"] = await aggregator.build_analyst_feedback()
-            except Exception:
-                logger.debug("Could not fetch system feedback", exc_info=True)
+        if feedback:
+            if isinstance(feedback[0], Exception):
+                logger.debug("Could not fetch system feedback", exc_info=feedback[0])
+            else:
+                ctx["system_feedback"] = feedback[0]
 
         return ctx
 
-    @staticmethod
-    def _format_history(history: list[dict]) -> str:
-        """Format thesis history into a readable section for the prompt."""
-        lines = [
-            "## Previous Theses for This Ticker",
-            "",
-            "Review these past calls. Were they correct? What changed since then?",
-            "",
-        ]
-        for row in history:
-            date = row.get("created_at")
-            date_str = date.strftime("%Y-%m-%d") if date else "unknown"
-            direction = row.get("direction", "?")
-            score = row.get("overall_score", "?")
-
-            pnl = row.get("outcome_realized_pnl")
-            reason = row.get("outcome_close_reason")
-            if pnl is not None:
-                outcome = f"P&L: ${pnl} ({reason})"
-            else:
-                outcome = "no outcome yet"
-
-            thesis_text = row.get("thesis_text", "")
-            if len(thesis_text) > 200:
-                thesis_text = thesis_text[:200] + "..."
+    _HISTORY_HEADER = (
+        "## Previous Theses for This Ticker\n"
+        "\n"
+        "Review these past calls. Were they correct? What changed since then?\n"
+        "\n"
+    )
+    _ROW_FMT = (
+        "- **{date_str}** | {direction} | score {overall_score} | {outcome}\n"
+        "  {thesis_text}\n"
+    )
+
+    @classmethod
+    def _format_history(cls, history: list[dict]) -> str:
+        """Format thesis history into a readable section for the prompt.
+
+        Expects rows from get_thesis_history_with_outcomes (date and text
+        truncation already done in SQL).
+        """
+        return cls._HISTORY_HEADER + "\n".join(
+            cls._ROW_FMT.format_map({**row, "outcome": _outcome(row)}) for row in history
+        )
 
-            lines.append(f"- **{date_str}** | {direction} | score {score} | {outcome}")
-            lines.append(f"  {thesis_text}")
-            lines.append("")
 
-        return "\n".join(lines)
+def _outcome(row: dict) -> str:
+    pnl = row.get("outcome_realized_pnl")
+    if pnl is None:
+        return "no outcome yet"
+    return f"P&L: ${pnl} ({row.get('outcome_close_reason')})"
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import re
+from importlib import resources
 from typing import Any, TypeVar
 
 from pydantic import BaseModel
@@ -11,35 +12,80 @@ from openclaw.llm import LLMClient
 
 T = TypeVar("T", bound=BaseModel)
 
-PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
+PROMPTS = resources.files("prompts")
+
+# Only bare {name} placeholders are substituted — other braces (JSON, code
+# snippets) in the templates pass through untouched.
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+
+def _compile_prompt(template: str) -> list[str]:
+    """Split a template into alternating [literal, name, literal, ..., literal] segments."""
+    return _PLACEHOLDER_RE.split(template)
+
+
+# prompt_file -> compiled template, preloaded once at import so execute() never
+# touches disk
+_PROMPT_CACHE: dict[str, list[str]] = {
+    entry.name: _compile_prompt(entry.read_text())
+    for entry in PROMPTS.iterdir()
+    if entry.name.endswith(".md") and entry.is_file()
+}
+
+
+def _render_prompt(segments: list[str], values: dict[str, Any]) -> str:
+    """Fill a compiled template in one pass. Unknown placeholders are left as-is."""
+    parts = segments.copy()
+    for i in range(1, len(parts), 2):
+        name = parts[i]
+        parts[i] = str(values[name]) if name in values else f"{{{name}}}"
+    return "".join(parts)
 
 
 class BaseAgent:
     """Each agent wraps an LLM call with role-specific prompt + optional data gathering.
 
     Subclasses override:
-    - role: Agent's role description
+    - ROLE: Agent's role description (class attribute)
     - prompt_file: Path to the prompt template markdown file
     - gather_context(): Fetch additional data before the LLM call
     """
 
+    ROLE: str
+
     def __init__(self, llm: LLMClient, db: Any = None):
         self.llm = llm
         self.db = db
+        self.system_prompt = f"You are a {self.ROLE}."
+        # Last (input model, serialized JSON) pair — retries re-use the same input
+        self._serialized_input: tuple[BaseModel, str] | None = None
 
     @property
     def role(self) -> str:
-        raise NotImplementedError
+        return self.ROLE
 
     @property
     def prompt_file(self) -> str:
         raise NotImplementedError
 
-    def _load_prompt(self) -> str:
-        path = PROMPTS_DIR / self.prompt_file
-        if path.exists():
-            return path.read_text()
-        return f"You are a {self.role}. Analyze the input and produce structured output."
+    def _load_prompt(self) -> list[str]:
+        """Return the compiled prompt template from the preloaded cache."""
+        segments = _PROMPT_CACHE.get(self.prompt_file)
+        if segments is None:
+            return [f"You are a {self.role}. Analyze the input and produce structured output."]
+        return segments
+
+    def _serialize_input(self, input_data: BaseModel) -> str:
+        """Compact JSON for the {input} placeholder, memoized across retries.
+
+        Indentation buys the LLM nothing and inflates the prompt's token count.
+        """
+        cached = self._serialized_input
+        if cached is not None and cached[0] is input_data:
+            return cached[1]
+        serialized = input_data.model_dump_json()
+        self._serialized_input = (input_data, serialized)
+        return serialized
 
     async def gather_context(self, input_data: BaseModel) -> dict:
         """Override to fetch additional data from DB/APIs before LLM call."""
@@ -55,15 +101,13 @@ class BaseAgent:
         extra_context = await self.gather_context(input_data)
         prompt_template = self._load_prompt()
 
-        # Use simple string replacement instead of .format() to avoid issues
-        # with curly braces in raw data (e.g., JSON, code snippets)
-        replacements = {"input": input_data.model_dump_json(indent=2), **extra_context}
-        prompt = prompt_template
-        for key, value in replacements.items():
-            prompt = prompt.replace(f"{{{key}}}", str(value))
+        # Placeholder substitution over the pre-split template instead of
+        # .format() to avoid issues with curly braces in raw data (e.g., JSON)
+        replacements = {"input": self._serialize_input(input_data), **extra_context}
+        prompt = _render_prompt(prompt_template, replacements)
 
         return await self.llm.structured_output(
-            system=f"You are a {self.role}.",
+            system=self.system_prompt,
             prompt=prompt,
             response_model=output_schema,
         )
@@ -14,14 +14,12 @@ logger = logging.getLogger(__name__)
 class CriticAgent(BaseAgent):
     """Stress-tests the analyst's thesis from the opposing perspective."""
 
-    @property
-    def role(self) -> str:
-        return (
-            "devil's advocate who stress-tests trade theses. "
-            "You build the strongest case AGAINST the trade, identify blind spots, "
-            "and adjust scores to reflect true risk. You are not contrarian for its "
-            "own sake — if the thesis is strong, you say so."
-        )
+    ROLE = (
+        "devil's advocate who stress-tests trade theses. "
+        "You build the strongest case AGAINST the trade, identify blind spots, "
+        "and adjust scores to reflect true risk. You are not contrarian for its "
+        "own sake — if the thesis is strong, you say so."
+    )
 
     @property
     def prompt_file(self) -> str:
@@ -29,13 +27,10 @@ class CriticAgent(BaseAgent):
 
     async def gather_context(self, input_data: BaseModel) -> dict:
         """Inject cross-ticker system feedback so critic knows historical patterns."""
-        if not self.db or not hasattr(self.db, "pool"):
+        if not self.db or not hasattr(self.db, "feedback"):
             return {"system_feedback": ""}
         try:
-            from db.feedback import FeedbackAggregator
-
-            aggregator = FeedbackAggregator(self.db.pool)
-            return {"system_feedback": await aggregator.build_analyst_feedback()}
+            return {"system_feedback": await self.db.feedback.build_analyst_feedback()}
         except Exception:
             logger.debug("Could not fetch system feedback for critic", exc_info=True)
             return {"system_feedback": ""}
@@ -15,21 +15,31 @@ T = TypeVar("T", bound=BaseModel)
 
 logger = logging.getLogger(__name__)
 
+_PIPELINE: ResearchPipeline | None = None
+
+
+def _get_pipeline() -> ResearchPipeline:
+    """Process-wide pipeline shared by every researcher that isn't given one."""
+    global _PIPELINE
+    if _PIPELINE is None:
+        _PIPELINE = ResearchPipeline()
+    return _PIPELINE
+
 
 class ResearcherAgent(BaseAgent):
     """Gathers data from multiple sources, then uses LLM to synthesize."""
 
-    def __init__(self, llm: LLMClient, db: Any = None):
-        super().__init__(llm, db)
-        self.pipeline = ResearchPipeline()
+    ROLE = (
+        "senior equity research analyst specializing in options trading. "
+        "You synthesize news, technicals, options flow, and macro data "
+        "into actionable research summaries with opportunity scores (1-10)."
+    )
 
-    @property
-    def role(self) -> str:
-        return (
-            "senior equity research analyst specializing in options trading. "
-            "You synthesize news, technicals, options flow, and macro data "
-            "into actionable research summaries with opportunity scores (1-10)."
-        )
+    def __init__(
+        self, llm: LLMClient, db: Any = None, pipeline: ResearchPipeline | None = None
+    ):
+        super().__init__(llm, db)
+        self.pipeline = pipeline or _get_pipeline()
 
     @property
     def prompt_file(self) -> str:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import datetime as _dt
 from typing import Any
 
 from pydantic import BaseModel
@@ -13,22 +14,28 @@ from openclaw.llm import LLMClient
 class ReviewerAgent(BaseAgent):
     """Reviews open positions: thesis validity, P&L, recommended actions."""
 
+    ROLE = (
+        "portfolio manager reviewing open options positions. "
+        "For each position, you evaluate whether the original thesis is still valid, "
+        "assess P&L trajectory, and recommend one of: hold, add, reduce, close, or roll. "
+        "You consider new information, technical changes, and theta decay impact."
+    )
+
     def __init__(self, llm: LLMClient, db: Any = None):
         super().__init__(llm, db)
         self._position: dict | None = None
+        self._prefetched: dict[int, dict] | None = None
 
     def set_review_context(self, position: dict) -> None:
         """Stash position details before the workflow runs."""
         self._position = position
 
-    @property
-    def role(self) -> str:
-        return (
-            "portfolio manager reviewing open options positions. "
-            "For each position, you evaluate whether the original thesis is still valid, "
-            "assess P&L trajectory, and recommend one of: hold, add, reduce, close, or roll. "
-            "You consider new information, technical changes, and theta decay impact."
-        )
+    def set_review_contexts(self, bundles: dict[int, dict]) -> None:
+        """Stash batch-fetched review bundles keyed by position id.
+
+        When set, gather_context reads from these instead of querying per position.
+        """
+        self._prefetched = bundles
 
     @property
     def prompt_file(self) -> str:
@@ -49,26 +56,21 @@ class ReviewerAgent(BaseAgent):
         # Format current position details
         days_held = ""
         if pos.get("opened_at"):
-            import datetime as _dt
-
             opened = pos["opened_at"]
             if hasattr(opened, "date"):
                 delta = _dt.datetime.now(_dt.timezone.utc) - opened
                 days_held = f", held {delta.days} days"
 
-        # Compute P&L percentage for the LLM
-        cost_basis = pos.get("cost_basis")
-        unrealized = pos.get("unrealized_pnl")
-        pnl_pct_str = "N/A"
-        if cost_basis and unrealized:
-            try:
-                from decimal import Decimal as D
-                cb = D(str(cost_basis))
-                ur = D(str(unrealized))
-                if cb:
-                    pnl_pct_str = f"{float(ur / cb * 100):+.1f}%"
-            except Exception:
-                pass
+        # Thesis, prior reviews and P&L % all come from one bundled query
+        bundle = None
+        if position_id and self._prefetched is not None:
+            bundle = self._prefetched.get(position_id)
+        elif position_id:
+            bundle = await self.db.get_review_bundle(position_id, review_limit=3)
+
+        # NULL without a cost basis; a flat 0 also reads "N/A", as before bundling
+        pnl_pct = bundle.get("pnl_pct") if bundle else None
+        pnl_pct_str = f"{float(pnl_pct):+.1f}%" if pnl_pct else "N/A"
 
         position_text = (
             f"Position ID: {position_id} | Ticker: {pos.get('ticker')}\n"
@@ -81,31 +83,26 @@ class ReviewerAgent(BaseAgent):
             f"{days_held}"
         )
 
-        # Fetch original thesis
         original_thesis = "No linked thesis found."
-        if position_id:
-            thesis_row = await self.db.get_thesis_for_position(position_id)
-            if thesis_row:
-                original_thesis = (
-                    f"**Direction:** {thesis_row.get('direction', '?')}\n"
-                    f"**Score:** {thesis_row.get('overall_score', '?')}/10\n"
-                    f"**Thesis:** {thesis_row.get('thesis_text', 'N/A')}"
-                )
-
-        # Fetch previous reviews for trend tracking
+        if bundle and bundle.get("thesis_id") is not None:
+            original_thesis = (
+                f"**Direction:** {bundle.get('thesis_direction') or '?'}\n"
+                f"**Score:** {bundle.get('thesis_overall_score', '?')}/10\n"
+                f"**Thesis:** {bundle.get('thesis_text') or 'N/A'}"
+            )
+
+        # Previous reviews for trend tracking
         previous_reviews = "No previous reviews."
-        if position_id:
-            reviews = await self.db.get_recent_reviews(position_id, limit=3)
-            if reviews:
-                lines = []
-                for r in reviews:
-                    lines.append(
-                        f"- [{r.get('created_at', '?')}] "
-                        f"Action: **{r.get('recommended_action', '?')}** | "
-                        f"Thesis valid: {r.get('thesis_still_valid', '?')} | "
-                        f"{r.get('reasoning', '')[:200]}"
-                    )
-                previous_reviews = "\n".join(lines)
+        reviews = bundle.get("reviews") if bundle else None
+        if reviews:
+            # reasoning already truncated to 200 chars in SQL
+            previous_reviews = "\n".join(
+                f"- [{r.get('created_at', '?')}] "
+                f"Action: **{r.get('recommended_action', '?')}** | "
+                f"Thesis valid: {r.get('thesis_still_valid', '?')} | "
+                f"{r.get('reasoning') or ''}"
+                for r in reviews
+            )
 
         ctx = {
             "positions": position_text,
@@ -115,12 +112,9 @@ class ReviewerAgent(BaseAgent):
         }
 
         # Cross-ticker review feedback
-        if hasattr(self.db, "pool"):
+        if hasattr(self.db, "feedback"):
             try:
-                from db.feedback import FeedbackAggregator
-
-                aggregator = FeedbackAggregator(self.db.pool)
-                ctx["review_patterns"] = await aggregator.build_reviewer_feedback()
+                ctx["review_patterns"] = await self.db.feedback.build_reviewer_feedback()
             except Exception:
                 pass
 
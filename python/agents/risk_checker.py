@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
-from collections import Counter
 from decimal import Decimal
 from typing import Any
 
 from pydantic import BaseModel
 
 from agents.base import BaseAgent
+from ib.account_cache import AccountEquityCache
 from openclaw.llm import LLMClient
 
 logger = logging.getLogger(__name__)
@@ -18,19 +20,24 @@ logger = logging.getLogger(__name__)
 class RiskCheckerAgent(BaseAgent):
     """Independently verifies risk parameters. Does NOT trust the analyst's assessment."""
 
-    def __init__(self, llm: LLMClient, db: Any = None, ib_client: Any = None):
+    ROLE = (
+        "risk management specialist for a multi-platform trading operation. "
+        "You verify position sizing (max 2% per trade), total allocation (max 10%), "
+        "sector correlation (max 3 correlated positions), and cross-platform exposure "
+        "with HyperLiquid and Polymarket positions. You are conservative and independent — "
+        "you do NOT defer to the analyst's recommendation."
+    )
+
+    def __init__(
+        self,
+        llm: LLMClient,
+        db: Any = None,
+        ib_client: Any = None,
+        equity_cache: AccountEquityCache | None = None,
+    ):
         super().__init__(llm, db)
         self.ib_client = ib_client
-
-    @property
-    def role(self) -> str:
-        return (
-            "risk management specialist for a multi-platform trading operation. "
-            "You verify position sizing (max 2% per trade), total allocation (max 10%), "
-            "sector correlation (max 3 correlated positions), and cross-platform exposure "
-            "with HyperLiquid and Polymarket positions. You are conservative and independent — "
-            "you do NOT defer to the analyst's recommendation."
-        )
+        self.equity_cache = equity_cache or AccountEquityCache()
 
     @property
     def prompt_file(self) -> str:
@@ -41,72 +48,64 @@ class RiskCheckerAgent(BaseAgent):
         if self.db is None:
             return {"portfolio_state": "Database not connected. Use conservative defaults."}
 
-        # 1. Account equity from IB (or fallback default)
-        #    Timeout required: accountSummaryAsync can deadlock when the position
-        #    manager tick loop is competing for the same ib_async connection.
-        account_equity = Decimal("200000")
-        if self.ib_client:
-            try:
-                import asyncio
-                summary = await asyncio.wait_for(
-                    self.ib_client.account_summary(), timeout=10.0
-                )
-                account_equity = summary.net_liquidation
-            except Exception as e:
-                logger.warning("IB account_summary failed, using default $200k: %s", e)
-
-        # 2. Open positions from DB
-        positions = await self.db.get_open_positions()
-        total_exposure = await self.db.get_total_options_exposure()
-
-        # 3. Sector map from watchlist for correlation counting
-        watchlist = await self.db.get_watchlist()
-        sector_map = {w["ticker"]: w.get("sector", "unknown") for w in watchlist}
+        # 1-3. Account equity (IB), open positions with their total exposure,
+        #      and sector concentration (DB) are independent — fetch them
+        #      concurrently
+        (
+            account_equity,
+            (positions, total_exposure),
+            sector_counts,
+            risk_feedback,
+        ) = await asyncio.gather(
+            self.equity_cache.get(self.ib_client),
+            self.db.get_open_positions_with_exposure(),
+            self.db.get_sector_concentration(),
+            self._risk_feedback(),
+        )
 
         # 4. Build human-readable summary for the LLM
         exposure_pct = (
             (total_exposure / account_equity * 100) if account_equity > 0 else Decimal("0")
         )
 
-        lines = [
+        header = [
             f"Account equity: ${account_equity:,.0f}",
             f"Open positions: {len(positions)}",
             f"Total options exposure: ${total_exposure:,.0f} ({exposure_pct:.1f}%)",
         ]
 
         if positions:
-            lines.append("\nCurrent positions:")
-            sector_counts: Counter = Counter()
-            for p in positions:
-                ticker = p.get("ticker", "?")
-                right = p.get("right", "?")
-                strike = p.get("strike", "?")
-                expiry = p.get("expiry", "?")
-                cost = p.get("cost_basis", Decimal("0"))
-                pnl = p.get("unrealized_pnl", Decimal("0"))
-                sector = sector_map.get(ticker, "unknown")
-                sector_counts[sector] += 1
-                lines.append(
-                    f"  - {ticker} {strike}{right} exp {expiry} | "
-                    f"cost ${cost:,.0f} | P&L ${pnl:+,.0f} | sector: {sector}"
-                )
-
-            lines.append("\nSector concentration:")
-            for sector, count in sector_counts.most_common():
-                lines.append(f"  - {sector}: {count} position(s)")
+            # Position lines are labelled from the same GROUP BY rows
+            sector_map = {t: sector for sector, _, tickers in sector_counts for t in tickers}
+            body = itertools.chain(
+                header,
+                ["\nCurrent positions:"],
+                (self._position_line(p, sector_map) for p in positions),
+                ["\nSector concentration:"],
+                (f"  - {sector}: {count} position(s)" for sector, count, _ in sector_counts),
+            )
         else:
-            lines.append("\nNo open positions.")
-
-        ctx = {"portfolio_state": "\n".join(lines), "risk_feedback": ""}
+            body = itertools.chain(header, ["\nNo open positions."])
 
-        # Cross-ticker risk feedback
-        if hasattr(self.db, "pool"):
-            try:
-                from db.feedback import FeedbackAggregator
+        return {"portfolio_state": "\n".join(body), "risk_feedback": risk_feedback}
 
-                aggregator = FeedbackAggregator(self.db.pool)
-                ctx["risk_feedback"] = await aggregator.build_risk_feedback()
-            except Exception:
-                logger.debug("Could not fetch risk feedback", exc_info=True)
+    @staticmethod
+    def _position_line(p: dict, sector_map: dict[str, str]) -> str:
+        ticker = p.get("ticker", "?")
+        return (
+            f"  - {ticker} {p.get('strike', '?')}{p.get('right', '?')} "
+            f"exp {p.get('expiry', '?')} | "
+            f"cost ${p.get('cost_basis', Decimal('0')):,.0f} | "
+            f"P&L ${p.get('unrealized_pnl', Decimal('0')):+,.0f} | "
+            f"sector: {sector_map.get(ticker, 'unknown')}"
+        )
 
-        return ctx
+    async def _risk_feedback(self) -> str:
+        """Cross-ticker risk feedback, or "" when unavailable."""
+        if not hasattr(self.db, "feedback"):
+            return ""
+        try:
+            return await self.db.feedback.build_risk_feedback()
+        except Exception:
+            logger.debug("Could not fetch risk feedback", exc_info=True)
+            return ""
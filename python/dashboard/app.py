@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -11,17 +13,58 @@ from fastapi.middleware.cors import CORSMiddleware
 from db.repositories import Database
 
 from .routes import portfolio, positions, research, system
+from .serialization import ORJSONResponse
+
+logger = logging.getLogger(__name__)
+
+# How stale /research-memory may get; its numbers only move when workflows run
+RESEARCH_MEMORY_REFRESH_SECS = 30
+
+# On top of Database.connect's defaults (jit off): application_name separates
+# dashboard load in pg_stat_activity, the timeout keeps one slow query from
+# pinning a pooled connection, and UTC keeps server-side date math in the same
+# zone as the +00:00 timestamps the API returns (Postgres-built JSON bodies
+# format theirs with iso_utc(), independent of this). Sent in the startup
+# packet, so no extra round trip per connection.
+_SERVER_SETTINGS = {
+    "application_name": "openclaw-dashboard",
+    "statement_timeout": "2s",
+    "TimeZone": "UTC",
+}
+
+
+async def _refresh_research_memory(db: Database) -> None:
+    """Keep the research_memory_stats view current while the dashboard runs."""
+    while True:
+        try:
+            await db.refresh_research_memory_stats()
+        except Exception as e:
+            logger.warning("research_memory_stats refresh failed: %s", e)
+        await asyncio.sleep(RESEARCH_MEMORY_REFRESH_SECS)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     dsn = os.environ.get("DATABASE_URL", "postgres://localhost/algo_trade")
-    app.state.db = await Database.connect(dsn)
+    app.state.db = await Database.connect(
+        dsn,
+        server_settings=_SERVER_SETTINGS,
+        # Polling is bursty — drop idle connections sooner than asyncpg's 300s
+        max_inactive_connection_lifetime=60.0,
+    )
+    refresher = asyncio.create_task(_refresh_research_memory(app.state.db))
     yield
+    refresher.cancel()
+    with suppress(asyncio.CancelledError):
+        await refresher
     await app.state.db.close()
 
 
-app = FastAPI(title="OpenClaw Dashboard", lifespan=lifespan)
+app = FastAPI(
+    title="OpenClaw Dashboard",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -0,0 +1,84 @@
+"""HTTP caching for polled endpoints — ETag, Last-Modified and Cache-Control."""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response
+
+from dashboard.serialization import dumps
+
+# For payloads that change on the order of minutes (watchlist, theses, ...)
+SLOW_CHANGING_MAX_AGE = 30
+
+
+def etag_for(data: bytes | Any) -> str:
+    """Strong ETag over response bytes, or over the repr of a cheaper change key."""
+    if not isinstance(data, bytes):
+        data = repr(data).encode()
+    return f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """Return a 304 if the client already holds `etag`, else None."""
+    header = request.headers.get("if-none-match")
+    if header and (header.strip() == "*" or etag in (t.strip() for t in header.split(","))):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
+def etag_response(request: Request, payload: Any) -> Response:
+    """Render `payload` as JSON, answering 304 when the client's copy is current."""
+    return etag_body_response(request, dumps(payload))
+
+
+def etag_body_response(request: Request, body: bytes) -> Response:
+    """Like etag_response, for a JSON body that is already encoded."""
+    etag = etag_for(body)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+def _http_date(dt: datetime) -> str:
+    return format_datetime(dt.astimezone(UTC), usegmt=True)
+
+
+def not_modified_since(request: Request, last_modified: datetime | None) -> Response | None:
+    """Return a 304 if If-Modified-Since covers `last_modified`, else None.
+
+    Ignored when the client also sent If-None-Match (the ETag wins, per RFC 9110).
+    """
+    header = request.headers.get("if-modified-since")
+    if last_modified is None or not header or "if-none-match" in request.headers:
+        return None
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return None
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    # HTTP dates have one-second resolution
+    if last_modified.replace(microsecond=0) <= since:
+        return Response(status_code=304, headers={"Last-Modified": _http_date(last_modified)})
+    return None
+
+
+def set_last_modified(response: Response, last_modified: datetime | None) -> Response:
+    if last_modified is not None:
+        response.headers["Last-Modified"] = _http_date(last_modified)
+    return response
+
+
+def cache_control(response: Response, max_age: int = SLOW_CHANGING_MAX_AGE) -> Response:
+    """Let the browser reuse `response` for `max_age` seconds without asking.
+
+    `private`: every route sits behind verify_token, so shared proxies must not
+    store the payload.
+    """
+    response.headers["Cache-Control"] = f"private, max-age={max_age}"
+    return response
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-from decimal import Decimal
 
 from fastapi import APIRouter, Depends, Query, Request
 
 from dashboard.auth import verify_token
+from dashboard.etag import etag_body_response
 from dashboard.serialization import serialize_row
 
 router = APIRouter(prefix="/api", tags=["portfolio"], dependencies=[Depends(verify_token)])
@@ -23,28 +23,21 @@ def _dec(v) -> str:
 async def portfolio_overview(request: Request):
     db = request.app.state.db
 
-    positions, total_exposure, total_realized, closed_count = await asyncio.gather(
+    positions, totals = await asyncio.gather(
         db.get_open_positions(),
-        db.get_total_options_exposure(),
-        db.get_total_realized_pnl(),
-        db.get_closed_positions_count(),
+        db.get_portfolio_totals(),
     )
 
-    total_unrealized = sum(Decimal(str(p.get("unrealized_pnl", 0))) for p in positions)
-    total_cost = sum(Decimal(str(p.get("cost_basis", 0))) for p in positions)
-
-    calls = [p for p in positions if p.get("right") == "call"]
-    puts = [p for p in positions if p.get("right") == "put"]
-
+    # Options exposure is the open cost basis — same SUM, so reuse it
     return {
         "open_positions": len(positions),
-        "closed_trades": closed_count,
-        "total_unrealized_pnl": _dec(total_unrealized),
-        "total_realized_pnl": _dec(total_realized),
-        "total_options_exposure": _dec(total_exposure),
-        "total_cost_basis": _dec(total_cost),
-        "calls_count": len(calls),
-        "puts_count": len(puts),
+        "closed_trades": totals["closed_count"],
+        "total_unrealized_pnl": _dec(totals["total_unrealized_pnl"]),
+        "total_realized_pnl": _dec(totals["total_realized_pnl"]),
+        "total_options_exposure": _dec(totals["total_cost_basis"]),
+        "total_cost_basis": _dec(totals["total_cost_basis"]),
+        "calls_count": totals["calls_count"],
+        "puts_count": totals["puts_count"],
         "positions": [serialize_row(p) for p in positions],
     }
 
@@ -55,5 +48,7 @@ async def portfolio_history(
     days: int = Query(default=30, ge=1, le=365),
 ):
     db = request.app.state.db
-    rows = await db.get_equity_history(days=days)
-    return {"days": days, "snapshots": [serialize_row(r) for r in rows]}
+    snapshots = await db.get_equity_history_json(days=days)
+    return etag_body_response(
+        request, b'{"days":%d,"snapshots":%s}' % (days, snapshots.encode())
+    )
@@ -5,10 +5,15 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, Query, Request
 
 from dashboard.auth import verify_token
+from dashboard.etag import cache_control, etag_body_response, etag_response
 from dashboard.serialization import serialize_row
 
 router = APIRouter(prefix="/api", tags=["research"], dependencies=[Depends(verify_token)])
 
+# Pre-encoded bodies for the common "nothing here yet" polls
+_NO_THESES = b'{"count":0,"theses":[]}'
+_NO_RECOMMENDATIONS = b'{"count":0,"recommendations":[]}'
+
 
 @router.get("/theses")
 async def list_theses(
@@ -18,13 +23,20 @@ async def list_theses(
 ):
     db = request.app.state.db
     rows = await db.get_theses(ticker=ticker, limit=limit)
-    return {"count": len(rows), "theses": [serialize_row(r, parse_json=True) for r in rows]}
+    if not rows:
+        return cache_control(etag_body_response(request, _NO_THESES))
+    return cache_control(etag_response(
+        request,
+        {"count": len(rows), "theses": [serialize_row(r, parse_json=True) for r in rows]},
+    ))
 
 
 @router.get("/theses/{ticker}")
 async def theses_for_ticker(request: Request, ticker: str):
     db = request.app.state.db
     rows = await db.get_theses(ticker=ticker.upper(), limit=100)
+    if not rows:
+        return {"ticker": ticker.upper(), "count": 0, "theses": []}
     return {
         "ticker": ticker.upper(),
         "count": len(rows),
@@ -36,7 +48,9 @@ async def theses_for_ticker(request: Request, ticker: str):
 async def list_recommendations(request: Request, status: str = "all"):
     db = request.app.state.db
     rows = await db.get_all_recommendations(status=status)
-    return {
+    if not rows:
+        return cache_control(etag_body_response(request, _NO_RECOMMENDATIONS))
+    return cache_control(etag_response(request, {
         "count": len(rows),
         "recommendations": [serialize_row(r, parse_json=True) for r in rows],
-    }
+    }))
@@ -2,104 +2,112 @@
 
 from __future__ import annotations
 
-from decimal import Decimal
+import asyncio
+import logging
+from datetime import datetime
 
+import asyncpg
 from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
 
 from dashboard.auth import verify_token
-from dashboard.serialization import serialize_row
+from dashboard.etag import (
+    cache_control,
+    etag_body_response,
+    not_modified_since,
+    set_last_modified,
+)
+from dashboard.serialization import dumps, serialize_row
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["system"], dependencies=[Depends(verify_token)])
 
+_EMPTY_RESEARCH_MEMORY = dumps({
+    "total_research": 0, "total_theses": 0, "theses_with_outcome": 0,
+    "winning_theses": 0, "losing_theses": 0, "total_outcome_pnl": "0",
+    "tickers_analyzed": 0, "total_recommendations": 0,
+    "approved_recommendations": 0, "filled_recommendations": 0,
+})
+
 
-@router.get("/status")
+@router.api_route("/status", methods=["GET", "HEAD"])
 async def system_status(request: Request):
     db = request.app.state.db
-    try:
-        await db.pool.fetchval("SELECT 1")
-        db_connected = True
-    except Exception:
-        db_connected = False
-
-    recent = await db.recent_runs(limit=5)
-    return {
-        "db_connected": db_connected,
-        "recent_workflows": [serialize_row(r) for r in recent],
-    }
+    db_connected, recent = await asyncio.gather(db.ping(), db.get_recent_runs_json(limit=5))
+    body = b'{"db_connected":%s,"recent_workflows":%s}' % (
+        b"true" if db_connected else b"false",
+        recent.encode(),
+    )
+    return etag_body_response(request, body)
 
 
-@router.get("/watchlist")
+@router.api_route("/watchlist", methods=["GET", "HEAD"])
 async def watchlist(request: Request):
     db = request.app.state.db
-    rows = await db.get_watchlist()
-    return {"count": len(rows), "watchlist": [serialize_row(r) for r in rows]}
+    last_modified = await db.get_watchlist_last_modified()
+    cached = not_modified_since(request, last_modified)
+    if cached is not None:
+        return cache_control(cached)
+
+    # Rows are JSON-encoded by Postgres and spliced in without a Python pass
+    count, rows_json = await db.get_watchlist_json()
+    body = b'{"count":%d,"watchlist":%s}' % (count, rows_json.encode())
+    return cache_control(set_last_modified(etag_body_response(request, body), last_modified))
 
 
-@router.get("/research-memory")
+@router.api_route("/research-memory", methods=["GET", "HEAD"])
 async def research_memory(request: Request):
     db = request.app.state.db
     try:
-        stats = await db.get_research_memory_stats()
-        return {k: str(v) if isinstance(v, Decimal) else v for k, v in stats.items()}
-    except Exception:
-        return {
-            "total_research": 0, "total_theses": 0, "theses_with_outcome": 0,
-            "winning_theses": 0, "losing_theses": 0, "total_outcome_pnl": "0",
-            "tickers_analyzed": 0, "total_recommendations": 0,
-            "approved_recommendations": 0, "filled_recommendations": 0,
-        }
+        body = (await db.get_research_memory_stats_json()).encode()
+    except asyncpg.PostgresError as e:
+        # Outcome columns are missing until V016 is applied
+        logger.warning("Research memory stats unavailable: %s", e)
+        body = _EMPTY_RESEARCH_MEMORY
+    return cache_control(etag_body_response(request, body))
+
+
+async def _fetch_workflows(db) -> tuple[list[dict], dict, datetime | None]:
+    """Recent runs with steps, their stats, and the last equity tick.
+
+    The last equity snapshot timestamp doubles as position manager health.
+    """
+    runs, stats, last_tick = await asyncio.gather(
+        db.get_workflow_runs_with_steps(limit=20),
+        db.get_workflow_stats(limit=20),
+        db.pool.fetchval("SELECT MAX(timestamp) FROM equity_snapshots"),
+        return_exceptions=True,
+    )
+    if isinstance(runs, BaseException):
+        raise runs
+    if isinstance(stats, BaseException):
+        raise stats
+    if isinstance(last_tick, BaseException):
+        last_tick = None
+    return runs, stats, last_tick
 
 
 @router.get("/workflows")
 async def workflows(request: Request):
     db = request.app.state.db
-    runs = await db.get_workflow_runs_with_steps(limit=20)
-
-    total = len(runs)
-    completed = sum(1 for r in runs if r["status"] == "completed")
-    rejected = sum(1 for r in runs if r.get("fail_category") == "rejected")
-    filtered = sum(1 for r in runs if r.get("fail_category") == "filtered")
-    errors = sum(1 for r in runs if r.get("fail_category") == "error")
-    durations = [r["duration_ms"] for r in runs if r["duration_ms"] is not None]
-    avg_duration = int(sum(durations) / len(durations)) if durations else 0
-
-    from datetime import date, datetime
-
-    today = date.today()
-    runs_today = sum(
-        1 for r in runs
-        if r.get("started_at") and (
-            r["started_at"].date() == today
-            if isinstance(r["started_at"], datetime)
-            else False
-        )
-    )
+    # Postgres builds the whole body; it is hashed and sent as-is
+    body = (await db.get_workflows_payload_json(limit=20)).encode()
+    return etag_body_response(request, body)
 
-    # Get last equity snapshot timestamp for position manager health
-    try:
-        last_tick = await db.pool.fetchval(
-            "SELECT MAX(timestamp) FROM equity_snapshots"
-        )
-    except Exception:
-        last_tick = None
 
-    serialized_runs = []
-    for r in runs:
-        sr = serialize_row(r)
-        sr["steps"] = [serialize_row(s) for s in r.get("steps", [])]
-        serialized_runs.append(sr)
-
-    return {
-        "runs": serialized_runs,
-        "stats": {
-            "total_runs": total,
-            "completed": completed,
-            "failed": rejected + filtered + errors,
-            "rejected": rejected,
-            "filtered": filtered,
-            "errors": errors,
-            "avg_duration_ms": avg_duration,
-            "runs_today": runs_today,
-        },
-        "last_equity_tick": last_tick.isoformat() if last_tick else None,
-    }
+@router.get("/workflows.ndjson")
+async def workflows_ndjson(request: Request):
+    """Same data as /workflows, streamed: a stats header line, then one run per line."""
+    db = request.app.state.db
+    runs, stats, last_tick = await _fetch_workflows(db)
+
+    def lines():
+        yield dumps({
+            "stats": stats,
+            "last_equity_tick": last_tick,
+        }) + b"\n"
+        for r in runs:
+            yield dumps(serialize_row(r)) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
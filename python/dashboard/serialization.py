@@ -2,28 +2,73 @@
 
 from __future__ import annotations
 
-import datetime
-import json
+import functools
+from collections.abc import Mapping
 from decimal import Decimal
+from typing import Any
 
+import orjson
+from fastapi.responses import JSONResponse
 
-def serialize_row(row: dict, *, parse_json: bool = False) -> dict:
-    """Convert a DB row dict to JSON-safe types."""
-    out = {}
-    for k, v in row.items():
-        if isinstance(v, Decimal):
-            out[k] = str(v)
-        elif isinstance(v, (datetime.datetime, datetime.date, datetime.time)):
-            out[k] = v.isoformat()
-        elif parse_json and isinstance(v, str):
-            try:
-                parsed = json.loads(v)
-                if isinstance(parsed, (dict, list)):
-                    out[k] = parsed
-                    continue
-            except (json.JSONDecodeError, TypeError):
-                pass
-            out[k] = v
-        else:
-            out[k] = v
+# JSONB columns on the tables the dashboard reads. The pool codec decodes them,
+# but older rows may hold JSON text stored as a string value, so only these are
+# worth probing with orjson.loads.
+JSON_COLUMNS = frozenset({
+    "input", "output", "result", "summary",
+    "catalyst", "scores", "supporting_evidence", "risks",
+    "exit_targets", "risk_verification", "greeks",
+    "sector_analysis", "performance_review", "top_ideas", "focus_tickers",
+})
+
+
+# Exact type -> converter; asyncpg returns these concrete types, never subclasses.
+# Dates and times pass through: orjson (and FastAPI's encoder) emit ISO 8601.
+_HANDLERS = {
+    Decimal: str,
+}
+
+
+def _orjson_default(v: Any) -> str:
+    if isinstance(v, Decimal):
+        return str(v)
+    raise TypeError(f"Type is not JSON serializable: {type(v).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """orjson-encode `content`, rendering Decimals as strings."""
+    return orjson.dumps(content, default=_orjson_default)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson; Decimals become strings."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _parse_json(v):
+    """Decode a JSON object/array string; anything else passes through."""
+    if isinstance(v, str) and v[:1] in ("{", "["):
+        try:
+            return orjson.loads(v)
+        except orjson.JSONDecodeError:
+            pass
+    return v
+
+
+@functools.lru_cache(maxsize=64)
+def _json_keys(keys: tuple[str, ...]) -> tuple[str, ...]:
+    """JSON_COLUMNS present in a row layout — rows of one query share a layout."""
+    return tuple(k for k in keys if k in JSON_COLUMNS)
+
+
+def serialize_row(row: Mapping[str, Any], *, parse_json: bool = False) -> dict:
+    """Convert a DB row (dict or asyncpg.Record) to a dict of JSON-safe types.
+
+    With `parse_json`, JSON_COLUMNS holding object/array text are decoded.
+    """
+    out = {k: v if (h := _HANDLERS.get(type(v))) is None else h(v) for k, v in row.items()}
+    if parse_json:
+        for k in _json_keys(tuple(row.keys())):
+            out[k] = _parse_json(out[k])
     return out
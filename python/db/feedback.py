@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
 
 import asyncpg
 
@@ -10,12 +14,103 @@ logger = logging.getLogger(__name__)
 
 MIN_CLOSED_POSITIONS = 5
 
+# Feedback is injected into every analyst/critic/risk/reviewer prompt, but
+# outcomes only change when positions close, so a few minutes of reuse is safe.
+FEEDBACK_TTL_SECS = 300.0
+
+_DIMENSIONS = [
+    ("Information Edge", "info"),
+    ("Catalyst Clarity", "catalyst"),
+    ("Volatility Pricing", "vol"),
+    ("Technical Alignment", "tech"),
+]
+
+# Every analyst feedback section in one round trip over closed theses. Rows are
+# tagged with `section`; `ord` orders rows within a section.
+#   bucket/direction/dims — one GROUPING SETS pass (dims is the grand total row)
+#   reason                — top 5 close reasons
+#   holding               — avg holding period for winners vs losers
+_ANALYST_FEEDBACK_SQL = """
+WITH closed AS (
+    SELECT
+        FLOOR(overall_score)::int AS score_bucket,
+        direction, scores, outcome_realized_pnl, outcome_close_reason
+    FROM theses
+    WHERE outcome_realized_pnl IS NOT NULL
+)
+SELECT
+    CASE
+        WHEN GROUPING(score_bucket) = 0 THEN 'bucket'
+        WHEN GROUPING(direction) = 0 THEN 'direction'
+        ELSE 'dims'
+    END AS section,
+    CASE WHEN GROUPING(score_bucket) = 0 THEN score_bucket::text ELSE direction END AS label,
+    score_bucket::bigint AS ord,
+    COUNT(*) AS total,
+    COUNT(*) FILTER (WHERE outcome_realized_pnl > 0) AS wins,
+    AVG(CASE WHEN outcome_realized_pnl > 0
+        THEN (scores->>'information_edge')::float END) AS win_info,
+    AVG(CASE WHEN outcome_realized_pnl <= 0
+        THEN (scores->>'information_edge')::float END) AS lose_info,
+    AVG(CASE WHEN outcome_realized_pnl > 0
+        THEN (scores->>'catalyst_clarity')::float END) AS win_catalyst,
+    AVG(CASE WHEN outcome_realized_pnl <= 0
+        THEN (scores->>'catalyst_clarity')::float END) AS lose_catalyst,
+    AVG(CASE WHEN outcome_realized_pnl > 0
+        THEN (scores->>'volatility_pricing')::float END) AS win_vol,
+    AVG(CASE WHEN outcome_realized_pnl <= 0
+        THEN (scores->>'volatility_pricing')::float END) AS lose_vol,
+    AVG(CASE WHEN outcome_realized_pnl > 0
+        THEN (scores->>'technical_alignment')::float END) AS win_tech,
+    AVG(CASE WHEN outcome_realized_pnl <= 0
+        THEN (scores->>'technical_alignment')::float END) AS lose_tech,
+    NULL::float AS win_days,
+    NULL::float AS lose_days
+FROM closed
+GROUP BY GROUPING SETS ((score_bucket), (direction), ())
+
+UNION ALL
+
+SELECT
+    'reason', outcome_close_reason, rn, cnt, NULL,
+    NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL
+FROM (
+    SELECT
+        outcome_close_reason,
+        COUNT(*) AS cnt,
+        ROW_NUMBER() OVER (ORDER BY COUNT(*) DESC) AS rn
+    FROM closed
+    WHERE outcome_close_reason IS NOT NULL
+    GROUP BY 1
+) reasons
+WHERE rn <= 5
+
+UNION ALL
+
+SELECT
+    'holding', NULL, NULL, NULL, NULL,
+    NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL,
+    AVG(CASE WHEN t.outcome_realized_pnl > 0
+        THEN EXTRACT(EPOCH FROM t.outcome_closed_at - p.opened_at) / 86400 END),
+    AVG(CASE WHEN t.outcome_realized_pnl <= 0
+        THEN EXTRACT(EPOCH FROM t.outcome_closed_at - p.opened_at) / 86400 END)
+FROM theses t
+JOIN trade_recommendations r ON r.thesis_id = t.id
+JOIN options_positions p ON p.recommendation_id = r.id
+WHERE t.outcome_realized_pnl IS NOT NULL
+
+ORDER BY section, ord NULLS LAST
+"""
+
 
 class FeedbackAggregator:
     """Extract cross-ticker patterns from historical outcomes for prompt injection."""
 
     def __init__(self, pool: asyncpg.Pool):
         self.pool = pool
+        # builder name -> (started_at, task); concurrent and back-to-back callers
+        # within FEEDBACK_TTL_SECS await one computation
+        self._feedback: dict[str, tuple[float, asyncio.Task[str]]] = {}
 
     async def _has_enough_data(self) -> bool:
         count = await self.pool.fetchval(
@@ -49,115 +144,85 @@ class FeedbackAggregator:
                 lines.append(f"  - Losers: {row['lose_days']:.1f} days")
             sections.append("\n".join(lines))
 
+    async def _cached(self, key: str, builder: Callable[[], Awaitable[str]]) -> str:
+        """Memoize `builder` for FEEDBACK_TTL_SECS. Failures are not cached."""
+        now = time.monotonic()
+        cached = self._feedback.get(key)
+        if cached is None or now - cached[0] > FEEDBACK_TTL_SECS:
+            cached = (now, asyncio.ensure_future(builder()))
+            self._feedback[key] = cached
+
+        try:
+            # shield: one cancelled caller must not cancel the shared computation
+            return await asyncio.shield(cached[1])
+        except Exception:
+            if self._feedback.get(key) is cached:
+                del self._feedback[key]
+            raise
+
     async def build_analyst_feedback(self) -> str:
         """Aggregate cross-ticker patterns for the analyst prompt."""
+        return await self._cached("analyst", self._build_analyst_feedback)
+
+    async def build_risk_feedback(self) -> str:
+        """Aggregate sizing and risk patterns for the risk checker prompt."""
+        return await self._cached("risk", self._build_risk_feedback)
+
+    async def build_reviewer_feedback(self) -> str:
+        """Aggregate review action patterns for the reviewer prompt."""
+        return await self._cached("reviewer", self._build_reviewer_feedback)
+
+    async def _build_analyst_feedback(self) -> str:
         if not await self._has_enough_data():
             return ""
 
+        by_section: dict[str, list] = defaultdict(list)
+        for row in await self.pool.fetch(_ANALYST_FEEDBACK_SQL):
+            by_section[row["section"]].append(row)
+
         sections = []
 
         # 1. Win rate by score bucket
-        rows = await self.pool.fetch(
-            """
-            SELECT
-                FLOOR(overall_score)::int AS score_bucket,
-                COUNT(*) AS total,
-                COUNT(*) FILTER (WHERE outcome_realized_pnl > 0) AS wins
-            FROM theses
-            WHERE outcome_realized_pnl IS NOT NULL
-            GROUP BY 1
-            ORDER BY 1
-            """
-        )
-        if rows:
+        if by_section["bucket"]:
             lines = ["**Win rate by score bucket:**"]
-            for r in rows:
-                bucket = r["score_bucket"]
+            for r in by_section["bucket"]:
                 total = r["total"]
                 wins = r["wins"]
                 rate = wins / total * 100 if total else 0
-                lines.append(f"  - Score {bucket}.x: {wins}/{total} ({rate:.0f}% win rate)")
+                lines.append(f"  - Score {r['label']}.x: {wins}/{total} ({rate:.0f}% win rate)")
             sections.append("\n".join(lines))
 
         # 2. Win rate by direction
-        rows = await self.pool.fetch(
-            """
-            SELECT
-                direction,
-                COUNT(*) AS total,
-                COUNT(*) FILTER (WHERE outcome_realized_pnl > 0) AS wins
-            FROM theses
-            WHERE outcome_realized_pnl IS NOT NULL
-            GROUP BY 1
-            """
-        )
-        if rows:
+        if by_section["direction"]:
             lines = ["**Win rate by direction:**"]
-            for r in rows:
+            for r in by_section["direction"]:
                 total = r["total"]
                 wins = r["wins"]
                 rate = wins / total * 100 if total else 0
-                lines.append(f"  - {r['direction']}: {wins}/{total} ({rate:.0f}%)")
+                lines.append(f"  - {r['label']}: {wins}/{total} ({rate:.0f}%)")
             sections.append("\n".join(lines))
 
         # 3. Score dimension accuracy (avg per dimension for winners vs losers)
-        row = await self.pool.fetchrow(
-            """
-            SELECT
-                AVG(CASE WHEN outcome_realized_pnl > 0
-                    THEN (scores->>'information_edge')::float END) AS win_info,
-                AVG(CASE WHEN outcome_realized_pnl <= 0
-                    THEN (scores->>'information_edge')::float END) AS lose_info,
-                AVG(CASE WHEN outcome_realized_pnl > 0
-                    THEN (scores->>'catalyst_clarity')::float END) AS win_catalyst,
-                AVG(CASE WHEN outcome_realized_pnl <= 0
-                    THEN (scores->>'catalyst_clarity')::float END) AS lose_catalyst,
-                AVG(CASE WHEN outcome_realized_pnl > 0
-                    THEN (scores->>'volatility_pricing')::float END) AS win_vol,
-                AVG(CASE WHEN outcome_realized_pnl <= 0
-                    THEN (scores->>'volatility_pricing')::float END) AS lose_vol,
-                AVG(CASE WHEN outcome_realized_pnl > 0
-                    THEN (scores->>'technical_alignment')::float END) AS win_tech,
-                AVG(CASE WHEN outcome_realized_pnl <= 0
-                    THEN (scores->>'technical_alignment')::float END) AS lose_tech
-            FROM theses
-            WHERE outcome_realized_pnl IS NOT NULL AND scores IS NOT NULL
-            """
-        )
-        if row and row["win_info"] is not None:
+        dims = by_section["dims"][0] if by_section["dims"] else None
+        if dims and dims["win_info"] is not None:
             lines = ["**Score dimensions — winners vs losers (avg):**"]
-            dims = [
-                ("Information Edge", row["win_info"], row["lose_info"]),
-                ("Catalyst Clarity", row["win_catalyst"], row["lose_catalyst"]),
-                ("Volatility Pricing", row["win_vol"], row["lose_vol"]),
-                ("Technical Alignment", row["win_tech"], row["lose_tech"]),
-            ]
-            for name, w, l in dims:
+            for name, key in _DIMENSIONS:
+                w, l = dims[f"win_{key}"], dims[f"lose_{key}"]
                 if w is not None and l is not None:
                     gap = w - l
                     lines.append(f"  - {name}: winners {w:.1f} vs losers {l:.1f} (gap: {gap:+.1f})")
             sections.append("\n".join(lines))
 
         # 4. Common loss reasons
-        rows = await self.pool.fetch(
-            """
-            SELECT outcome_close_reason, COUNT(*) AS cnt
-            FROM theses
-            WHERE outcome_realized_pnl IS NOT NULL
-              AND outcome_close_reason IS NOT NULL
-            GROUP BY 1
-            ORDER BY 2 DESC
-            LIMIT 5
-            """
-        )
-        if rows:
+        if by_section["reason"]:
             lines = ["**Common close reasons:**"]
-            for r in rows:
-                lines.append(f"  - {r['outcome_close_reason']}: {r['cnt']} trades")
+            for r in by_section["reason"]:
+                lines.append(f"  - {r['label']}: {r['total']} trades")
             sections.append("\n".join(lines))
 
         # 5. Holding period for winners vs losers
-        self._append_holding_period(sections, await self._holding_periods())
+        holding = by_section["holding"][0] if by_section["holding"] else None
+        self._append_holding_period(sections, holding)
 
         if not sections:
             return ""
@@ -165,42 +230,58 @@ class FeedbackAggregator:
         header = "## System Feedback (Cross-Ticker Patterns)\n\nBased on all historical trades:"
         return header + "\n\n" + "\n\n".join(sections)
 
-    async def build_risk_feedback(self) -> str:
-        """Aggregate sizing and risk patterns for the risk checker prompt."""
+    async def _build_risk_feedback(self) -> str:
         if not await self._has_enough_data():
             return ""
 
+        sizes, losses, holding = await asyncio.gather(
+            # 1. P&L by position size bucket
+            self.pool.fetch(
+                """
+                SELECT
+                    CASE
+                        WHEN rv.position_size_pct <= 0.5 THEN '0-0.5%'
+                        WHEN rv.position_size_pct <= 1.0 THEN '0.5-1%'
+                        WHEN rv.position_size_pct <= 1.5 THEN '1-1.5%'
+                        ELSE '1.5%+'
+                    END AS size_bucket,
+                    COUNT(*) AS total,
+                    AVG(t.outcome_realized_pnl) AS avg_pnl,
+                    COUNT(*) FILTER (WHERE t.outcome_realized_pnl > 0) AS wins
+                FROM theses t
+                JOIN trade_recommendations r ON r.thesis_id = t.id
+                CROSS JOIN LATERAL (
+                    SELECT COALESCE(
+                        (r.risk_verification->>'position_size_pct')::float, 0
+                    ) AS position_size_pct
+                ) rv
+                WHERE t.outcome_realized_pnl IS NOT NULL
+                  AND r.risk_verification->>'position_size_pct' IS NOT NULL
+                GROUP BY 1
+                ORDER BY 1
+                """
+            ),
+            # 2. Common loss reasons (same query, different framing)
+            self.pool.fetch(
+                """
+                SELECT outcome_close_reason, COUNT(*) AS cnt
+                FROM theses
+                WHERE outcome_realized_pnl <= 0
+                  AND outcome_close_reason IS NOT NULL
+                GROUP BY 1
+                ORDER BY 2 DESC
+                LIMIT 5
+                """
+            ),
+            # 3. Holding period
+            self._holding_periods(),
+        )
+
         sections = []
 
-        # 1. P&L by position size bucket
-        rows = await self.pool.fetch(
-            """
-            SELECT
-                CASE
-                    WHEN rv.position_size_pct <= 0.5 THEN '0-0.5%'
-                    WHEN rv.position_size_pct <= 1.0 THEN '0.5-1%'
-                    WHEN rv.position_size_pct <= 1.5 THEN '1-1.5%'
-                    ELSE '1.5%+'
-                END AS size_bucket,
-                COUNT(*) AS total,
-                AVG(t.outcome_realized_pnl) AS avg_pnl,
-                COUNT(*) FILTER (WHERE t.outcome_realized_pnl > 0) AS wins
-            FROM theses t
-            JOIN trade_recommendations r ON r.thesis_id = t.id
-            CROSS JOIN LATERAL (
-                SELECT COALESCE(
-                    (r.risk_verification->>'position_size_pct')::float, 0
-                ) AS position_size_pct
-            ) rv
-            WHERE t.outcome_realized_pnl IS NOT NULL
-              AND r.risk_verification->>'position_size_pct' IS NOT NULL
-            GROUP BY 1
-            ORDER BY 1
-            """
-        )
-        if rows:
+        if sizes:
             lines = ["**P&L by position size:**"]
-            for r in rows:
+            for r in sizes:
                 total = r["total"]
                 wins = r["wins"]
                 avg = r["avg_pnl"]
@@ -211,26 +292,13 @@ class FeedbackAggregator:
                 )
             sections.append("\n".join(lines))
 
-        # 2. Common loss reasons (same query, different framing)
-        rows = await self.pool.fetch(
-            """
-            SELECT outcome_close_reason, COUNT(*) AS cnt
-            FROM theses
-            WHERE outcome_realized_pnl <= 0
-              AND outcome_close_reason IS NOT NULL
-            GROUP BY 1
-            ORDER BY 2 DESC
-            LIMIT 5
-            """
-        )
-        if rows:
+        if losses:
             lines = ["**Most common loss reasons:**"]
-            for r in rows:
+            for r in losses:
                 lines.append(f"  - {r['outcome_close_reason']}: {r['cnt']} losing trades")
             sections.append("\n".join(lines))
 
-        # 3. Holding period
-        self._append_holding_period(sections, await self._holding_periods())
+        self._append_holding_period(sections, holding)
 
         if not sections:
             return ""
@@ -238,50 +306,52 @@ class FeedbackAggregator:
         header = "## Historical Risk Patterns\n\nBased on all closed positions:"
         return header + "\n\n" + "\n\n".join(sections)
 
-    async def build_reviewer_feedback(self) -> str:
-        """Aggregate review action patterns for the reviewer prompt."""
+    async def _build_reviewer_feedback(self) -> str:
         if not await self._has_enough_data():
             return ""
 
+        actions, action_pnl = await asyncio.gather(
+            # 1. Recent review action distribution (last 30 days)
+            self.pool.fetch(
+                """
+                SELECT
+                    recommended_action,
+                    COUNT(*) AS cnt
+                FROM position_reviews
+                WHERE created_at > NOW() - INTERVAL '30 days'
+                GROUP BY 1
+                ORDER BY 2 DESC
+                """
+            ),
+            # 2. Avg P&L by recommended action (for closed positions)
+            self.pool.fetch(
+                """
+                SELECT
+                    pr.recommended_action,
+                    COUNT(DISTINCT p.id) AS positions,
+                    AVG(p.realized_pnl) AS avg_pnl
+                FROM position_reviews pr
+                JOIN options_positions p ON p.id = pr.position_id
+                WHERE p.status = 'closed' AND p.realized_pnl IS NOT NULL
+                GROUP BY 1
+                ORDER BY 3 DESC
+                """
+            ),
+        )
+
         sections = []
 
-        # 1. Recent review action distribution (last 30 days)
-        rows = await self.pool.fetch(
-            """
-            SELECT
-                recommended_action,
-                COUNT(*) AS cnt
-            FROM position_reviews
-            WHERE created_at > NOW() - INTERVAL '30 days'
-            GROUP BY 1
-            ORDER BY 2 DESC
-            """
-        )
-        if rows:
-            total = sum(r["cnt"] for r in rows)
+        if actions:
+            total = sum(r["cnt"] for r in actions)
             lines = ["**Review action distribution (last 30 days):**"]
-            for r in rows:
+            for r in actions:
                 pct = r["cnt"] / total * 100 if total else 0
                 lines.append(f"  - {r['recommended_action']}: {r['cnt']} ({pct:.0f}%)")
             sections.append("\n".join(lines))
 
-        # 2. Avg P&L by recommended action (for closed positions)
-        rows = await self.pool.fetch(
-            """
-            SELECT
-                pr.recommended_action,
-                COUNT(DISTINCT p.id) AS positions,
-                AVG(p.realized_pnl) AS avg_pnl
-            FROM position_reviews pr
-            JOIN options_positions p ON p.id = pr.position_id
-            WHERE p.status = 'closed' AND p.realized_pnl IS NOT NULL
-            GROUP BY 1
-            ORDER BY 3 DESC
-            """
-        )
-        if rows:
+        if action_pnl:
             lines = ["**Avg P&L by last recommended action (closed positions):**"]
-            for r in rows:
+            for r in action_pnl:
                 avg = r["avg_pnl"]
                 if avg is not None:
                     lines.append(
@@ -6,28 +6,32 @@ engine doesn't know the difference.
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
+from collections import deque
 from datetime import datetime, timezone
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Step logs are only kept for inspection; cap them so long runs don't grow unbounded
+MAX_STEP_LOGS = 10_000
+
 
 class MemoryDatabase:
     """In-memory store that satisfies the Database interface."""
 
     def __init__(self):
-        self._run_counter = 0
-        self._step_counter = 0
+        self._run_ids = itertools.count(1)
+        self._step_ids = itertools.count(1)
         self.workflow_runs: dict[int, dict] = {}
-        self.step_logs: list[dict] = []
+        self.step_logs: deque[dict] = deque(maxlen=MAX_STEP_LOGS)
 
     async def create_workflow_run(
         self, workflow_id: str, trigger: str, input_data: dict
     ) -> int:
-        self._run_counter += 1
-        run_id = self._run_counter
+        run_id = next(self._run_ids)
         self.workflow_runs[run_id] = {
             "id": run_id,
             "workflow_id": workflow_id,
@@ -35,7 +39,7 @@ class MemoryDatabase:
             "input": input_data,
             "status": "running",
             "result": None,
-            "started_at": datetime.now(timezone.utc).isoformat(),
+            "started_at": datetime.now(timezone.utc),
             "completed_at": None,
         }
         logger.debug("Created workflow run %d for %s", run_id, workflow_id)
@@ -44,10 +48,11 @@ class MemoryDatabase:
     async def complete_workflow_run(
         self, run_id: int, status: str = "completed", result: dict | None = None
     ):
-        if run_id in self.workflow_runs:
-            self.workflow_runs[run_id]["status"] = status
-            self.workflow_runs[run_id]["result"] = result
-            self.workflow_runs[run_id]["completed_at"] = datetime.now(timezone.utc).isoformat()
+        run = self.workflow_runs.get(run_id)
+        if run is not None:
+            run["status"] = status
+            run["result"] = result
+            run["completed_at"] = datetime.now(timezone.utc)
         logger.debug("Completed workflow run %d: %s", run_id, status)
 
     async def log_step(
@@ -61,9 +66,8 @@ class MemoryDatabase:
         passed_gate: bool,
         duration_ms: int,
     ):
-        self._step_counter += 1
         entry = {
-            "id": self._step_counter,
+            "id": next(self._step_ids),
             "run_id": run_id,
             "step_id": step_id,
             "agent": agent,
@@ -86,7 +90,7 @@ class MemoryDatabase:
         return 0
 
     async def get_thesis_history_with_outcomes(
-        self, ticker: str, limit: int = 5
+        self, ticker: str, limit: int = 5, before: datetime | None = None
     ) -> list[dict]:
         return []
 
@@ -2,11 +2,225 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import logging
 import os
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime
 from decimal import Decimal
 
 import asyncpg
+import orjson
+
+from db.feedback import FeedbackAggregator
+
+logger = logging.getLogger(__name__)
+
+# /status may be polled every second from several dashboard tabs
+PING_TTL_SECS = 1.0
+
+# In-process read cache: the watchlist changes rarely and is re-read by every
+# scheduled job
+WATCHLIST_TTL_SECS = 30.0
+
+# Pool defaults for Database.connect; explicit create_pool kwargs win. asyncpg's
+# own min_size=10 opens ten connections up front, which the short-lived pools
+# (CLI commands, Discord button handlers) never use. Sizes can be tuned per
+# deployment with DB_POOL_MIN_SIZE / DB_POOL_MAX_SIZE.
+POOL_MIN_SIZE = 2
+POOL_MAX_SIZE = 10
+COMMAND_TIMEOUT_SECS = 30.0
+_SERVER_SETTINGS = {"jit": "off", "application_name": "openclaw"}
+
+# asyncpg prepares every query once per connection and keeps it in an LRU cache.
+# Size it well above the number of distinct statements in this module and never
+# expire entries, so position-manager queries that run every few minutes don't
+# get re-parsed and re-planned after sitting idle.
+STATEMENT_CACHE_SIZE = 1024
+
+# log_step rows are buffered and written in batches: a batch is flushed once it
+# holds STEP_LOG_BATCH rows or STEP_LOG_FLUSH_SECS after its first row arrived.
+STEP_LOG_BATCH = 200
+STEP_LOG_FLUSH_SECS = 0.05
+# A failed batch is retried this many times, backing off from
+# STEP_LOG_RETRY_SECS (doubling); after that the error is raised from
+# complete_workflow_run() for each run that lost rows
+STEP_LOG_RETRIES = 3
+STEP_LOG_RETRY_SECS = 0.5
+
+# NOTIFY channel carrying the id of each newly approved recommendation, so the
+# position manager can act on approvals made from any process
+RECOMMENDATION_APPROVED_CHANNEL = "recommendation_approved"
+
+_INSERT_STEP_LOG = """
+    INSERT INTO workflow_step_logs
+        (run_id, step_id, agent, attempt, input, output, passed_gate, duration_ms)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+"""
+
+# The `limit` most recent workflow runs, one row per run: steps aggregated as a
+# JSON array and failed runs classified as "rejected" (risk block), "filtered"
+# (low score) or "error". Shared by the /workflows queries; $1 is the limit.
+_RECENT_RUNS_CTE = """
+WITH recent AS (
+    SELECT
+        r.id, r.workflow_id, r.trigger, r.status,
+        r.started_at, r.completed_at,
+        FLOOR(EXTRACT(EPOCH FROM r.completed_at - r.started_at) * 1000)::bigint
+            AS duration_ms,
+        COALESCE(st.steps, '[]') AS steps,
+        CASE
+            WHEN r.status <> 'failed' THEN NULL
+            WHEN st.risk_failed THEN 'rejected'
+            WHEN st.gate_failed THEN 'filtered'
+            ELSE 'error'
+        END AS fail_category
+    FROM (
+        SELECT id, workflow_id, trigger, status, started_at, completed_at
+        FROM workflow_runs
+        ORDER BY started_at DESC
+        LIMIT $1
+    ) r
+    LEFT JOIN LATERAL (
+        SELECT
+            json_agg(json_build_object(
+                'step_id', s.step_id,
+                'agent', s.agent,
+                'passed_gate', s.passed_gate,
+                'duration_ms', s.duration_ms,
+                'attempt', s.attempt,
+                'failure_reason', CASE
+                    WHEN s.passed_gate = FALSE AND s.agent = 'risk_checker'
+                    THEN s.output->>'rejection_reason'
+                END
+            ) ORDER BY s.id) AS steps,
+            bool_or(s.passed_gate IS NOT TRUE AND s.agent = 'risk_checker') AS risk_failed,
+            bool_or(s.passed_gate IS NOT TRUE AND s.step_id IN ('evaluate', 'critique'))
+                AS gate_failed
+        FROM workflow_step_logs s
+        WHERE s.run_id = r.id
+    ) st ON TRUE
+)
+"""
+
+_WORKFLOW_STATS_SELECT = """
+json_build_object(
+    'total_runs', COUNT(*),
+    'completed', COUNT(*) FILTER (WHERE status = 'completed'),
+    'failed', COUNT(*) FILTER (WHERE fail_category IS NOT NULL),
+    'rejected', COUNT(*) FILTER (WHERE fail_category = 'rejected'),
+    'filtered', COUNT(*) FILTER (WHERE fail_category = 'filtered'),
+    'errors', COUNT(*) FILTER (WHERE fail_category = 'error'),
+    'avg_duration_ms', COALESCE(TRUNC(AVG(duration_ms)), 0)::int,
+    'runs_today', COUNT(*) FILTER (WHERE started_at::date = CURRENT_DATE)
+)
+"""
+
+
+# Columns for recommendation listings. Leaves out the risk_verification JSONB
+# (the risk checker's full sizing audit): lists never show it, and it is the bulk
+# of each row. get_recommendation still returns the whole row.
+_RECOMMENDATION_LIST_COLUMNS = """
+    id, thesis_id, run_id, ticker, "right", strike, expiry, strategy,
+    entry_price_low, entry_price_high, position_size_pct, position_size_usd,
+    exit_targets, stop_loss, max_hold_days, status, reviewed_by, approved_at,
+    rejected_reason, created_at
+"""
+
+
+_INSERT_THESIS = """
+    INSERT INTO theses
+        (run_id, ticker, direction, thesis_text, catalyst, scores,
+         supporting_evidence, risks, overall_score,
+         analyst_reasoning, critic_reasoning)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+"""
+
+
+def _insert_recommendation_sql(thesis_id: str, first: int) -> str:
+    """INSERT for trade_recommendations; `thesis_id` is a SQL expression and the
+    remaining 13 values are placeholders numbered from `first` (run_id first)."""
+    values = ", ".join(f"${n}" for n in range(first, first + 13))
+    return f"""
+    INSERT INTO trade_recommendations
+        (thesis_id, run_id, ticker, "right", strike, expiry,
+         entry_price_low, entry_price_high, position_size_pct,
+         position_size_usd, exit_targets, stop_loss, max_hold_days,
+         risk_verification, status)
+    VALUES ({thesis_id}, {values}, 'pending_review')
+    """
+
+
+def _thesis_args(run_id: int, thesis: dict) -> tuple:
+    """Parameters for _INSERT_THESIS, in placeholder order."""
+    return (
+        run_id,
+        thesis["ticker"],
+        thesis["direction"],
+        thesis["thesis_text"],
+        thesis.get("catalyst"),
+        thesis["scores"],
+        thesis.get("supporting_evidence", []),
+        thesis.get("risks", []),
+        thesis["scores"]["overall"],
+        thesis.get("analyst_reasoning"),
+        thesis.get("critic_reasoning"),
+    )
+
+
+def _recommendation_args(run_id: int, rec: dict) -> tuple:
+    """Parameters for _insert_recommendation_sql, in placeholder order."""
+    contract = rec["contract"]
+    expiry = contract["expiry"]
+    if isinstance(expiry, str):
+        expiry = date.fromisoformat(expiry)
+    return (
+        run_id,
+        contract["ticker"],
+        contract["right"],
+        float(contract["strike"]),
+        expiry,
+        float(contract["entry_price_low"]),
+        float(contract["entry_price_high"]),
+        float(rec["position_size_pct"]),
+        float(rec["position_size_usd"]),
+        rec.get("exit_targets", []),
+        rec.get("stop_loss", ""),
+        rec.get("max_hold_days", 30),
+        rec.get("risk_verification"),
+    )
+
+
+def _dumps(obj) -> bytes:
+    """Encode a JSON/JSONB value. Types orjson doesn't know fall back to str()."""
+    return orjson.dumps(
+        obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+# Binary wire format: json is the UTF-8 text itself, jsonb prefixes a version byte.
+# Either way orjson's bytes go straight to the socket with no str round-trip.
+_JSONB_VERSION = b"\x01"
+
+
+def _encode_jsonb(obj) -> bytes:
+    return _JSONB_VERSION + _dumps(obj)
+
+
+def _decode_jsonb(data: bytes):
+    return orjson.loads(memoryview(data)[1:])
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Pool-wide json/jsonb codecs: pass Python objects in, get them back decoded."""
+    await conn.set_type_codec(
+        "json", encoder=_dumps, decoder=orjson.loads, schema="pg_catalog", format="binary"
+    )
+    await conn.set_type_codec(
+        "jsonb", encoder=_encode_jsonb, decoder=_decode_jsonb, schema="pg_catalog",
+        format="binary",
+    )
 
 
 class Database:
@@ -14,15 +228,110 @@ class Database:
 
     def __init__(self, pool: asyncpg.Pool):
         self.pool = pool
+        # (checked_at, ok) for ping(); the lock keeps concurrent pollers to one query
+        self._ping: tuple[float, bool] = (float("-inf"), False)
+        self._ping_lock = asyncio.Lock()
+        self._step_logs: asyncio.Queue[tuple] = asyncio.Queue()
+        self._step_log_writer: asyncio.Task | None = None
+        # The batch the writer holds, and a future resolved once it is written
+        # (or dropped)
+        self._step_log_batch: tuple[list[tuple], asyncio.Future[None]] | None = None
+        # run_id -> error that dropped some of its rows
+        self._step_log_errors: dict[int, Exception] = {}
+        # (fetched_at, rows) for get_watchlist
+        self._watchlist: tuple[float, list[asyncpg.Record]] | None = None
+        self._feedback: FeedbackAggregator | None = None
 
     @classmethod
-    async def connect(cls, dsn: str | None = None) -> Database:
+    async def connect(cls, dsn: str | None = None, **pool_kwargs) -> Database:
+        """Open a pool; `pool_kwargs` go to asyncpg.create_pool (server_settings, sizes...).
+
+        Unset sizes and timeouts fall back to the POOL_* / COMMAND_TIMEOUT_SECS
+        defaults, and `server_settings` is layered over _SERVER_SETTINGS.
+
+        json/jsonb columns are encoded and decoded by the pool, so JSON parameters
+        are passed as plain dicts/lists and come back as such.
+        """
         dsn = dsn or os.environ.get("DATABASE_URL", "postgres://localhost/algo_trade")
-        pool = await asyncpg.create_pool(dsn)
+        pool_kwargs.setdefault(
+            "min_size", int(os.environ.get("DB_POOL_MIN_SIZE", POOL_MIN_SIZE))
+        )
+        pool_kwargs.setdefault(
+            "max_size", int(os.environ.get("DB_POOL_MAX_SIZE", POOL_MAX_SIZE))
+        )
+        pool_kwargs.setdefault("command_timeout", COMMAND_TIMEOUT_SECS)
+        pool_kwargs["server_settings"] = {
+            **_SERVER_SETTINGS, **(pool_kwargs.get("server_settings") or {})
+        }
+        pool_kwargs.setdefault("statement_cache_size", STATEMENT_CACHE_SIZE)
+        pool_kwargs.setdefault("max_cached_statement_lifetime", 0)
+        user_init = pool_kwargs.pop("init", None)
+
+        async def init(conn: asyncpg.Connection) -> None:
+            await _init_connection(conn)
+            if user_init is not None:
+                await user_init(conn)
+
+        pool = await asyncpg.create_pool(dsn, init=init, **pool_kwargs)
         return cls(pool)
 
     async def close(self):
-        await self.pool.close()
+        try:
+            await self.flush_step_logs()
+        finally:
+            if self._step_log_writer is not None:
+                self._step_log_writer.cancel()
+            await self.pool.close()
+
+    @property
+    def feedback(self) -> FeedbackAggregator:
+        """Cross-ticker feedback over this pool; its caches live as long as the Database."""
+        if self._feedback is None:
+            self._feedback = FeedbackAggregator(self.pool)
+        return self._feedback
+
+    async def listen(self, channel: str, callback) -> Callable[[], Awaitable[None]]:
+        """Call `callback(payload)` for each NOTIFY on `channel`; returns an unlisten coroutine.
+
+        Holds one pool connection until unlisten is awaited.
+        """
+        conn = await self.pool.acquire()
+
+        def _on_notify(_conn, _pid, _channel, payload: str) -> None:
+            callback(payload)
+
+        try:
+            await conn.add_listener(channel, _on_notify)
+        except BaseException:
+            await self.pool.release(conn)
+            raise
+
+        async def unlisten() -> None:
+            try:
+                await conn.remove_listener(channel, _on_notify)
+            finally:
+                await self.pool.release(conn)
+
+        return unlisten
+
+    async def listen_for_approvals(self, callback) -> Callable[[], Awaitable[None]]:
+        """`listen` on RECOMMENDATION_APPROVED_CHANNEL; the payload is the rec id."""
+        return await self.listen(RECOMMENDATION_APPROVED_CHANNEL, callback)
+
+    async def ping(self) -> bool:
+        """Whether the DB answers `SELECT 1`, cached for PING_TTL_SECS."""
+        if time.monotonic() - self._ping[0] < PING_TTL_SECS:
+            return self._ping[1]
+        async with self._ping_lock:
+            if time.monotonic() - self._ping[0] < PING_TTL_SECS:
+                return self._ping[1]
+            try:
+                await self.pool.fetchval("SELECT 1")
+                ok = True
+            except Exception:
+                ok = False
+            self._ping = (time.monotonic(), ok)
+            return ok
 
     # --- Workflow tracking ---
 
@@ -37,22 +346,48 @@ class Database:
             """,
             workflow_id,
             trigger,
-            json.dumps(input_data, default=str),
+            input_data,
         )
 
     async def complete_workflow_run(
         self, run_id: int, status: str = "completed", result: dict | None = None
     ):
-        await self.pool.execute(
-            """
-            UPDATE workflow_runs
-            SET status = $2, result = $3, completed_at = NOW()
-            WHERE id = $1
-            """,
-            run_id,
-            status,
-            json.dumps(result, default=str) if result else None,
-        )
+        """Mark a run finished, writing its still-queued step logs in the same transaction.
+
+        The run is marked finished even if some of its earlier step logs were
+        dropped after their retries; that error is raised afterwards.
+        """
+        # Take this run's queued rows (typically its last step) before awaiting,
+        # so the background writer can't pick them up; other runs' rows go back
+        # in their original order
+        rows, others = [], []
+        while not self._step_logs.empty():
+            row = self._step_logs.get_nowait()
+            self._step_logs.task_done()
+            (rows if row[0] == run_id else others).append(row)
+        for row in others:
+            self._step_logs.put_nowait(row)
+        # A finished run is read back with its steps: if the writer already
+        # holds some of them, let that batch land first so step ids stay in order
+        held = self._step_log_batch
+        if held is not None and any(row[0] == run_id for row in held[0]):
+            await asyncio.shield(held[1])
+        async with self.pool.acquire() as conn, conn.transaction():
+            if rows:
+                await conn.executemany(_INSERT_STEP_LOG, rows)
+            await conn.execute(
+                """
+                UPDATE workflow_runs
+                SET status = $2, result = $3, completed_at = NOW()
+                WHERE id = $1
+                """,
+                run_id,
+                status,
+                result or None,
+            )
+        error = self._step_log_errors.pop(run_id, None)
+        if error is not None:
+            raise error
 
     async def log_step(
         self,
@@ -65,39 +400,116 @@ class Database:
         passed_gate: bool,
         duration_ms: int,
     ):
-        await self.pool.execute(
-            """
-            INSERT INTO workflow_step_logs
-                (run_id, step_id, agent, attempt, input, output, passed_gate, duration_ms)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-            """,
-            run_id,
-            step_id,
-            agent,
-            attempt,
-            json.dumps(input_data, default=str),
-            json.dumps(output_data, default=str) if output_data else None,
-            passed_gate,
-            duration_ms,
+        """Queue a step log row; a background writer inserts queued rows in batches."""
+        self._step_logs.put_nowait(
+            (run_id, step_id, agent, attempt, input_data, output_data or None,
+             passed_gate, duration_ms)
         )
+        if self._step_log_writer is None or self._step_log_writer.done():
+            self._step_log_writer = asyncio.create_task(self._write_step_logs())
+
+    async def flush_step_logs(self):
+        """Wait until every queued step log row has been written.
+
+        Raises a write error if any batch was dropped after its retries and the
+        runs it belonged to were not completed since.
+        """
+        await self._step_logs.join()
+        if self._step_log_errors:
+            errors = list(self._step_log_errors.values())
+            self._step_log_errors.clear()
+            raise errors[0]
+
+    async def _write_step_logs(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._step_logs.get()]
+            done = loop.create_future()
+            self._step_log_batch = (batch, done)
+            try:
+                deadline = loop.time() + STEP_LOG_FLUSH_SECS
+                while len(batch) < STEP_LOG_BATCH:
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self._step_logs.get(), deadline - loop.time())
+                        )
+                    except TimeoutError:
+                        break
+                try:
+                    await self._insert_step_logs(batch)
+                except Exception as e:
+                    logger.exception("Dropped %d workflow step logs", len(batch))
+                    for row in batch:
+                        self._step_log_errors[row[0]] = e
+            finally:
+                self._step_log_batch = None
+                done.set_result(None)
+                for _ in batch:
+                    self._step_logs.task_done()
+
+    async def _insert_step_logs(self, batch: list[tuple]) -> None:
+        delay = STEP_LOG_RETRY_SECS
+        for attempt in range(STEP_LOG_RETRIES):
+            try:
+                await self.pool.executemany(_INSERT_STEP_LOG, batch)
+                return
+            except Exception as e:
+                logger.warning(
+                    "Writing %d workflow step logs failed (attempt %d): %s",
+                    len(batch), attempt + 1, e,
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+        await self.pool.executemany(_INSERT_STEP_LOG, batch)
 
     # --- Watchlist ---
 
-    async def get_watchlist(self) -> list[dict]:
-        rows = await self.pool.fetch("SELECT * FROM options_watchlist ORDER BY ticker")
-        return [dict(r) for r in rows]
+    async def get_watchlist(self) -> list[asyncpg.Record]:
+        """Watchlist rows by ticker, cached for WATCHLIST_TTL_SECS."""
+        if self._watchlist and time.monotonic() - self._watchlist[0] < WATCHLIST_TTL_SECS:
+            return list(self._watchlist[1])
+        watchlist = await self.pool.fetch(
+            "SELECT ticker, sector, notes FROM options_watchlist ORDER BY ticker"
+        )
+        self._watchlist = (time.monotonic(), watchlist)
+        return list(watchlist)
+
+    async def get_watchlist_json(self) -> tuple[int, str]:
+        """(count, JSON array text) of the watchlist, encoded by Postgres."""
+        row = await self.pool.fetchrow(
+            """
+            SELECT COUNT(*) AS count, COALESCE(json_agg(w ORDER BY w.ticker), '[]')::text AS rows
+            FROM (
+                SELECT ticker, sector, iso_utc(added_at) AS added_at, notes,
+                    iso_utc(updated_at) AS updated_at
+                FROM options_watchlist
+            ) w
+            """
+        )
+        return row["count"], row["rows"]
+
+    async def get_watchlist_last_modified(self) -> datetime | None:
+        """Last write of any kind to the watchlist, stamped by a trigger (V023)."""
+        return await self.pool.fetchval(
+            "SELECT modified_at FROM table_modified_at WHERE table_name = 'options_watchlist'"
+        )
 
     async def add_to_watchlist(self, ticker: str, sector: str, notes: str | None = None):
+        """Add or update a ticker; re-adding it unchanged writes nothing."""
         await self.pool.execute(
             """
             INSERT INTO options_watchlist (ticker, sector, notes)
             VALUES ($1, $2, $3)
-            ON CONFLICT (ticker) DO UPDATE SET sector = $2, notes = $3
+            ON CONFLICT (ticker) DO UPDATE
+            SET sector = EXCLUDED.sector, notes = EXCLUDED.notes
+            WHERE (options_watchlist.sector, options_watchlist.notes)
+                IS DISTINCT FROM (EXCLUDED.sector, EXCLUDED.notes)
             """,
             ticker.upper(),
             sector,
             notes,
         )
+        self._watchlist = None
 
     # --- Research summaries ---
 
@@ -114,7 +526,7 @@ class Database:
             run_id,
             ticker.upper(),
             mode,
-            json.dumps(summary, default=str),
+            summary,
             opportunity_score,
         )
 
@@ -122,73 +534,65 @@ class Database:
 
     async def save_thesis(self, run_id: int, thesis: dict) -> int:
         return await self.pool.fetchval(
-            """
-            INSERT INTO theses
-                (run_id, ticker, direction, thesis_text, catalyst, scores,
-                 supporting_evidence, risks, overall_score,
-                 analyst_reasoning, critic_reasoning)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-            RETURNING id
-            """,
-            run_id,
-            thesis["ticker"],
-            thesis["direction"],
-            thesis["thesis_text"],
-            json.dumps(thesis.get("catalyst"), default=str),
-            json.dumps(thesis["scores"], default=str),
-            json.dumps(thesis.get("supporting_evidence", []), default=str),
-            json.dumps(thesis.get("risks", []), default=str),
-            thesis["scores"]["overall"],
-            thesis.get("analyst_reasoning"),
-            thesis.get("critic_reasoning"),
+            _INSERT_THESIS + "RETURNING id", *_thesis_args(run_id, thesis)
         )
 
     # --- Recommendations ---
 
     async def save_recommendation(self, thesis_id: int, run_id: int, rec: dict) -> int:
-        import datetime as _dt
-
-        contract = rec["contract"]
-        expiry = contract["expiry"]
-        if isinstance(expiry, str):
-            expiry = _dt.date.fromisoformat(expiry)
         return await self.pool.fetchval(
-            """
-            INSERT INTO trade_recommendations
-                (thesis_id, run_id, ticker, "right", strike, expiry,
-                 entry_price_low, entry_price_high, position_size_pct,
-                 position_size_usd, exit_targets, stop_loss, max_hold_days,
-                 risk_verification, status)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, 'pending_review')
-            RETURNING id
-            """,
+            _insert_recommendation_sql("$1", first=2) + "RETURNING id",
             thesis_id,
-            run_id,
-            contract["ticker"],
-            contract["right"],
-            float(contract["strike"]),
-            expiry,
-            float(contract["entry_price_low"]),
-            float(contract["entry_price_high"]),
-            float(rec["position_size_pct"]),
-            float(rec["position_size_usd"]),
-            json.dumps(rec.get("exit_targets", []), default=str),
-            rec.get("stop_loss", ""),
-            rec.get("max_hold_days", 30),
-            json.dumps(rec.get("risk_verification"), default=str),
+            *_recommendation_args(run_id, rec),
+        )
+
+    async def save_thesis_with_recommendation(
+        self, run_id: int, thesis: dict, rec: dict
+    ) -> tuple[int, int]:
+        """Insert a thesis and its recommendation in one statement.
+
+        One round trip instead of two, and the pair lands atomically, so a failed
+        recommendation no longer leaves an orphaned thesis. Returns (thesis_id, rec_id).
+        """
+        row = await self.pool.fetchrow(
+            f"""
+            WITH t AS ({_INSERT_THESIS} RETURNING id),
+            r AS (
+                {_insert_recommendation_sql("(SELECT id FROM t)", first=12)}
+                RETURNING id
+            )
+            SELECT (SELECT id FROM t) AS thesis_id, (SELECT id FROM r) AS rec_id
+            """,
+            *_thesis_args(run_id, thesis),
+            *_recommendation_args(run_id, rec),
         )
+        return row["thesis_id"], row["rec_id"]
 
     # --- Positions ---
 
-    async def get_open_positions(self) -> list[dict]:
-        rows = await self.pool.fetch(
+    async def get_open_positions(self) -> list[asyncpg.Record]:
+        return await self.pool.fetch(
             """
             SELECT * FROM options_positions
             WHERE status = 'open'
             ORDER BY opened_at ASC
             """
         )
-        return [dict(r) for r in rows]
+
+    async def get_open_positions_with_exposure(self) -> tuple[list[dict], Decimal]:
+        """Open positions (as get_open_positions) and their total cost basis, in one scan."""
+        rows = await self.pool.fetch(
+            """
+            SELECT *, COALESCE(SUM(cost_basis) OVER (), 0) AS _total_exposure
+            FROM options_positions
+            WHERE status = 'open'
+            ORDER BY opened_at ASC
+            """
+        )
+        # The window total repeats on every row
+        total = rows[0]["_total_exposure"] if rows else Decimal("0")
+        positions = [{k: v for k, v in r.items() if k != "_total_exposure"} for r in rows]
+        return positions, total
 
     async def insert_position(self, position: dict) -> int:
         return await self.pool.fetchval(
@@ -227,6 +631,25 @@ class Database:
             unrealized_pnl,
         )
 
+    async def update_position_prices(self, rows: list[tuple]) -> None:
+        """Mark several positions to market in one statement.
+
+        Each row is (position_id, current_price, unrealized_pnl).
+        """
+        if not rows:
+            return
+        await self.pool.execute(
+            """
+            UPDATE options_positions p
+            SET current_price = u.current_price, unrealized_pnl = u.unrealized_pnl,
+                updated_at = NOW()
+            FROM UNNEST($1::bigint[], $2::numeric[], $3::numeric[])
+                AS u(id, current_price, unrealized_pnl)
+            WHERE p.id = u.id
+            """,
+            *(list(col) for col in zip(*rows, strict=True)),
+        )
+
     async def partial_close_position(
         self, position_id: int, new_quantity: int, realized_pnl: Decimal
     ):
@@ -242,23 +665,77 @@ class Database:
             realized_pnl,
         )
 
-    async def close_position(self, position_id: int, reason: str, realized_pnl: Decimal):
-        await self.pool.execute(
+    async def close_position(
+        self, position_id: int, reason: str, realized_pnl: Decimal
+    ) -> int | None:
+        """Mark a position closed. Returns its originating thesis id (None for
+        external positions), as get_thesis_id_for_position would."""
+        return await self.pool.fetchval(
             """
-            UPDATE options_positions
+            UPDATE options_positions p
             SET status = 'closed', close_reason = $2, realized_pnl = $3, closed_at = NOW()
-            WHERE id = $1
+            WHERE p.id = $1
+            RETURNING (
+                SELECT r.thesis_id FROM trade_recommendations r
+                WHERE r.id = p.recommendation_id
+            )
             """,
             position_id,
             reason,
             realized_pnl,
         )
 
+    async def get_portfolio_totals(self) -> dict:
+        """Open-position totals plus realized P&L and closed count, in one scan.
+
+        Replaces separate get_total_options_exposure / get_total_realized_pnl /
+        get_closed_positions_count round trips where several are needed together.
+        """
+        row = await self.pool.fetchrow(
+            """
+            SELECT
+                COUNT(*) FILTER (WHERE status = 'open') AS open_count,
+                COALESCE(SUM(unrealized_pnl) FILTER (WHERE status = 'open'), 0)
+                    AS total_unrealized_pnl,
+                COALESCE(SUM(cost_basis) FILTER (WHERE status = 'open'), 0)
+                    AS total_cost_basis,
+                COUNT(*) FILTER (WHERE status = 'open' AND "right" = 'call') AS calls_count,
+                COUNT(*) FILTER (WHERE status = 'open' AND "right" = 'put') AS puts_count,
+                COUNT(*) FILTER (WHERE status = 'closed') AS closed_count,
+                COALESCE(SUM(realized_pnl) FILTER (WHERE status = 'closed'), 0)
+                    AS total_realized_pnl
+            FROM options_positions
+            WHERE status IN ('open', 'closed')
+            """
+        )
+        return dict(row)
+
+    async def get_sector_concentration(self) -> list[tuple[str, int, list[str]]]:
+        """(sector, open position count, tickers) per watchlist sector, most concentrated first.
+
+        The tickers double as the ticker -> sector labels for the position
+        lines, so labels and counts come from one read of the watchlist.
+        """
+        rows = await self.pool.fetch(
+            """
+            SELECT
+                COALESCE(w.sector, 'unknown') AS sector,
+                COUNT(*) AS positions,
+                array_agg(DISTINCT p.ticker ORDER BY p.ticker) AS tickers
+            FROM options_positions p
+            LEFT JOIN options_watchlist w ON w.ticker = p.ticker
+            WHERE p.status = 'open'
+            GROUP BY 1
+            ORDER BY 2 DESC, 1
+            """
+        )
+        return [(r["sector"], r["positions"], r["tickers"]) for r in rows]
+
     async def get_total_options_exposure(self) -> Decimal:
-        val = await self.pool.fetchval(
+        # numeric column, so asyncpg already returns a Decimal
+        return await self.pool.fetchval(
             "SELECT COALESCE(SUM(cost_basis), 0) FROM options_positions WHERE status = 'open'"
         )
-        return Decimal(str(val))
 
     # --- Position sync ---
 
@@ -302,15 +779,18 @@ class Database:
 
     # --- Recommendations (approval + status) ---
 
-    async def get_approved_recommendations(self) -> list[dict]:
-        rows = await self.pool.fetch(
+    async def get_approved_recommendations(self) -> list[asyncpg.Record]:
+        """Approved recommendations awaiting execution, with the columns the
+        position manager needs to place the order."""
+        return await self.pool.fetch(
             """
-            SELECT * FROM trade_recommendations
+            SELECT id, ticker, "right", strike, expiry,
+                   entry_price_low, entry_price_high, position_size_usd
+            FROM trade_recommendations
             WHERE status = 'approved'
             ORDER BY approved_at ASC
             """
         )
-        return [dict(r) for r in rows]
 
     async def update_recommendation_status(
         self, rec_id: int, status: str, reason: str | None = None
@@ -326,14 +806,36 @@ class Database:
             reason,
         )
 
+    async def claim_recommendation(self, rec_id: int) -> bool:
+        """Move an approved recommendation to 'executing'; False if it is no longer approved.
+
+        The conditional UPDATE is the claim: of several executors racing on the
+        same approval (poll loop, Discord button, auto-approve), only one wins.
+        """
+        claimed = await self.pool.fetchval(
+            """
+            UPDATE trade_recommendations
+            SET status = 'executing'
+            WHERE id = $1 AND status = 'approved'
+            RETURNING id
+            """,
+            rec_id,
+        )
+        return claimed is not None
+
     async def approve_recommendation(self, rec_id: int):
         await self.pool.execute(
             """
-            UPDATE trade_recommendations
-            SET status = 'approved', approved_at = NOW()
-            WHERE id = $1
+            WITH approved AS (
+                UPDATE trade_recommendations
+                SET status = 'approved', approved_at = NOW()
+                WHERE id = $1
+                RETURNING id
+            )
+            SELECT pg_notify($2, id::text) FROM approved
             """,
             rec_id,
+            RECOMMENDATION_APPROVED_CHANNEL,
         )
 
     async def reject_recommendation(self, rec_id: int, reason: str | None = None):
@@ -352,17 +854,7 @@ class Database:
             "SELECT * FROM trade_recommendations WHERE id = $1",
             rec_id,
         )
-        if not row:
-            return None
-        rec = dict(row)
-        # Parse JSON fields
-        for key in ("exit_targets", "risk_verification"):
-            if isinstance(rec.get(key), str):
-                try:
-                    rec[key] = json.loads(rec[key])
-                except (json.JSONDecodeError, TypeError):
-                    pass
-        return rec
+        return dict(row) if row else None
 
     async def get_pending_recommendations(self) -> list[dict]:
         rows = await self.pool.fetch(
@@ -376,21 +868,19 @@ class Database:
 
     async def get_total_realized_pnl(self) -> Decimal:
         """Sum realized P&L across all closed positions."""
-        val = await self.pool.fetchval(
+        return await self.pool.fetchval(
             "SELECT COALESCE(SUM(realized_pnl), 0) FROM options_positions WHERE status = 'closed'"
         )
-        return Decimal(str(val))
 
     async def get_closed_positions_count(self) -> int:
-        val = await self.pool.fetchval(
+        return await self.pool.fetchval(
             "SELECT COUNT(*) FROM options_positions WHERE status = 'closed'"
         )
-        return int(val)
 
     # --- Recent workflow runs ---
 
-    async def recent_runs(self, limit: int = 20) -> list[dict]:
-        rows = await self.pool.fetch(
+    async def recent_runs(self, limit: int = 20) -> list[asyncpg.Record]:
+        return await self.pool.fetch(
             """
             SELECT id, workflow_id, trigger, status, started_at, completed_at
             FROM workflow_runs
@@ -399,73 +889,81 @@ class Database:
             """,
             limit,
         )
-        return [dict(r) for r in rows]
 
-    async def get_workflow_runs_with_steps(self, limit: int = 20) -> list[dict]:
-        """Fetch recent workflow runs with their step logs grouped under each run."""
-        rows = await self.pool.fetch(
+    async def get_recent_runs_json(self, limit: int = 20) -> str:
+        """recent_runs as a JSON array, encoded by Postgres (timestamps via iso_utc)."""
+        return await self.pool.fetchval(
             """
-            SELECT
-                r.id, r.workflow_id, r.trigger, r.status,
-                r.started_at, r.completed_at,
-                s.step_id, s.agent, s.passed_gate, s.duration_ms AS step_duration_ms,
-                s.attempt,
-                CASE
-                    WHEN s.passed_gate = FALSE AND s.agent = 'risk_checker'
-                    THEN s.output->>'rejection_reason'
-                END AS failure_reason
-            FROM workflow_runs r
-            LEFT JOIN workflow_step_logs s ON s.run_id = r.id
-            ORDER BY r.started_at DESC, s.id ASC
+            SELECT COALESCE(json_agg(json_build_object(
+                'id', id,
+                'workflow_id', workflow_id,
+                'trigger', trigger,
+                'status', status,
+                'started_at', iso_utc(started_at),
+                'completed_at', iso_utc(completed_at)
+            ) ORDER BY started_at DESC), '[]')::text
+            FROM (
+                SELECT id, workflow_id, trigger, status, started_at, completed_at
+                FROM workflow_runs
+                ORDER BY started_at DESC
+                LIMIT $1
+            ) r
             """,
+            limit,
         )
-        # Group rows by run id, preserving order
-        from collections import OrderedDict
 
-        runs_map: OrderedDict[int, dict] = OrderedDict()
-        for row in rows:
-            rid = row["id"]
-            if rid not in runs_map:
-                dur = row["completed_at"] and row["started_at"] and (
-                    row["completed_at"] - row["started_at"]
-                )
-                runs_map[rid] = {
-                    "id": rid,
-                    "workflow_id": row["workflow_id"],
-                    "trigger": row["trigger"],
-                    "status": row["status"],
-                    "started_at": row["started_at"],
-                    "completed_at": row["completed_at"],
-                    "duration_ms": int(dur.total_seconds() * 1000) if dur else None,
-                    "steps": [],
-                }
-            if row["step_id"] is not None:
-                runs_map[rid]["steps"].append({
-                    "step_id": row["step_id"],
-                    "agent": row["agent"],
-                    "passed_gate": row["passed_gate"],
-                    "duration_ms": int(row["step_duration_ms"]) if row["step_duration_ms"] is not None else None,
-                    "attempt": row["attempt"],
-                    "failure_reason": row["failure_reason"],
-                })
-
-        # Classify failed runs: "filtered" (low score) vs "rejected" (risk block)
-        for run in runs_map.values():
-            if run["status"] != "failed":
-                run["fail_category"] = None
-                continue
-            failed_steps = [s for s in run["steps"] if not s["passed_gate"]]
-            if any(s["agent"] == "risk_checker" for s in failed_steps):
-                run["fail_category"] = "rejected"
-            elif any(s["step_id"] in ("evaluate", "critique") for s in failed_steps):
-                run["fail_category"] = "filtered"
-            else:
-                run["fail_category"] = "error"
-
-        result = list(runs_map.values())
-        if len(result) > limit:
-            result = result[:limit]
-        return result
+    async def get_workflow_runs_with_steps(self, limit: int = 20) -> list[dict]:
+        """Fetch recent workflow runs with their step logs grouped under each run.
+
+        Steps are aggregated per run in Postgres, so one row comes back per run
+        and the steps arrive as plain JSON-ready dicts.
+        """
+        rows = await self.pool.fetch(
+            _RECENT_RUNS_CTE + "SELECT * FROM recent ORDER BY started_at DESC",
+            limit,
+        )
+        return [dict(r) for r in rows]
+
+    async def get_workflow_stats(self, limit: int = 20) -> dict:
+        """Dashboard stats over the `limit` most recent runs, computed in one query."""
+        return await self.pool.fetchval(
+            _RECENT_RUNS_CTE + f"SELECT {_WORKFLOW_STATS_SELECT} FROM recent",
+            limit,
+        )
+
+    async def get_workflows_payload_json(self, limit: int = 20) -> str:
+        """The whole /workflows response body — runs, stats, last equity tick — as JSON text.
+
+        Keys follow the recent-runs CTE's column order; timestamps go through
+        iso_utc() to match the orjson wire format.
+        """
+        return await self.pool.fetchval(
+            _RECENT_RUNS_CTE
+            + f"""
+            SELECT json_build_object(
+                'runs', COALESCE(
+                    (
+                        SELECT json_agg(json_build_object(
+                            'id', x.id,
+                            'workflow_id', x.workflow_id,
+                            'trigger', x.trigger,
+                            'status', x.status,
+                            'started_at', iso_utc(x.started_at),
+                            'completed_at', iso_utc(x.completed_at),
+                            'duration_ms', x.duration_ms,
+                            'steps', x.steps,
+                            'fail_category', x.fail_category
+                        ) ORDER BY x.started_at DESC)
+                        FROM recent x
+                    ),
+                    '[]'
+                ),
+                'stats', (SELECT {_WORKFLOW_STATS_SELECT} FROM recent),
+                'last_equity_tick', (SELECT iso_utc(MAX(timestamp)) FROM equity_snapshots)
+            )::text
+            """,
+            limit,
+        )
 
     # --- Equity snapshots ---
 
@@ -492,7 +990,30 @@ class Database:
             total_options_exposure,
         )
 
-    async def get_equity_history(self, days: int = 30) -> list[dict]:
+    async def insert_equity_snapshots(self, rows: list[tuple]) -> None:
+        """Bulk-insert snapshots (e.g. a backfill) in one statement.
+
+        Each row is (timestamp, net_liquidation, total_unrealized_pnl,
+        total_realized_pnl, open_positions_count, total_options_exposure);
+        timestamps that already have a snapshot are skipped.
+        """
+        if not rows:
+            return
+        await self.pool.execute(
+            """
+            INSERT INTO equity_snapshots
+                (timestamp, net_liquidation, total_unrealized_pnl, total_realized_pnl,
+                 open_positions_count, total_options_exposure)
+            SELECT * FROM UNNEST(
+                $1::timestamptz[], $2::numeric[], $3::numeric[], $4::numeric[],
+                $5::int[], $6::numeric[]
+            )
+            ON CONFLICT (timestamp) DO NOTHING
+            """,
+            *(list(col) for col in zip(*rows, strict=True)),
+        )
+
+    async def get_equity_history(self, days: int = 30) -> list[asyncpg.Record]:
         rows = await self.pool.fetch(
             """
             SELECT timestamp, net_liquidation, total_unrealized_pnl,
@@ -503,22 +1024,76 @@ class Database:
             """,
             days,
         )
-        return [dict(r) for r in rows]
+        return rows
+
+    async def get_equity_history_json(self, days: int = 30) -> str:
+        """get_equity_history as a JSON array built by Postgres, decimals as strings.
+
+        The chart endpoint can return a month of 30s snapshots; this skips
+        materializing a Python object per row and field. Timestamps go through
+        iso_utc() (V024) to match orjson's rendering.
+        """
+        return await self.pool.fetchval(
+            """
+            SELECT COALESCE(json_agg(json_build_object(
+                'timestamp', iso_utc(timestamp),
+                'net_liquidation', net_liquidation::text,
+                'total_unrealized_pnl', total_unrealized_pnl::text,
+                'total_realized_pnl', total_realized_pnl::text,
+                'open_positions_count', open_positions_count,
+                'total_options_exposure', total_options_exposure::text
+            ) ORDER BY timestamp ASC), '[]')::text
+            FROM equity_snapshots
+            WHERE timestamp > NOW() - make_interval(days => $1)
+            """,
+            days,
+        )
 
     # --- Dashboard queries ---
 
     async def get_all_positions(self, status: str | None = None) -> list[dict]:
-        if status:
-            rows = await self.pool.fetch(
-                "SELECT * FROM options_positions WHERE status = $1 ORDER BY opened_at DESC",
-                status,
-            )
-        else:
-            rows = await self.pool.fetch(
-                "SELECT * FROM options_positions ORDER BY opened_at DESC"
-            )
+        # One statement for every filter, so each connection prepares it once
+        rows = await self.pool.fetch(
+            """
+            SELECT * FROM options_positions
+            WHERE ($1::text IS NULL OR status = $1)
+            ORDER BY opened_at DESC
+            """,
+            status or None,
+        )
         return [dict(r) for r in rows]
 
+    async def get_positions_json(self, status: str | None = None) -> tuple[int, str]:
+        """(count, JSON array text) of positions, encoded by Postgres for the dashboard.
+
+        Same rows and columns as get_all_positions, with decimals (and the greeks
+        JSONB) as strings and timestamps via iso_utc() to match the serialize_row
+        wire format.
+        """
+        row = await self.pool.fetchrow(
+            """
+            SELECT
+                COUNT(*) AS count,
+                -- iso_utc text sorts in time order
+                COALESCE(json_agg(p ORDER BY p.opened_at DESC), '[]')::text AS rows
+            FROM (
+                SELECT
+                    id, recommendation_id, ticker, "right", strike::text AS strike, expiry,
+                    quantity, avg_fill_price::text AS avg_fill_price,
+                    current_price::text AS current_price,
+                    unrealized_pnl::text AS unrealized_pnl,
+                    realized_pnl::text AS realized_pnl, greeks::text AS greeks,
+                    cost_basis::text AS cost_basis, status,
+                    iso_utc(opened_at) AS opened_at, iso_utc(closed_at) AS closed_at,
+                    close_reason, iso_utc(updated_at) AS updated_at, ib_con_id
+                FROM options_positions
+                WHERE ($1::text IS NULL OR status = $1)
+            ) p
+            """,
+            status or None,
+        )
+        return row["count"], row["rows"]
+
     async def get_position_by_id(self, position_id: int) -> dict | None:
         row = await self.pool.fetchrow(
             "SELECT * FROM options_positions WHERE id = $1", position_id
@@ -527,7 +1102,7 @@ class Database:
 
     async def get_theses(
         self, ticker: str | None = None, limit: int = 50
-    ) -> list[dict]:
+    ) -> list[asyncpg.Record]:
         if ticker:
             rows = await self.pool.fetch(
                 """
@@ -543,13 +1118,14 @@ class Database:
             rows = await self.pool.fetch(
                 "SELECT * FROM theses ORDER BY created_at DESC LIMIT $1", limit
             )
-        return [dict(r) for r in rows]
+        return rows
 
-    async def get_all_recommendations(self, status: str | None = None) -> list[dict]:
+    async def get_all_recommendations(self, status: str | None = None) -> list[asyncpg.Record]:
+        """Recommendation list rows; see _RECOMMENDATION_LIST_COLUMNS."""
         if status and status != "all":
             rows = await self.pool.fetch(
-                """
-                SELECT * FROM trade_recommendations
+                f"""
+                SELECT {_RECOMMENDATION_LIST_COLUMNS} FROM trade_recommendations
                 WHERE status = $1
                 ORDER BY created_at DESC
                 """,
@@ -557,39 +1133,56 @@ class Database:
             )
         else:
             rows = await self.pool.fetch(
-                "SELECT * FROM trade_recommendations ORDER BY created_at DESC"
+                f"SELECT {_RECOMMENDATION_LIST_COLUMNS} FROM trade_recommendations"
+                " ORDER BY created_at DESC"
             )
-        return [dict(r) for r in rows]
+        return rows
 
     # --- Thesis outcomes ---
 
     async def get_thesis_history_with_outcomes(
-        self, ticker: str, limit: int = 5
+        self, ticker: str, limit: int = 5, before: datetime | None = None
     ) -> list[dict]:
-        """Fetch recent theses for a ticker, including outcome columns from V016."""
+        """Fetch recent theses for a ticker, including outcome columns from V016.
+
+        Rows are shaped for prompt display: `date_str` is the UTC creation date
+        and `thesis_text` is cut to 200 chars (with "...") server-side. Pass the
+        last row's `created_at` as `before` to page further back.
+        """
         rows = await self.pool.fetch(
             """
-            SELECT id, ticker, direction, thesis_text, overall_score,
+            SELECT id, ticker, direction, overall_score,
+                   CASE WHEN length(thesis_text) > 200
+                        THEN LEFT(thesis_text, 200) || '...'
+                        ELSE thesis_text
+                   END AS thesis_text,
                    outcome_realized_pnl, outcome_close_reason, outcome_closed_at,
-                   created_at
+                   created_at,
+                   COALESCE(
+                       to_char(created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD'), 'unknown'
+                   ) AS date_str
             FROM theses
-            WHERE ticker = $1
+            WHERE ticker = $1 AND ($3::timestamptz IS NULL OR created_at < $3)
             ORDER BY created_at DESC
             LIMIT $2
             """,
             ticker.upper(),
             limit,
+            before,
         )
         return [dict(r) for r in rows]
 
     async def get_thesis_id_for_position(self, position_id: int) -> int | None:
-        """Walk FK chain: positions → recommendations → theses."""
+        """Walk FK chain: positions → recommendations → thesis_id.
+
+        The id is read off the recommendation (the FK guarantees the thesis
+        exists), so theses is not joined; use get_thesis_for_position for the row.
+        """
         return await self.pool.fetchval(
             """
-            SELECT t.id
+            SELECT r.thesis_id
             FROM options_positions p
             JOIN trade_recommendations r ON r.id = p.recommendation_id
-            JOIN theses t ON t.id = r.thesis_id
             WHERE p.id = $1
             """,
             position_id,
@@ -682,21 +1275,93 @@ class Database:
         )
         return [dict(r) for r in rows]
 
+    async def get_review_bundles(
+        self, position_ids: list[int], review_limit: int = 3
+    ) -> dict[int, dict]:
+        """Everything the reviewer needs per position, in one round-trip.
+
+        Returns {position_id: {pnl_pct, thesis_id, thesis_direction,
+        thesis_overall_score, thesis_text, reviews}} where reviews holds the
+        newest `review_limit` position reviews, newest first.
+        """
+        rows = await self.pool.fetch(
+            """
+            SELECT
+                p.id AS position_id,
+                p.unrealized_pnl / NULLIF(p.cost_basis, 0) * 100 AS pnl_pct,
+                t.id AS thesis_id,
+                t.direction AS thesis_direction,
+                t.overall_score AS thesis_overall_score,
+                t.thesis_text,
+                COALESCE(rv.reviews, '[]'::json) AS reviews
+            FROM options_positions p
+            LEFT JOIN trade_recommendations r ON r.id = p.recommendation_id
+            LEFT JOIN theses t ON t.id = r.thesis_id
+            LEFT JOIN LATERAL (
+                SELECT json_agg(x ORDER BY x.created_at DESC) AS reviews
+                FROM (
+                    SELECT created_at, recommended_action, thesis_still_valid,
+                           LEFT(reasoning, 200) AS reasoning
+                    FROM position_reviews
+                    WHERE position_id = p.id
+                    ORDER BY created_at DESC
+                    LIMIT $2
+                ) x
+            ) rv ON TRUE
+            WHERE p.id = ANY($1::bigint[])
+            """,
+            position_ids,
+            review_limit,
+        )
+        return {r["position_id"]: dict(r) for r in rows}
+
+    async def get_review_bundle(self, position_id: int, review_limit: int = 3) -> dict | None:
+        """Single-position variant of get_review_bundles."""
+        bundles = await self.get_review_bundles([position_id], review_limit)
+        return bundles.get(position_id)
+
     async def get_research_memory_stats(self) -> dict:
-        """Get aggregate stats about the research memory / feedback loop."""
+        """Get aggregate stats about the research memory / feedback loop.
+
+        Read from the research_memory_stats materialized view, so the numbers
+        are as of its last refresh_research_memory_stats().
+        """
         row = await self.pool.fetchrow(
             """
-            SELECT
-                (SELECT COUNT(*) FROM research_summaries) AS total_research,
-                (SELECT COUNT(*) FROM theses) AS total_theses,
-                (SELECT COUNT(*) FROM theses WHERE outcome_realized_pnl IS NOT NULL) AS theses_with_outcome,
-                (SELECT COUNT(*) FROM theses WHERE outcome_realized_pnl > 0) AS winning_theses,
-                (SELECT COUNT(*) FROM theses WHERE outcome_realized_pnl <= 0) AS losing_theses,
-                (SELECT COALESCE(SUM(outcome_realized_pnl), 0) FROM theses WHERE outcome_realized_pnl IS NOT NULL) AS total_outcome_pnl,
-                (SELECT COUNT(DISTINCT ticker) FROM theses) AS tickers_analyzed,
-                (SELECT COUNT(*) FROM trade_recommendations) AS total_recommendations,
-                (SELECT COUNT(*) FROM trade_recommendations WHERE status = 'approved') AS approved_recommendations,
-                (SELECT COUNT(*) FROM trade_recommendations WHERE status = 'filled') AS filled_recommendations
+            SELECT total_research, total_theses, theses_with_outcome, winning_theses,
+                   losing_theses, total_outcome_pnl, tickers_analyzed,
+                   total_recommendations, approved_recommendations, filled_recommendations
+            FROM research_memory_stats
             """
         )
         return dict(row) if row else {}
+
+    async def get_research_memory_stats_json(self) -> str:
+        """get_research_memory_stats as JSON text, with the P&L sum as a string."""
+        return await self.pool.fetchval(
+            """
+            SELECT json_build_object(
+                'total_research', total_research,
+                'total_theses', total_theses,
+                'theses_with_outcome', theses_with_outcome,
+                'winning_theses', winning_theses,
+                'losing_theses', losing_theses,
+                'total_outcome_pnl', total_outcome_pnl::text,
+                'tickers_analyzed', tickers_analyzed,
+                'total_recommendations', total_recommendations,
+                'approved_recommendations', approved_recommendations,
+                'filled_recommendations', filled_recommendations
+            )::text
+            FROM research_memory_stats
+            """
+        )
+
+    async def refresh_research_memory_stats(self, timeout: str = "30s") -> None:
+        """Recompute the research_memory_stats view without blocking its readers.
+
+        `timeout` overrides the connection's statement_timeout for the refresh,
+        which scans the underlying tables in full.
+        """
+        async with self.pool.acquire() as conn, conn.transaction():
+            await conn.execute("SELECT set_config('statement_timeout', $1, true)", timeout)
+            await conn.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY research_memory_stats")
@@ -0,0 +1,68 @@
+"""Cached account equity — avoids an IB round-trip on every risk check."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from decimal import Decimal
+
+logger = logging.getLogger(__name__)
+
+
+class AccountEquityCache:
+    """Net liquidation from IB, cached for `ttl` seconds.
+
+    The first call waits for IB. After that, a stale value is returned
+    immediately while a single background task refreshes it, so callers
+    never queue up behind accountSummaryAsync (which can stall when the
+    position manager tick loop is competing for the same connection).
+    """
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        timeout: float = 10.0,
+        default: Decimal = Decimal("200000"),
+    ):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.default = default
+        self.value: Decimal | None = None
+        self.fetched_at: float = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+
+    def _is_fresh(self) -> bool:
+        return self.value is not None and time.monotonic() - self.fetched_at < self.ttl
+
+    async def get(self, ib_client) -> Decimal:
+        """Return cached equity, falling back to `default` if IB never answered."""
+        if ib_client is None:
+            return self.value if self.value is not None else self.default
+        if self._is_fresh():
+            return self.value
+
+        if self.value is not None:
+            # Serve stale, refresh in the background (single-flight)
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.create_task(self._refresh(ib_client))
+            return self.value
+
+        await self._refresh(ib_client)
+        return self.value if self.value is not None else self.default
+
+    async def _refresh(self, ib_client) -> None:
+        async with self._lock:
+            if self._is_fresh():
+                return
+            try:
+                summary = await asyncio.wait_for(
+                    ib_client.account_summary(), timeout=self.timeout
+                )
+            except Exception as e:
+                fallback = "last known" if self.value is not None else "default"
+                logger.warning("IB account_summary failed, using %s equity: %s", fallback, e)
+                return
+            self.value = summary.net_liquidation
+            self.fetched_at = time.monotonic()
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime as _dt
 import logging
+import math
+from collections import OrderedDict
 from dataclasses import dataclass
 from decimal import Decimal
 
+from ib_async import IB, LimitOrder, MarketOrder, Option, Stock
+
 from ib.types import AccountSummary, Fill, IBPortfolioItem, OptionQuote
 from schemas.thesis import ContractSpec
 
@@ -14,6 +19,89 @@ logger = logging.getLogger(__name__)
 
 # Maximum seconds to wait for an order fill before giving up
 _ORDER_FILL_TIMEOUT_SECS = 120
+# A working (Submitted/PreSubmitted) order gets this long to fill before
+# place_order returns it as pending
+_ORDER_SETTLE_SECS = 2
+# How long a Cancelled status carrying IB's TIF-preset warning (10349) may
+# persist before the order is treated as really cancelled
+_ORDER_TIF_GRACE_SECS = 20
+
+# Option quotes: wait this long for the first price, then this much longer for
+# the bid/ask pair to complete
+_QUOTE_TIMEOUT_SECS = 8.0
+_QUOTE_PAIR_GRACE_SECS = 0.5
+
+# Qualified option contracts kept for reuse (LRU); a listed contract's conId never
+# changes, so quote-then-order sequences resolve it with IB only once
+_CONTRACT_CACHE_SIZE = 512
+
+# Pause after connectAsync for the nextValidId callback (handshake complete)
+_HANDSHAKE_SECS = 1.0
+
+# The connection is kept for the life of the client: a heartbeat every
+# _KEEPALIVE_SECS detects a dead socket, and a dropped connection is
+# re-established in the background, retrying every _RECONNECT_DELAY_SECS
+_KEEPALIVE_SECS = 60.0
+_KEEPALIVE_TIMEOUT_SECS = 10.0
+_RECONNECT_DELAY_SECS = 10.0
+
+
+def _parse_ib_date(s: str) -> _dt.date | None:
+    """Decode IB's YYYYMMDD date string; None if `s` isn't one."""
+    if len(s) != 8 or not s.isdigit():
+        return None
+    try:
+        return _dt.date(int(s[:4]), int(s[4:6]), int(s[6:8]))
+    except ValueError:
+        return None
+
+
+def _round_to_tick(price: Decimal, buy: bool) -> Decimal:
+    """Round an option premium to a valid tick, in whole cents.
+
+    Options tick rules: $0.05 increments for premiums >= $3, else $0.01. BUY
+    rounds up and SELL down to the nearest valid tick to improve fill odds.
+    """
+    tick = 5 if price >= 3 else 1
+    if buy:
+        cents = -(-math.ceil(price * 100) // tick) * tick
+    else:
+        cents = math.floor(price * 100) // tick * tick
+    return Decimal(cents).scaleb(-2)
+
+
+# ContractSpec.right <-> IB right code; _right_code also accepts IB's codes
+# and any casing, as stored in the DB or returned by the LLM
+_RIGHT_CODES = {"call": "C", "put": "P", "c": "C", "p": "P"}
+_RIGHT_NAMES = {"C": "call", "P": "put"}
+
+
+def _right_code(right: str) -> str:
+    """IB right code ("C"/"P") for a call/put in any spelling."""
+    try:
+        return _RIGHT_CODES[right.lower()]
+    except (KeyError, AttributeError):
+        raise ValueError(f"Unknown option right: {right!r}") from None
+
+
+def _portfolio_item(item) -> IBPortfolioItem:
+    """IBPortfolioItem from an ib_async PortfolioItem."""
+    c = item.contract
+    return IBPortfolioItem(
+        con_id=c.conId,
+        symbol=c.symbol,
+        sec_type=c.secType,
+        right=_RIGHT_NAMES.get(c.right),
+        strike=Decimal(str(c.strike)) if c.strike else None,
+        expiry=_parse_ib_date(c.lastTradeDateOrContractMonth or ""),
+        position=int(item.position),
+        avg_cost=Decimal(str(item.averageCost)),
+        market_price=Decimal(str(item.marketPrice)),
+        market_value=Decimal(str(item.marketValue)),
+        unrealized_pnl=Decimal(str(item.unrealizedPNL)),
+        realized_pnl=Decimal(str(item.realizedPNL)),
+        account=item.account,
+    )
 
 
 @dataclass
@@ -31,6 +119,21 @@ class IBClient:
     def __init__(self, config: IBConfig | None = None):
         self._config = config or IBConfig()
         self._ib = None
+        # (ticker, expiry, strike, right code) -> qualified ib_async Option
+        self._contracts: OrderedDict[tuple, object] = OrderedDict()
+        # (ticker, trading day) -> (expirations, strikes); listings change overnight
+        self._chains: dict[tuple[str, _dt.date], tuple[tuple, tuple]] = {}
+        # orderId -> ib_async Trade for orders placed by this client until they
+        # fill or are cancelled
+        self._open_trades: dict[int, object] = {}
+        # ticker -> qualified ib_async Stock
+        self._stocks: dict[str, object] = {}
+        # Background keep-alive / reconnect tasks; None until connect()
+        self._keepalive: asyncio.Task | None = None
+        # Serializes connect(): a manual connect and a background reconnect
+        # must not open two sessions
+        self._connect_lock = asyncio.Lock()
+        self._reconnect: asyncio.Task | None = None
 
     def _require_connected(self):
         if self._ib is None:
@@ -42,13 +145,24 @@ class IBClient:
         Known issue: ib_insync bug #303 causes first connect() to often fail with TimeoutError
         on fresh Gateway starts. This implements retry logic with backoff.
 
+        A no-op when already connected, so several owners (scheduler, position
+        manager) share one session. Once connected, the session is kept alive
+        and re-established if IB drops it, until disconnect().
+
         Args:
             max_retries: Maximum connection attempts (default 5)
             retry_delay: Seconds to wait between retries (default 5.0)
         """
-        import asyncio
-        from ib_async import IB
+        async with self._connect_lock:
+            if self._ib is not None and self._ib.isConnected():
+                return
+            if self._ib is not None:
+                self._ib.disconnectedEvent -= self._on_disconnected
+            await self._connect(max_retries, retry_delay)
+        if self._keepalive is None:
+            self._keepalive = asyncio.create_task(self._keepalive_loop())
 
+    async def _connect(self, max_retries: int, retry_delay: float) -> None:
         last_error = None
         for attempt in range(1, max_retries + 1):
             try:
@@ -71,7 +185,7 @@ class IBClient:
                 )
 
                 # Wait for nextValidId callback (confirms handshake complete)
-                await asyncio.sleep(1)
+                await asyncio.sleep(_HANDSHAKE_SECS)
 
                 # Subscribe to account updates so portfolio() has data.
                 # Use a timeout — reqAccountUpdatesAsync can hang with empty account.
@@ -90,6 +204,8 @@ class IBClient:
                     "Successfully connected to IB at %s:%d (client_id=%d)",
                     self._config.host, self._config.port, self._config.client_id,
                 )
+                # Registered once per session object; a new IB() replaces it on reconnect
+                self._ib.disconnectedEvent += self._on_disconnected
                 return  # Success!
 
             except (TimeoutError, asyncio.TimeoutError, OSError, ConnectionRefusedError) as e:
@@ -120,10 +236,44 @@ class IBClient:
         )
 
     async def disconnect(self) -> None:
+        for task in (self._keepalive, self._reconnect):
+            if task is not None:
+                task.cancel()
+        self._keepalive = self._reconnect = None
         if self._ib:
+            self._ib.disconnectedEvent -= self._on_disconnected
             self._ib.disconnect()
             logger.info("Disconnected from IB")
 
+    def _on_disconnected(self) -> None:
+        if self._reconnect is None or self._reconnect.done():
+            logger.warning("IB connection lost — reconnecting")
+            self._reconnect = asyncio.create_task(self._reconnect_loop())
+
+    async def _reconnect_loop(self) -> None:
+        # Trades from the old session no longer receive status updates
+        self._open_trades.clear()
+        while True:
+            try:
+                await self.connect(max_retries=1, retry_delay=0)
+                logger.info("Reconnected to IB")
+                return
+            except RuntimeError:
+                await asyncio.sleep(_RECONNECT_DELAY_SECS)
+
+    async def _keepalive_loop(self) -> None:
+        """Heartbeat the connection; a missed reply drops it so it gets re-established."""
+        while True:
+            await asyncio.sleep(_KEEPALIVE_SECS)
+            ib = self._ib
+            if ib is None or not ib.isConnected():
+                continue
+            try:
+                await asyncio.wait_for(ib.reqCurrentTimeAsync(), _KEEPALIVE_TIMEOUT_SECS)
+            except Exception as e:
+                logger.warning("IB heartbeat failed (%r) — dropping connection", e)
+                ib.disconnect()
+
     async def account_summary(self) -> AccountSummary:
         """Fetch account summary values."""
         self._require_connected()
@@ -138,44 +288,12 @@ class IBClient:
     async def portfolio(self) -> list[IBPortfolioItem]:
         """Get all portfolio positions with P&L from IB."""
         self._require_connected()
-        items = self._ib.portfolio()
-        result = []
-        for item in items:
-            c = item.contract
-            expiry = None
-            if c.lastTradeDateOrContractMonth:
-                try:
-                    expiry = _dt.datetime.strptime(
-                        c.lastTradeDateOrContractMonth, "%Y%m%d"
-                    ).date()
-                except ValueError:
-                    pass
-            result.append(IBPortfolioItem(
-                con_id=c.conId,
-                symbol=c.symbol,
-                sec_type=c.secType,
-                right={"C": "call", "P": "put"}.get(c.right),
-                strike=Decimal(str(c.strike)) if c.strike else None,
-                expiry=expiry,
-                position=int(item.position),
-                avg_cost=Decimal(str(item.averageCost)),
-                market_price=Decimal(str(item.marketPrice)),
-                market_value=Decimal(str(item.marketValue)),
-                unrealized_pnl=Decimal(str(item.unrealizedPNL)),
-                realized_pnl=Decimal(str(item.realizedPNL)),
-                account=item.account,
-            ))
-        return result
+        return [_portfolio_item(item) for item in self._ib.portfolio()]
 
     async def get_stock_price(self, ticker: str) -> Decimal:
         """Get the current market price for a stock (works after hours too)."""
-        import math
-
         self._require_connected()
-        from ib_async import Stock
-
-        stock = Stock(ticker, "SMART", "USD")
-        await self._ib.qualifyContractsAsync(stock)
+        stock = await self._qualified_stock(ticker)
         self._ib.reqMktData(stock, genericTickList="", snapshot=True)
         tickers = await self._ib.reqTickersAsync(stock)
         t = tickers[0] if tickers else None
@@ -218,33 +336,76 @@ class IBClient:
 
         Returns:
             {"expirations": [date, ...], "strikes": [float, ...]}
+
+        Chains are cached for the rest of the day.
         """
         self._require_connected()
-        from ib_async import Stock
-
-        stock = Stock(ticker, "SMART", "USD")
-        await self._ib.qualifyContractsAsync(stock)
+        key = (ticker.upper(), _dt.date.today())
+        cached = self._chains.get(key)
+        if cached is None:
+            cached = await self._fetch_option_chain(ticker)
+            # Drop previous days' chains
+            self._chains = {k: v for k, v in self._chains.items() if k[1] == key[1]}
+            self._chains[key] = cached
+        expirations, strikes = cached
+        return {"expirations": list(expirations), "strikes": list(strikes)}
+
+    async def _fetch_option_chain(self, ticker: str) -> tuple[tuple, tuple]:
+        """Sorted (expirations, strikes) merged across exchanges, from IB."""
+        stock = await self._qualified_stock(ticker)
         chains = await self._ib.reqSecDefOptParamsAsync(
             stock.symbol, "", stock.secType, stock.conId
         )
         if not chains:
             raise ValueError(f"No option chains for {ticker}")
 
-        # Merge expirations and strikes from all exchanges
-        all_expirations: set[_dt.date] = set()
-        all_strikes: set[float] = set()
-        for chain in chains:
-            for exp_str in chain.expirations:
-                try:
-                    all_expirations.add(_dt.datetime.strptime(exp_str, "%Y%m%d").date())
-                except ValueError:
-                    continue
-            all_strikes.update(chain.strikes)
-
-        return {
-            "expirations": sorted(all_expirations),
-            "strikes": sorted(all_strikes),
+        # Merge expirations and strikes from all exchanges; exchanges list mostly
+        # the same expirations, so each distinct string is parsed once
+        exp_strs = {e for chain in chains for e in chain.expirations}
+        all_expirations = {d for d in map(_parse_ib_date, exp_strs) if d is not None}
+        all_strikes = {k for chain in chains for k in chain.strikes}
+
+        return tuple(sorted(all_expirations)), tuple(sorted(all_strikes))
+
+    async def _qualified_stock(self, ticker: str):
+        """Qualified ib_async Stock for `ticker`, resolved with IB once per client."""
+        stock = self._stocks.get(ticker)
+        if stock is None:
+            stock = Stock(ticker, "SMART", "USD")
+            await self._ib.qualifyContractsAsync(stock)
+            if stock.conId:
+                self._stocks[ticker] = stock
+        return stock
+
+    async def _qualified_options(self, contracts: list[ContractSpec]) -> list:
+        """Qualified ib_async Options for `contracts`, None where IB doesn't know one.
+
+        Cache misses are qualified together in a single qualifyContractsAsync call.
+        """
+        keys = [(c.ticker, c.expiry, c.strike, _right_code(c.right)) for c in contracts]
+        found = {k: self._contracts[k] for k in keys if k in self._contracts}
+        for k in found:
+            self._contracts.move_to_end(k)
+
+        pending = {
+            k: Option(
+                symbol=c.ticker,
+                lastTradeDateOrContractMonth=c.expiry.strftime("%Y%m%d"),
+                strike=float(c.strike),
+                right=k[3],
+                exchange="SMART",
+            )
+            for k, c in zip(keys, contracts, strict=True)
+            if k not in found
         }
+        if pending:
+            await self._ib.qualifyContractsAsync(*pending.values())
+            for k, ib_contract in pending.items():
+                if ib_contract.conId:  # unknown contracts stay at conId 0
+                    found[k] = self._contracts[k] = ib_contract
+            while len(self._contracts) > _CONTRACT_CACHE_SIZE:
+                self._contracts.popitem(last=False)
+        return [found.get(k) for k in keys]
 
     async def get_option_quote(self, contract: ContractSpec) -> OptionQuote:
         """Get a quote for an options contract (falls back to delayed data).
@@ -252,75 +413,113 @@ class IBClient:
         Uses streaming mode instead of snapshot so delayed data ticks have
         time to arrive (paper accounts don't get real-time options data).
         """
-        import asyncio
-        import math
+        self._require_connected()
 
+        # Request delayed data if real-time isn't available (paper accounts)
+        self._ib.reqMarketDataType(4)  # 4 = delayed-frozen
+
+        (ib_contract,) = await self._qualified_options([contract])
+        if ib_contract is None:
+            raise ValueError(
+                f"Contract not found: {contract.ticker} {contract.strike}"
+                f"{_right_code(contract.right)} exp {contract.expiry}. "
+                f"Strike may not exist or market data unavailable."
+            )
+        return await self._stream_quote(contract, ib_contract)
+
+    async def get_option_quotes(
+        self, contracts: list[ContractSpec]
+    ) -> list[OptionQuote | None]:
+        """Quote several contracts at once; None for contracts IB can't qualify or quote.
+
+        All contracts are qualified in one request and their quotes stream
+        concurrently, so scanning a chain waits about as long as one quote. A
+        failed quote only costs its own contract.
+        """
         self._require_connected()
-        from ib_async import Option
+        self._ib.reqMarketDataType(4)  # 4 = delayed-frozen
 
+        ib_contracts = await self._qualified_options(contracts)
+        # One subscription per distinct contract
+        unique = {
+            c.conId: (spec, c)
+            for spec, c in zip(contracts, ib_contracts, strict=True)
+            if c is not None
+        }
+        quotes = await asyncio.gather(
+            *(self._stream_quote(spec, c) for spec, c in unique.values()),
+            return_exceptions=True,
+        )
+        by_con_id = {}
+        for (con_id, (spec, _)), quote in zip(unique.items(), quotes, strict=True):
+            if isinstance(quote, Exception):
+                logger.warning(
+                    "Quote failed for %s %s%s exp %s: %s",
+                    spec.ticker, spec.strike, _right_code(spec.right), spec.expiry, quote,
+                )
+                quote = None
+            by_con_id[con_id] = quote
+        return [by_con_id[c.conId] if c is not None else None for c in ib_contracts]
+
+    async def _stream_quote(self, contract: ContractSpec, ib_contract) -> OptionQuote:
+        """Stream ticks for a qualified contract until a quote is complete."""
         def _valid(v):
             return v is not None and not math.isnan(v) and v > 0
 
         def _safe_float(v, default=0.0):
             return v if v is not None and not math.isnan(v) else default
 
-        # Request delayed data if real-time isn't available (paper accounts)
-        self._ib.reqMarketDataType(4)  # 4 = delayed-frozen
+        any_price = asyncio.Event()
+        both_sides = asyncio.Event()
 
-        ib_contract = Option(
-            symbol=contract.ticker,
-            lastTradeDateOrContractMonth=contract.expiry.strftime("%Y%m%d"),
-            strike=float(contract.strike),
-            right=contract.right[0].upper(),  # "call" -> "C", "put" -> "P"
-            exchange="SMART",
-        )
-        qualified = await self._ib.qualifyContractsAsync(ib_contract)
-        if not qualified or not ib_contract.conId:
-            raise ValueError(
-                f"Contract not found: {contract.ticker} {contract.strike}"
-                f"{contract.right[0].upper()} exp {contract.expiry}. "
-                f"Strike may not exist or market data unavailable."
-            )
+        def _on_update(tk) -> None:
+            if _valid(tk.bid) and _valid(tk.ask):
+                both_sides.set()
+                any_price.set()
+            elif _valid(tk.last) or _valid(tk.close) or _valid(tk.bid) or _valid(tk.ask):
+                any_price.set()
 
         # Use streaming mode — snapshot returns before delayed ticks arrive
         self._ib.reqMktData(ib_contract, genericTickList="", snapshot=False)
         t = self._ib.ticker(ib_contract)
-
-        # Wait up to 8s for any price data to arrive
-        for i in range(16):
-            await asyncio.sleep(0.5)
-            if _valid(t.bid) or _valid(t.ask) or _valid(t.last) or _valid(t.close):
-                # Give one more beat for bid+ask pair to both arrive
-                await asyncio.sleep(0.5)
-                break
-
-        # Cancel streaming subscription
-        self._ib.cancelMktData(ib_contract)
+        t.updateEvent += _on_update
+        try:
+            _on_update(t)  # the ticker may already hold data
+            # Wake on the first price, then give the bid+ask pair a short grace
+            # period to complete
+            try:
+                await asyncio.wait_for(any_price.wait(), _QUOTE_TIMEOUT_SECS)
+                await asyncio.wait_for(both_sides.wait(), _QUOTE_PAIR_GRACE_SECS)
+            except TimeoutError:
+                pass
+        finally:
+            t.updateEvent -= _on_update
+            # Cancel streaming subscription
+            self._ib.cancelMktData(ib_contract)
 
         logger.info(
             "Option quote %s %s%s exp %s: bid=%s ask=%s last=%s close=%s",
-            contract.ticker, contract.strike, contract.right[0].upper(),
+            contract.ticker, contract.strike, _right_code(contract.right),
             contract.expiry, t.bid, t.ask, t.last, t.close,
         )
 
-        bid = Decimal(str(t.bid)) if _valid(t.bid) else Decimal("0")
-        ask = Decimal(str(t.ask)) if _valid(t.ask) else Decimal("0")
-        last = Decimal(str(t.last)) if _valid(t.last) else Decimal("0")
-        close = Decimal(str(t.close)) if _valid(t.close) else Decimal("0")
-
-        # Also try marketPrice() which aggregates various price sources
-        mp = t.marketPrice()
+        zero = Decimal("0")
+        bid = Decimal(str(t.bid)) if _valid(t.bid) else zero
+        ask = Decimal(str(t.ask)) if _valid(t.ask) else zero
+        last = Decimal(str(t.last)) if _valid(t.last) else zero
 
-        if bid > 0 and ask > 0:
+        # Fallbacks are only converted when used; marketPrice() aggregates
+        # various price sources
+        if bid and ask:
             mid = (bid + ask) / 2
-        elif last > 0:
+        elif last:
             mid = last
-        elif _valid(mp):
+        elif _valid(mp := t.marketPrice()):
             mid = Decimal(str(mp))
-        elif close > 0:
-            mid = close
+        elif _valid(t.close):
+            mid = Decimal(str(t.close))
         else:
-            mid = Decimal("0")
+            mid = zero
 
         greeks = t.modelGreeks or t.lastGreeks
         return OptionQuote(
@@ -351,103 +550,109 @@ class IBClient:
         fill at market open. We return the order details immediately rather than
         blocking for 2 minutes.
         """
-        import asyncio
-        import datetime as _dt
-
         self._require_connected()
-        from ib_async import LimitOrder, MarketOrder, Option
 
-        ib_contract = Option(
-            symbol=contract.ticker,
-            lastTradeDateOrContractMonth=contract.expiry.strftime("%Y%m%d"),
-            strike=float(contract.strike),
-            right=contract.right[0].upper(),
-            exchange="SMART",
-        )
-        qualified = await self._ib.qualifyContractsAsync(ib_contract)
-        if not qualified or not ib_contract.conId:
+        (ib_contract,) = await self._qualified_options([contract])
+        if ib_contract is None:
             raise ValueError(
                 f"Contract not found: {contract.ticker} {contract.strike}"
-                f"{contract.right[0].upper()} exp {contract.expiry}"
+                f"{_right_code(contract.right)} exp {contract.expiry}"
             )
 
         if order_type == "LMT" and limit_price is not None:
-            # Options tick rules: $0.05 increments for premiums >= $3, else $0.01.
-            # Round BUY up and SELL down to the nearest valid tick to improve fill odds.
-            tick = Decimal("0.05") if limit_price >= 3 else Decimal("0.01")
-            if side.upper() == "BUY":
-                rounded = (limit_price / tick).to_integral_value(rounding="ROUND_CEILING") * tick
-            else:
-                rounded = (limit_price / tick).to_integral_value(rounding="ROUND_FLOOR") * tick
+            rounded = _round_to_tick(limit_price, buy=side.upper() == "BUY")
             if rounded != limit_price:
-                logger.info("Rounded limit %s → %s (tick=%s)", limit_price, rounded, tick)
+                logger.info("Rounded limit %s → %s", limit_price, rounded)
             order = LimitOrder(side, quantity, float(rounded))
         else:
             order = MarketOrder(side, quantity)
 
         trade = self._ib.placeOrder(ib_contract, order)
-
-        # Wait for fill with timeout.
-        # Use asyncio.sleep instead of waitOnUpdate to avoid
-        # "event loop already running" error in async contexts.
-        elapsed = 0
-        while True:
-            await asyncio.sleep(2)
-            elapsed += 2
-
-            status = trade.orderStatus.status
-            logger.info(
-                "Order %d status: %s (elapsed %ds)",
-                trade.order.orderId, status, elapsed,
-            )
-
-            if status == "Filled":
-                break
-
-            # PreSubmitted = accepted by IB but waiting for market open.
-            # Submitted = live order working in the market (after-hours or during market).
-            # Return immediately with pending=True — the position will appear in
-            # IB's portfolio once the order fills and _sync_positions will pick it up.
-            if status in ("PreSubmitted", "Submitted"):
+        self._open_trades[trade.order.orderId] = trade
+        trade.filledEvent += self._forget_trade
+        trade.cancelledEvent += self._forget_trade
+
+        # Wake on every status change instead of polling; the timeout only
+        # matters for the settle / TIF-grace / fill deadlines below
+        status_changed = asyncio.Event()
+
+        def _on_status(_trade) -> None:
+            status_changed.set()
+
+        trade.statusEvent += _on_status
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            while True:
+                elapsed = loop.time() - started
+                status = trade.orderStatus.status
                 logger.info(
-                    "Order %d %s — accepted by IB (pending fill)",
-                    trade.order.orderId, status,
-                )
-                fill_price = rounded if order_type == "LMT" and limit_price is not None else (limit_price or Decimal("0"))
-                return Fill(
-                    order_id=trade.order.orderId,
-                    symbol=contract.ticker,
-                    side=side,
-                    quantity=quantity,
-                    avg_fill_price=fill_price,
-                    commission=Decimal("0"),
-                    filled_at=_dt.datetime.now(_dt.UTC),
-                    con_id=ib_contract.conId if ib_contract.conId else None,
-                    pending=True,
+                    "Order %d status: %s (elapsed %.1fs)",
+                    trade.order.orderId, status, elapsed,
                 )
 
-            # Error 10349 = IB changed TIF to DAY due to preset. The order is still
-            # live — IB sends Cancelled then Submitted. Wait for the real status.
-            if status == "Cancelled":
-                has_tif_warning = any(
-                    e.errorCode == 10349 for e in trade.log
-                )
-                if has_tif_warning and elapsed < 20:
+                if status == "Filled":
+                    break
+
+                # PreSubmitted = accepted by IB but waiting for market open.
+                # Submitted = live order working in the market (after-hours or during
+                # market). Once the order has had _ORDER_SETTLE_SECS to fill, return
+                # with pending=True — the position will appear in IB's portfolio once
+                # the order fills and _sync_positions will pick it up.
+                if status in ("PreSubmitted", "Submitted") and elapsed >= _ORDER_SETTLE_SECS:
+                    logger.info(
+                        "Order %d %s — accepted by IB (pending fill)",
+                        trade.order.orderId, status,
+                    )
+                    if order_type == "LMT" and limit_price is not None:
+                        fill_price = rounded
+                    else:
+                        fill_price = limit_price or Decimal("0")
+                    return Fill(
+                        order_id=trade.order.orderId,
+                        symbol=contract.ticker,
+                        side=side,
+                        quantity=quantity,
+                        avg_fill_price=fill_price,
+                        commission=Decimal("0"),
+                        filled_at=_dt.datetime.now(_dt.UTC),
+                        con_id=ib_contract.conId if ib_contract.conId else None,
+                        pending=True,
+                    )
+
+                # Error 10349 = IB changed TIF to DAY due to preset. The order is still
+                # live — IB sends Cancelled then Submitted. Wait for the real status.
+                if status == "Cancelled":
+                    has_tif_warning = any(
+                        e.errorCode == 10349 for e in trade.log
+                    )
+                    if not (has_tif_warning and elapsed < _ORDER_TIF_GRACE_SECS):
+                        raise RuntimeError(
+                            f"Order not filled: {trade.orderStatus.status} — "
+                            f"{trade.orderStatus.whyHeld}"
+                        )
                     logger.info(
                         "Order %d Cancelled with TIF preset warning (10349) — "
                         "waiting for real status", trade.order.orderId,
                     )
-                    continue
-                raise RuntimeError(
-                    f"Order not filled: {trade.orderStatus.status} — "
-                    f"{trade.orderStatus.whyHeld}"
-                )
 
-            if elapsed >= _ORDER_FILL_TIMEOUT_SECS:
-                self._ib.cancelOrder(trade.order)
-                raise TimeoutError(
-                    f"Order not filled within {_ORDER_FILL_TIMEOUT_SECS}s — cancelled"
+                if elapsed >= _ORDER_FILL_TIMEOUT_SECS:
+                    self._ib.cancelOrder(trade.order)
+                    raise TimeoutError(
+                        f"Order not filled within {_ORDER_FILL_TIMEOUT_SECS}s — cancelled"
+                    )
+
+                deadline = next(
+                    d for d in (_ORDER_SETTLE_SECS, _ORDER_TIF_GRACE_SECS, _ORDER_FILL_TIMEOUT_SECS)
+                    if d > elapsed
                 )
+                status_changed.clear()
+                try:
+                    await asyncio.wait_for(status_changed.wait(), deadline - elapsed)
+                except TimeoutError:
+                    pass
+        finally:
+            trade.statusEvent -= _on_status
 
         avg_price = Decimal(str(trade.orderStatus.avgFillPrice))
         commission = sum(Decimal(str(f.commission)) for f in trade.fills if f.commission)
@@ -468,12 +673,20 @@ class IBClient:
             con_id=ib_contract.conId if ib_contract.conId else None,
         )
 
+    def _forget_trade(self, trade) -> None:
+        self._open_trades.pop(trade.order.orderId, None)
+
     async def cancel_order(self, order_id: int) -> None:
         """Cancel an open order by ID."""
         self._require_connected()
-        for trade in self._ib.openTrades():
-            if trade.order.orderId == order_id:
-                self._ib.cancelOrder(trade.order)
-                logger.info("Cancelled order %d", order_id)
-                return
-        logger.warning("Order %d not found in open trades", order_id)
+        trade = self._open_trades.get(order_id)
+        if trade is None:
+            # Orders placed before this client connected aren't tracked
+            trade = next(
+                (t for t in self._ib.openTrades() if t.order.orderId == order_id), None
+            )
+        if trade is None:
+            logger.warning("Order %d not found in open trades", order_id)
+            return
+        self._ib.cancelOrder(trade.order)
+        logger.info("Cancelled order %d", order_id)
@@ -12,6 +12,8 @@ import logging
 from dataclasses import dataclass
 from decimal import Decimal
 
+import numpy as np
+
 from schemas.thesis import ContractSpec, Thesis
 
 logger = logging.getLogger(__name__)
@@ -77,7 +79,9 @@ class ContractSelector:
             self.config.min_dte,
             int(thesis.catalyst_timeline_days * self.config.expiry_multiple),
         )
-        target_date = _dt.date.today() + _dt.timedelta(days=min_dte)
+        # One "today" for the whole selection — DTE stays consistent across midnight
+        today = _dt.date.today()
+        target_date = today + _dt.timedelta(days=min_dte)
         eligible_expiries = [d for d in expirations if d >= target_date]
         if not eligible_expiries:
             # All expirations are sooner than target — pick the furthest available
@@ -85,7 +89,7 @@ class ContractSelector:
             logger.info("No expiry >= %s, using furthest available: %s", target_date, expiry)
         else:
             expiry = eligible_expiries[0]
-        dte = (expiry - _dt.date.today()).days
+        dte = (expiry - today).days
         logger.info("Selected expiry: %s (DTE=%d, target was >=%d)", expiry, dte, min_dte)
 
         # 4. Pick right: call if bullish, put if bearish
@@ -101,13 +105,12 @@ class ContractSelector:
         else:
             target_strike = price_f * (1 - otm_pct / 100)
 
-        # Sort candidate strikes by distance from target
-        ranked_strikes = sorted(strikes, key=lambda s: abs(s - target_strike))
-        # Keep only strikes within max_otm_pct
-        candidate_strikes = [
-            s for s in ranked_strikes
-            if abs(s - price_f) / price_f * 100 <= self.config.max_otm_pct
-        ]
+        # Strikes within max_otm_pct, nearest the target first (stable, so
+        # equidistant strikes keep chain order)
+        arr = np.fromiter(strikes, dtype=np.float64, count=len(strikes))
+        arr = arr[np.abs(arr - price_f) / price_f * 100 <= self.config.max_otm_pct]
+        order = np.argsort(np.abs(arr - target_strike), kind="stable")
+        candidate_strikes = arr[order].tolist()
 
         if not candidate_strikes:
             logger.warning("No strikes within %.1f%% OTM for %s", self.config.max_otm_pct, ticker)
@@ -118,29 +121,38 @@ class ContractSelector:
         expiry_candidates = eligible_expiries[:3] if eligible_expiries else [expirations[-1]]
 
         for exp in expiry_candidates:
-            dte = (exp - _dt.date.today()).days
-            for strike in candidate_strikes[:5]:  # Try up to 5 nearest strikes
-                actual_otm_pct = abs(strike - price_f) / price_f * 100
-                strike_dec = Decimal(str(strike))
-
-                logger.info(
-                    "Trying: %s %s%s exp %s (DTE=%d, OTM %.1f%%)",
-                    ticker, strike_dec, right[0].upper(), exp, dte, actual_otm_pct,
-                )
-
-                temp_spec = ContractSpec(
+            dte = (exp - today).days
+            strikes_to_try = candidate_strikes[:5]  # Try up to 5 nearest strikes
+            specs = [
+                ContractSpec(
                     ticker=ticker,
                     right=right,
-                    strike=strike_dec,
+                    strike=Decimal(str(strike)),
                     expiry=exp,
                     entry_price_low=Decimal("0"),
                     entry_price_high=Decimal("999"),
                 )
+                for strike in strikes_to_try
+            ]
+
+            # Quote every candidate strike for this expiry in one batch
+            try:
+                quotes = await self.ib.get_option_quotes(specs)
+            except Exception as e:
+                logger.info("  Quotes for exp %s not available: %s", exp, e)
+                continue
+
+            for strike, temp_spec, quote in zip(strikes_to_try, specs, quotes, strict=True):
+                actual_otm_pct = abs(strike - price_f) / price_f * 100
+                strike_dec = temp_spec.strike
+
+                logger.info(
+                    "Trying: %s %s%s exp %s (DTE=%d, OTM %.1f%%)",
+                    ticker, strike_dec, right[0].upper(), exp, dte, actual_otm_pct,
+                )
 
-                try:
-                    quote = await self.ib.get_option_quote(temp_spec)
-                except Exception as e:
-                    logger.info("  Strike $%s exp %s not available: %s", strike_dec, exp, e)
+                if quote is None:
+                    logger.info("  Strike $%s exp %s not available", strike_dec, exp)
                     continue
 
                 logger.info(
@@ -104,6 +104,12 @@ class PaperClient:
             vega=0.20,
         )
 
+    async def get_option_quotes(
+        self, contracts: list[ContractSpec]
+    ) -> list[OptionQuote | None]:
+        """Quote several contracts (see get_option_quote)."""
+        return [await self.get_option_quote(c) for c in contracts]
+
     async def place_order(
         self,
         contract: ContractSpec,
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import math
+from dataclasses import dataclass
 from decimal import Decimal
 
 from ib.rules import check_allocation, check_profit_targets, check_stop_rules
@@ -14,12 +15,25 @@ from schemas.thesis import ContractSpec
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _Allocation:
+    """Account equity and open options exposure, shared by one batch of recs."""
+
+    net_liquidation: Decimal
+    exposure: Decimal
+
+
 class PositionManager:
     """Main service loop for options position management.
 
     Polls the database for:
     1. Approved recommendations → execute orders
     2. Open positions → update prices, enforce stop/target rules
+
+    run() drives them as two loops: approved recommendations every
+    `recs_poll_interval_secs`, waking early when one is approved
+    (notify_new_recommendation, or a Postgres NOTIFY once listen_for_approvals
+    has run); open positions every `poll_interval_secs`.
     """
 
     def __init__(self, db, ib_client, config: ManagerConfig | None = None, notifier=None):
@@ -27,11 +41,47 @@ class PositionManager:
         self.ib = ib_client
         self.config = config or ManagerConfig()
         self.notifier = notifier
+        self._wake = asyncio.Event()
+        self._unlisten = None
+        # Serializes the run() loops, _tick() and execute_recommendation(): sync
+        # must not see an order mid-execution
+        self._lock = asyncio.Lock()
+
+    def notify_new_recommendation(self) -> None:
+        """Run the next tick now instead of at the end of the poll interval."""
+        self._wake.set()
+
+    async def wait_for_wakeup(self, timeout: float) -> None:
+        """Sleep until notify_new_recommendation() or `timeout` seconds, whichever is first."""
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout)
+        except TimeoutError:
+            pass
+        self._wake.clear()
+
+    async def listen_for_approvals(self) -> None:
+        """Wake on approvals from other processes (e.g. the CLI) via Postgres NOTIFY.
+
+        Best effort: without it, those approvals wait for the next poll.
+        """
+        listen = getattr(self.db, "listen_for_approvals", None)
+        if listen is None or self._unlisten is not None:
+            return
+        try:
+            self._unlisten = await listen(lambda _payload: self.notify_new_recommendation())
+        except Exception:
+            logger.warning("LISTEN for approvals failed — relying on polling", exc_info=True)
+
+    async def stop_listening(self) -> None:
+        if self._unlisten is not None:
+            unlisten, self._unlisten = self._unlisten, None
+            await unlisten()
 
     async def run(self) -> None:
         """Run the service loop until cancelled."""
         logger.info(
-            "PositionManager starting (poll every %ds)", self.config.poll_interval_secs
+            "PositionManager starting (positions every %ds, recommendations every %ds)",
+            self.config.poll_interval_secs, self.config.recs_poll_interval_secs,
         )
 
         # Connect to IB Gateway with retry logic (handles ib_insync bug #303)
@@ -52,32 +102,81 @@ class PositionManager:
 
         logger.info("Successfully connected to IB Gateway — position manager running")
 
+        await self.listen_for_approvals()
         try:
-            while True:
-                try:
-                    await self._tick()
-                except Exception:
-                    logger.exception("Error in position manager tick")
-                await asyncio.sleep(self.config.poll_interval_secs)
+            await asyncio.gather(self._recs_loop(), self._monitor_loop())
         finally:
+            await self.stop_listening()
             await self.ib.disconnect()
             logger.info("Position manager stopped")
 
+    async def _recs_loop(self) -> None:
+        while True:
+            try:
+                async with self._lock:
+                    await self._execute_approved()
+            except Exception:
+                logger.exception("Error executing approved recommendations")
+            await self.wait_for_wakeup(self.config.recs_poll_interval_secs)
+
+    async def _monitor_loop(self) -> None:
+        while True:
+            try:
+                async with self._lock:
+                    await self._sync_positions()
+                    await self._check_positions()
+            except Exception:
+                logger.exception("Error monitoring positions")
+            await asyncio.sleep(self.config.poll_interval_secs)
+
     async def _tick(self) -> None:
         """One poll cycle: sync IB → execute recs → check rules."""
-        # 1. Sync positions from IB (IB is source of truth)
-        await self._sync_positions()
+        async with self._lock:
+            # 1. Sync positions from IB (IB is source of truth)
+            await self._sync_positions()
 
-        # 2. Execute approved recommendations
+            # 2. Execute approved recommendations
+            await self._execute_approved()
+
+            # 3. Fetch open positions and check stop/target rules
+            await self._check_positions()
+
+    async def _execute_approved(self) -> None:
         approved = await self.db.get_approved_recommendations()
+        if not approved:
+            return
+        # Fetched once per batch; fills add to the exposure as they happen
+        try:
+            allocation = await self._allocation()
+        except Exception:
+            logger.warning(
+                "Batch equity/exposure fetch failed — fetching per recommendation",
+                exc_info=True,
+            )
+            allocation = None  # each rec retries the fetch and records its own failure
         for rec in approved:
-            await self._execute_recommendation(rec)
-
-        # 3. Fetch open positions and check stop/target rules
-        positions = await self.db.get_open_positions()
-        for pos_dict in positions:
-            pos = OptionsPosition(**pos_dict)
-            await self._update_and_check(pos)
+            await self._execute_recommendation(rec, allocation)
+
+    async def _allocation(self) -> _Allocation:
+        account = await self.ib.account_summary()
+        exposure = await self.db.get_total_options_exposure()
+        return _Allocation(account.net_liquidation, exposure)
+
+    async def _check_positions(self) -> None:
+        """Quote and rule-check open positions, up to max_concurrent_quotes at a time."""
+        positions = [OptionsPosition(**p) for p in await self.db.get_open_positions()]
+        sem = asyncio.Semaphore(self.config.max_concurrent_quotes)
+
+        async def check(pos: OptionsPosition) -> None:
+            async with sem:
+                await self._update_and_check(pos)
+
+        results = await asyncio.gather(*(check(p) for p in positions), return_exceptions=True)
+        for pos, result in zip(positions, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Error checking position %d (%s)", pos.id, pos.ticker, exc_info=result
+                )
 
     async def _sync_positions(self) -> None:
         """Reconcile DB positions with IB portfolio (IB is source of truth)."""
@@ -96,6 +195,7 @@ class PositionManager:
         }
 
         seen_db_ids: set[int] = set()
+        price_updates: list[tuple[int, Decimal, Decimal]] = []
 
         for ib_item in ib_options:
             # Try to match by con_id first
@@ -112,8 +212,8 @@ class PositionManager:
             if db_pos:
                 # Known position — update price from IB
                 seen_db_ids.add(db_pos["id"])
-                await self.db.update_position_price(
-                    db_pos["id"], ib_item.market_price, ib_item.unrealized_pnl
+                price_updates.append(
+                    (db_pos["id"], ib_item.market_price, ib_item.unrealized_pnl)
                 )
             else:
                 # New position not in our DB — insert as external
@@ -140,13 +240,16 @@ class PositionManager:
                     ib_item.symbol, ib_item.con_id, pos_id,
                 )
 
+        if price_updates:
+            await self.db.update_position_prices(price_updates)
+
         # Positions in DB but gone from IB → mark closed
         ib_con_ids = {i.con_id for i in ib_options}
         for db_pos in db_positions:
             if db_pos["id"] not in seen_db_ids:
                 con_id = db_pos.get("ib_con_id")
                 if con_id and con_id not in ib_con_ids:
-                    await self.db.close_position(
+                    thesis_id = await self.db.close_position(
                         db_pos["id"], "external", Decimal("0")
                     )
                     logger.info(
@@ -154,7 +257,6 @@ class PositionManager:
                     )
                     # Record outcome on the originating thesis
                     try:
-                        thesis_id = await self.db.get_thesis_id_for_position(db_pos["id"])
                         if thesis_id:
                             await self.db.update_thesis_outcome(
                                 thesis_id, realized_pnl=Decimal("0"),
@@ -163,21 +265,41 @@ class PositionManager:
                     except Exception:
                         logger.warning("Failed to update thesis outcome for position %d", db_pos["id"])
 
-    async def _execute_recommendation(self, rec: dict) -> None:
-        """Execute an approved recommendation: place order, record position."""
+    async def execute_recommendation(self, rec: dict) -> None:
+        """Execute one approved recommendation now, outside the poll loop.
+
+        Holds the same lock as the run() loops, and like them only acts on a
+        recommendation it manages to claim.
+        """
+        async with self._lock:
+            await self._execute_recommendation(rec)
+
+    async def _execute_recommendation(
+        self, rec: dict, allocation: _Allocation | None = None
+    ) -> None:
+        """Execute an approved recommendation: place order, record position.
+
+        `allocation` is reused (and updated on fill) when executing a batch;
+        without it, equity and exposure are fetched fresh. A recommendation that
+        another executor already claimed is skipped.
+        """
         rec_id = rec["id"]
         ticker = rec["ticker"]
 
-        try:
-            await self.db.update_recommendation_status(rec_id, "executing")
+        # Not inside the try below: a failed claim must not mark as failed a
+        # recommendation another executor may be working on
+        if not await self.db.claim_recommendation(rec_id):
+            logger.info("Rec %d is no longer approved — already claimed, skipping", rec_id)
+            return
 
+        try:
             # Check allocation before executing
-            account = await self.ib.account_summary()
-            exposure = await self.db.get_total_options_exposure()
-            position_usd = Decimal(str(rec["position_size_usd"]))
+            if allocation is None:
+                allocation = await self._allocation()
+            position_usd = rec["position_size_usd"]
 
             approved, reason = check_allocation(
-                position_usd, exposure, account.net_liquidation, self.config
+                position_usd, allocation.exposure, allocation.net_liquidation, self.config
             )
             if not approved:
                 logger.warning("Allocation check failed for rec %d: %s", rec_id, reason)
@@ -188,10 +310,10 @@ class PositionManager:
             contract = ContractSpec(
                 ticker=ticker,
                 right=rec["right"],
-                strike=Decimal(str(rec["strike"])),
+                strike=rec["strike"],
                 expiry=rec["expiry"],
-                entry_price_low=Decimal(str(rec["entry_price_low"])),
-                entry_price_high=Decimal(str(rec["entry_price_high"])),
+                entry_price_low=rec["entry_price_low"],
+                entry_price_high=rec["entry_price_high"],
             )
 
             # Get quote and calculate quantity
@@ -244,7 +366,7 @@ class PositionManager:
                     "ib_con_id": fill.con_id,
                     "ticker": ticker,
                     "right": rec["right"],
-                    "strike": Decimal(str(rec["strike"])),
+                    "strike": rec["strike"],
                     "expiry": rec["expiry"],
                     "quantity": fill.quantity,
                     "avg_fill_price": fill.avg_fill_price,
@@ -253,6 +375,7 @@ class PositionManager:
                     "unrealized_pnl": Decimal("0"),
                     "status": "open",
                 })
+                allocation.exposure += cost_basis
 
                 await self.db.update_recommendation_status(rec_id, "filled")
                 logger.info(
@@ -342,12 +465,13 @@ class PositionManager:
             realized = (fill.avg_fill_price - pos.avg_fill_price) * qty * 100
 
             if action.close_all:
-                await self.db.close_position(pos.id, action.reason.value, realized)
+                thesis_id = await self.db.close_position(
+                    pos.id, action.reason.value, realized
+                )
                 # Record outcome on the originating thesis
                 # Include accumulated P&L from prior partial closes
                 try:
                     total_realized = (pos.realized_pnl or Decimal("0")) + realized
-                    thesis_id = await self.db.get_thesis_id_for_position(pos.id)
                     if thesis_id:
                         await self.db.update_thesis_outcome(
                             thesis_id, realized_pnl=total_realized,
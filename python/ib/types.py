@@ -120,7 +120,16 @@ class StopAction:
 class ManagerConfig:
     """Position manager configuration."""
 
-    poll_interval_secs: int = 30
+    # Position monitoring (IB sync, quotes, stop/target rules). Lower it for
+    # faster stops at the cost of more IB market-data requests — too low risks
+    # IB pacing violations.
+    poll_interval_secs: int = 60
+    # Fallback cadence for approved recommendations; approvals normally wake
+    # the executor immediately (PositionManager.notify_new_recommendation)
+    recs_poll_interval_secs: int = 5
+    # Open positions checked at once per monitoring cycle; keeps quote
+    # requests well under IB's ~50 msg/s pacing limit
+    max_concurrent_quotes: int = 8
     hard_stop_pct: Decimal = Decimal("50")
     profit_target_1_pct: Decimal = Decimal("50")
     profit_target_2_pct: Decimal = Decimal("100")
@@ -63,8 +63,8 @@ def main():
         help="IB Gateway port (default: auto by mode — paper=4002, live=4001)",
     )
     pm_parser.add_argument(
-        "--poll-interval", type=int, default=30,
-        help="Seconds between poll cycles (default: 30)",
+        "--poll-interval", type=int, default=60,
+        help="Seconds between position-monitoring cycles (default: 60)",
     )
 
     # status
@@ -298,17 +298,13 @@ async def _maybe_save_recommendation(engine, result, args):
         return
 
     # Check if we have a real DB (not in-memory)
-    if not hasattr(engine.db, "save_thesis"):
+    if not hasattr(engine.db, "save_thesis_with_recommendation"):
         return
 
     try:
         equity = await _get_equity(args)
         position_size_usd = verification.position_size_pct * equity / Decimal("100")
 
-        # Save thesis first
-        thesis_id = await engine.db.save_thesis(result.run_id, thesis.model_dump())
-
-        # Build and save recommendation
         rec_data = {
             "contract": thesis.recommended_contract.model_dump(),
             "position_size_pct": str(verification.position_size_pct),
@@ -318,7 +314,10 @@ async def _maybe_save_recommendation(engine, result, args):
             "max_hold_days": 30,
             "risk_verification": verification.model_dump(),
         }
-        rec_id = await engine.db.save_recommendation(thesis_id, result.run_id, rec_data)
+        # Thesis and recommendation are saved together in one round trip
+        _, rec_id = await engine.db.save_thesis_with_recommendation(
+            result.run_id, thesis.model_dump(), rec_data
+        )
 
         print(f"\nRecommendation #{rec_id} saved (status: pending_review).")
         pct = verification.position_size_pct
@@ -540,7 +539,6 @@ async def _cmd_run_all(args):
             equity = account.net_liquidation
             position_size_usd = verification.position_size_pct * equity / Decimal("100")
 
-            thesis_id = await db.save_thesis(result.run_id, thesis.model_dump())
             rec_data = {
                 "contract": thesis.recommended_contract.model_dump(),
                 "position_size_pct": str(verification.position_size_pct),
@@ -550,7 +548,9 @@ async def _cmd_run_all(args):
                 "max_hold_days": 30,
                 "risk_verification": verification.model_dump(),
             }
-            rec_id = await db.save_recommendation(thesis_id, result.run_id, rec_data)
+            _, rec_id = await db.save_thesis_with_recommendation(
+                result.run_id, thesis.model_dump(), rec_data
+            )
 
             contract = thesis.recommended_contract
             print(f"  PASSED: rec #{rec_id} — {contract}")
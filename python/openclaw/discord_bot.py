@@ -63,7 +63,7 @@ class ApprovalView(View):
                     ephemeral=True,
                 )
                 try:
-                    await self.position_manager._execute_recommendation(rec)
+                    await self.position_manager.execute_recommendation(rec)
                     await interaction.channel.send(
                         f"✅ Recommendation #{self.rec_id} executed."
                     )
@@ -763,7 +763,6 @@ class DiscordBot:
 
             position_size_usd = verification.position_size_pct * equity / Decimal("100")
 
-            thesis_id = await self._db.save_thesis(result.run_id, thesis.model_dump())
             rec_data = {
                 "contract": thesis.recommended_contract.model_dump(),
                 "position_size_pct": str(verification.position_size_pct),
@@ -773,7 +772,9 @@ class DiscordBot:
                 "max_hold_days": 30,
                 "risk_verification": verification.model_dump(),
             }
-            rec_id = await self._db.save_recommendation(thesis_id, result.run_id, rec_data)
+            _, rec_id = await self._db.save_thesis_with_recommendation(
+                result.run_id, thesis.model_dump(), rec_data
+            )
             logger.info("Recommendation #%d saved for %s (size: $%s)", rec_id, ticker, position_size_usd)
             return rec_id
         except Exception:
@@ -792,7 +793,7 @@ class DiscordBot:
             if self._position_manager:
                 rec = await self._db.get_recommendation(rec_id)
                 if rec:
-                    await self._position_manager._execute_recommendation(rec)
+                    await self._position_manager.execute_recommendation(rec)
                     await channel.send(f"Recommendation **#{rec_id}** executed.")
         except Exception as e:
             logger.exception("Failed to auto-approve recommendation #%d", rec_id)
@@ -804,9 +805,10 @@ class DiscordBot:
             return
 
         positions = await self._db.get_open_positions()
-        exposure = await self._db.get_total_options_exposure()
-        realized_pnl = await self._db.get_total_realized_pnl()
-        closed_count = await self._db.get_closed_positions_count()
+        totals = await self._db.get_portfolio_totals()
+        exposure = totals["total_cost_basis"]
+        realized_pnl = totals["total_realized_pnl"]
+        closed_count = totals["closed_count"]
 
         embed = discord.Embed(title="Portfolio Summary", color=discord.Color.blue())
 
@@ -957,7 +959,7 @@ class DiscordBot:
                 "ticker": ticker,
                 "direction": "bullish",
                 "thesis_text": f"E2E test trade for {ticker} @ ${stock_price:.2f}",
-                "catalyst": json.dumps({"type": "other", "description": "Manual E2E test"}),
+                "catalyst": {"type": "other", "description": "Manual E2E test"},
                 "scores": {"overall": 7, "information_edge": 7, "volatility_pricing": 7,
                            "technical_alignment": 7, "catalyst_clarity": 7, "risk_reward_ratio": 2.0},
                 "supporting_evidence": [f"Stock price: ${stock_price:.2f}"],
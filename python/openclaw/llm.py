@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import os
@@ -16,6 +17,22 @@ T = TypeVar("T", bound=BaseModel)
 
 logger = logging.getLogger(__name__)
 
+_SCHEMA_SUFFIX = """
+
+IMPORTANT: Respond with ONLY valid JSON (no markdown code fences, no extra text) \
+that matches this exact schema:
+
+{schema}
+
+Your response must be parseable as JSON directly."""
+
+
+@functools.cache
+def _schema_instructions(response_model: type[BaseModel]) -> str:
+    """Schema suffix for a response model — built once per model class."""
+    schema = json.dumps(response_model.model_json_schema(), indent=2)
+    return _SCHEMA_SUFFIX.format(schema=schema)
+
 
 class LLMClient:
     """LLM client using claude CLI with Claude Code subscription auth.
@@ -47,16 +64,7 @@ class LLMClient:
         Includes the JSON schema in the prompt to guide structured output.
         """
         # Include schema in prompt for structured output
-        schema = response_model.model_json_schema()
-        schema_str = json.dumps(schema, indent=2)
-
-        full_prompt = f"""{prompt}
-
-IMPORTANT: Respond with ONLY valid JSON (no markdown code fences, no extra text) that matches this exact schema:
-
-{schema_str}
-
-Your response must be parseable as JSON directly."""
+        full_prompt = prompt + _schema_instructions(response_model)
 
         logger.debug(
             "LLM call: model=%s schema=%s prompt_len=%d",
@@ -113,6 +113,7 @@ class WorkflowScheduler:
                 logger.info("Scheduler shutting down")
             finally:
                 tick_task.cancel()
+                await self._position_manager.stop_listening()
                 await self.ib_client.disconnect()
 
     async def _position_tick_loop(self) -> None:
@@ -123,6 +124,7 @@ class WorkflowScheduler:
         poll_interval = self._position_manager.config.poll_interval_secs
 
         logger.info("Position tick loop started (every %ds during market hours)", poll_interval)
+        await self._position_manager.listen_for_approvals()
 
         while True:
             try:
@@ -145,23 +147,20 @@ class WorkflowScheduler:
             except Exception:
                 logger.exception("Position tick loop error")
 
-            await asyncio.sleep(poll_interval)
+            await self._position_manager.wait_for_wakeup(poll_interval)
 
     async def _record_equity_snapshot(self) -> None:
         """Record an equity snapshot after each position tick."""
         try:
             account = await self.ib_client.account_summary()
-            positions = await self.db.get_open_positions()
-            total_unrealized = sum(Decimal(str(p.get("unrealized_pnl", 0))) for p in positions)
-            total_exposure = await self.db.get_total_options_exposure()
-            total_realized = await self.db.get_total_realized_pnl()
+            totals = await self.db.get_portfolio_totals()
 
             await self.db.insert_equity_snapshot(
                 net_liquidation=account.net_liquidation,
-                total_unrealized_pnl=total_unrealized,
-                total_realized_pnl=total_realized,
-                open_positions_count=len(positions),
-                total_options_exposure=total_exposure,
+                total_unrealized_pnl=totals["total_unrealized_pnl"],
+                total_realized_pnl=totals["total_realized_pnl"],
+                open_positions_count=totals["open_count"],
+                total_options_exposure=totals["total_cost_basis"],
             )
         except Exception:
             logger.warning("Failed to record equity snapshot", exc_info=True)
@@ -264,7 +263,6 @@ class WorkflowScheduler:
             equity = account.net_liquidation
             position_size_usd = verification.position_size_pct * equity / Decimal("100")
 
-            thesis_id = await self.db.save_thesis(result.run_id, thesis.model_dump())
             rec_data = {
                 "contract": thesis.recommended_contract.model_dump(),
                 "position_size_pct": str(verification.position_size_pct),
@@ -274,7 +272,9 @@ class WorkflowScheduler:
                 "max_hold_days": 30,
                 "risk_verification": verification.model_dump(),
             }
-            rec_id = await self.db.save_recommendation(thesis_id, result.run_id, rec_data)
+            _, rec_id = await self.db.save_thesis_with_recommendation(
+                result.run_id, thesis.model_dump(), rec_data
+            )
 
             logger.info(
                 "Recommendation #%d saved for %s (size: $%s)",
@@ -314,7 +314,7 @@ class WorkflowScheduler:
             if self._position_manager:
                 rec = await self.db.get_recommendation(rec_id)
                 if rec:
-                    await self._position_manager._execute_recommendation(rec)
+                    await self._position_manager.execute_recommendation(rec)
 
         except Exception:
             logger.exception("Failed to auto-approve recommendation #%d", rec_id)
@@ -328,6 +328,18 @@ class WorkflowScheduler:
 
         workflow = get_workflow("position-review")
 
+        # Batch-fetch thesis + review history for every position up front
+        # (one query total instead of one per position)
+        prefetched = None
+        position_ids = [p["id"] for p in positions if p.get("id")]
+        if position_ids:
+            try:
+                prefetched = await self.db.get_review_bundles(position_ids, review_limit=3)
+            except Exception:
+                logger.warning(
+                    "Failed to batch-fetch review context for %s", ticker, exc_info=True,
+                )
+
         for pos in positions:
             position_id = pos.get("id")
             logger.info("Running position-review for %s (position #%s)", ticker, position_id)
@@ -335,6 +347,8 @@ class WorkflowScheduler:
             # Create a fresh reviewer per position to avoid shared mutable state
             reviewer = ReviewerAgent(llm=self.engine.llm, db=self.db)
             reviewer.set_review_context(pos)
+            if prefetched is not None:
+                reviewer.set_review_contexts(prefetched)
             original_reviewer = self.engine.agents.get("reviewer")
             self.engine.agents["reviewer"] = reviewer
 
@@ -0,0 +1 @@
+"""Agent prompt templates, bundled as package data."""
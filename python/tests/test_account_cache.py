@@ -0,0 +1,117 @@
+"""Tests for AccountEquityCache: TTL hits, serve-stale refresh, single flight, errors."""
+
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from ib.account_cache import AccountEquityCache
+from ib.types import AccountSummary
+
+
+class _FakeIB:
+    """account_summary() returns `equity`, optionally held until `release` is set."""
+
+    def __init__(self, equity: str = "150000"):
+        self.equity = Decimal(equity)
+        self.calls = 0
+        self.error: Exception | None = None
+        self.release: asyncio.Event | None = None
+
+    async def account_summary(self) -> AccountSummary:
+        self.calls += 1
+        if self.release is not None:
+            await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return AccountSummary(
+            net_liquidation=self.equity,
+            buying_power=self.equity * 4,
+            available_funds=self.equity,
+        )
+
+
+@pytest.mark.asyncio
+async def test_fresh_value_served_from_cache():
+    ib = _FakeIB()
+    cache = AccountEquityCache(ttl=60)
+
+    assert await cache.get(ib) == Decimal("150000")
+    ib.equity = Decimal("1")
+    assert await cache.get(ib) == Decimal("150000")
+    assert ib.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_value_served_while_one_refresh_runs():
+    ib = _FakeIB()
+    cache = AccountEquityCache(ttl=0)
+    await cache.get(ib)
+
+    ib.equity = Decimal("175000")
+    ib.release = asyncio.Event()
+    # Stale: both callers get the old value at once; one refresh is started
+    assert await cache.get(ib) == Decimal("150000")
+    assert await cache.get(ib) == Decimal("150000")
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert ib.calls == 2
+
+    ib.release.set()
+    await cache._refresh_task
+    assert cache.value == Decimal("175000")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_callers_share_one_fetch():
+    ib = _FakeIB()
+    ib.release = asyncio.Event()
+    cache = AccountEquityCache(ttl=60)
+
+    waiters = [asyncio.create_task(cache.get(ib)) for _ in range(5)]
+    await asyncio.sleep(0)
+    ib.release.set()
+
+    assert await asyncio.gather(*waiters) == [Decimal("150000")] * 5
+    assert ib.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_error_falls_back_to_default():
+    ib = _FakeIB()
+    ib.error = ConnectionError("gateway down")
+    cache = AccountEquityCache(ttl=60, default=Decimal("200000"))
+
+    assert await cache.get(ib) == Decimal("200000")
+    assert cache.value is None  # nothing cached; the next call retries
+    ib.error = None
+    assert await cache.get(ib) == Decimal("150000")
+
+
+@pytest.mark.asyncio
+async def test_fetch_error_keeps_last_known_value():
+    ib = _FakeIB()
+    cache = AccountEquityCache(ttl=0)
+    await cache.get(ib)
+
+    ib.error = ConnectionError("gateway down")
+    assert await cache.get(ib) == Decimal("150000")
+    await cache._refresh_task
+    assert cache.value == Decimal("150000")
+
+
+@pytest.mark.asyncio
+async def test_fetch_timeout_falls_back_to_default():
+    ib = _FakeIB()
+    ib.release = asyncio.Event()  # never set
+    cache = AccountEquityCache(timeout=0.01, default=Decimal("200000"))
+
+    assert await cache.get(ib) == Decimal("200000")
+
+
+@pytest.mark.asyncio
+async def test_no_ib_client_returns_default():
+    cache = AccountEquityCache(default=Decimal("200000"))
+    assert await cache.get(None) == Decimal("200000")
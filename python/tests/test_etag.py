@@ -0,0 +1,119 @@
+"""Tests for the dashboard's HTTP caching helpers."""
+
+from __future__ import annotations
+
+import datetime as _dt
+from decimal import Decimal
+
+import orjson
+import pytest
+from fastapi import Request, Response
+
+from dashboard.etag import (
+    cache_control,
+    etag_body_response,
+    etag_for,
+    etag_response,
+    not_modified,
+    not_modified_since,
+    set_last_modified,
+)
+
+
+def _request(**headers: str) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()],
+    })
+
+
+def test_etag_for_is_strong_and_stable():
+    tag = etag_for(b"payload")
+    assert tag.startswith('"') and tag.endswith('"') and not tag.startswith('W/')
+    assert tag == etag_for(b"payload")
+    assert tag != etag_for(b"payload2")
+    # Non-bytes change keys hash their repr
+    assert etag_for((1, "a")) == etag_for(repr((1, "a")).encode())
+
+
+@pytest.mark.parametrize(
+    ("header", "hit"),
+    [
+        (None, False),
+        ("TAG", True),
+        ('"other", TAG', True),
+        ('  TAG  ', True),
+        ("*", True),
+        ('"other"', False),
+        ("W/TAG", False),
+    ],
+)
+def test_not_modified(header: str | None, hit: bool):
+    etag = etag_for(b"body")
+    headers = {} if header is None else {"if_none_match": header.replace("TAG", etag)}
+
+    resp = not_modified(_request(**headers), etag)
+
+    if hit:
+        assert resp.status_code == 304 and resp.headers["etag"] == etag
+    else:
+        assert resp is None
+
+
+def test_etag_response_round_trip():
+    payload = {"p": Decimal("1.5"), "n": 2}
+    first = etag_response(_request(), payload)
+    assert first.status_code == 200
+    assert first.media_type == "application/json"
+    assert orjson.loads(first.body) == {"p": "1.5", "n": 2}
+
+    second = etag_response(_request(if_none_match=first.headers["etag"]), payload)
+    assert second.status_code == 304 and second.body == b""
+
+    changed = etag_body_response(_request(if_none_match=first.headers["etag"]), b"{}")
+    assert changed.status_code == 200 and changed.headers["etag"] != first.headers["etag"]
+
+
+_LAST_MODIFIED = _dt.datetime(2026, 1, 16, 14, 30, 5, 250_000, tzinfo=_dt.UTC)
+
+
+@pytest.mark.parametrize(
+    ("headers", "hit"),
+    [
+        ({}, False),
+        ({"if_modified_since": "Fri, 16 Jan 2026 14:30:05 GMT"}, True),  # sub-second
+        ({"if_modified_since": "Fri, 16 Jan 2026 14:31:00 GMT"}, True),
+        ({"if_modified_since": "Fri, 16 Jan 2026 14:30:04 GMT"}, False),
+        ({"if_modified_since": "Fri, 16 Jan 2026 09:30:05 -0500"}, True),
+        ({"if_modified_since": "not a date"}, False),
+        # If-None-Match takes precedence
+        ({"if_modified_since": "Fri, 16 Jan 2026 14:31:00 GMT", "if_none_match": '"x"'}, False),
+    ],
+)
+def test_not_modified_since(headers: dict[str, str], hit: bool):
+    resp = not_modified_since(_request(**headers), _LAST_MODIFIED)
+
+    if hit:
+        assert resp.status_code == 304
+        assert resp.headers["last-modified"] == "Fri, 16 Jan 2026 14:30:05 GMT"
+    else:
+        assert resp is None
+
+
+def test_not_modified_since_without_timestamp():
+    req = _request(if_modified_since="Fri, 16 Jan 2026 14:31:00 GMT")
+    assert not_modified_since(req, None) is None
+
+
+def test_set_last_modified():
+    est = _dt.timezone(_dt.timedelta(hours=-5))
+    resp = set_last_modified(Response(), _LAST_MODIFIED.astimezone(est))
+    assert resp.headers["last-modified"] == "Fri, 16 Jan 2026 14:30:05 GMT"
+    assert "last-modified" not in set_last_modified(Response(), None).headers
+
+
+def test_cache_control_is_private():
+    assert cache_control(Response(), 5).headers["cache-control"] == "private, max-age=5"
+    assert cache_control(Response()).headers["cache-control"] == "private, max-age=30"
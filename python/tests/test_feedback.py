@@ -0,0 +1,109 @@
+"""Tests for FeedbackAggregator's parsing of the section-tagged analyst feedback rows."""
+
+from __future__ import annotations
+
+import pytest
+
+from db.feedback import MIN_CLOSED_POSITIONS, FeedbackAggregator
+
+_NULL_ROW = dict.fromkeys((
+    "label", "ord", "total", "wins",
+    "win_info", "lose_info", "win_catalyst", "lose_catalyst",
+    "win_vol", "lose_vol", "win_tech", "lose_tech",
+    "win_days", "lose_days",
+))
+
+
+def _row(section: str, **cols) -> dict:
+    return {**_NULL_ROW, "section": section, **cols}
+
+
+class _FakePool:
+    """fetchval() answers the closed-thesis count; fetch() returns canned rows."""
+
+    def __init__(self, closed: int, rows: list[dict]):
+        self.closed = closed
+        self.rows = rows
+        self.fetches = 0
+
+    async def fetchval(self, _query):
+        return self.closed
+
+    async def fetch(self, _query):
+        self.fetches += 1
+        return self.rows
+
+
+# Rows in the order the UNION ALL's ORDER BY section, ord returns them
+_ROWS = [
+    _row("bucket", label="6", ord=6, total=4, wins=1),
+    _row("bucket", label="8", ord=8, total=3, wins=3),
+    _row(
+        "dims", total=7, wins=4,
+        win_info=7.5, lose_info=5.25, win_catalyst=8.0, lose_catalyst=8.5,
+        win_vol=6.0, lose_vol=None, win_tech=None, lose_tech=None,
+    ),
+    _row("direction", label="bearish", total=2, wins=0),
+    _row("direction", label="bullish", total=5, wins=4),
+    _row("holding", win_days=3.25, lose_days=None),
+    _row("reason", label="target_hit", ord=1, total=4),
+    _row("reason", label="stop_loss", ord=2, total=3),
+]
+
+
+@pytest.mark.asyncio
+async def test_analyst_feedback_sections():
+    feedback = await FeedbackAggregator(_FakePool(7, _ROWS))._build_analyst_feedback()
+
+    assert feedback == "\n".join([
+        "## System Feedback (Cross-Ticker Patterns)",
+        "",
+        "Based on all historical trades:",
+        "",
+        "**Win rate by score bucket:**",
+        "  - Score 6.x: 1/4 (25% win rate)",
+        "  - Score 8.x: 3/3 (100% win rate)",
+        "",
+        "**Win rate by direction:**",
+        "  - bearish: 0/2 (0%)",
+        "  - bullish: 4/5 (80%)",
+        "",
+        "**Score dimensions — winners vs losers (avg):**",
+        "  - Information Edge: winners 7.5 vs losers 5.2 (gap: +2.2)",
+        "  - Catalyst Clarity: winners 8.0 vs losers 8.5 (gap: -0.5)",
+        "",
+        "**Common close reasons:**",
+        "  - target_hit: 4 trades",
+        "  - stop_loss: 3 trades",
+        "",
+        "**Holding period (avg days):**",
+        "  - Winners: 3.2 days",
+    ])
+
+
+@pytest.mark.asyncio
+async def test_analyst_feedback_skips_empty_sections():
+    rows = [
+        _row("dims", total=5, wins=0),  # no scores recorded
+        _row("holding"),  # no opened positions joined
+        _row("reason", label="expired", ord=1, total=5),
+    ]
+
+    feedback = await FeedbackAggregator(_FakePool(5, rows))._build_analyst_feedback()
+
+    assert feedback.endswith("Based on all historical trades:\n\n"
+                             "**Common close reasons:**\n  - expired: 5 trades")
+
+
+@pytest.mark.asyncio
+async def test_analyst_feedback_empty_without_rows():
+    pool = _FakePool(5, [_row("holding")])
+    assert await FeedbackAggregator(pool)._build_analyst_feedback() == ""
+
+
+@pytest.mark.asyncio
+async def test_analyst_feedback_needs_enough_closed_theses():
+    pool = _FakePool(MIN_CLOSED_POSITIONS - 1, _ROWS)
+
+    assert await FeedbackAggregator(pool)._build_analyst_feedback() == ""
+    assert pool.fetches == 0
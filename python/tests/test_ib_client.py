@@ -0,0 +1,236 @@
+"""Tests for IBClient: pure helpers, and connection handling against a fake IB."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as _dt
+from decimal import Decimal
+
+import pytest
+from eventkit import Event
+
+import ib.client as client_mod
+from ib.client import IBClient, _parse_ib_date, _right_code, _round_to_tick
+from ib.types import OptionQuote
+from schemas.thesis import ContractSpec
+
+
+@pytest.mark.parametrize(
+    ("right", "code"),
+    [
+        ("call", "C"), ("put", "P"),
+        ("Call", "C"), ("PUT", "P"),
+        ("C", "C"), ("p", "P"),
+    ],
+)
+def test_right_code(right: str, code: str):
+    assert _right_code(right) == code
+
+
+@pytest.mark.parametrize("right", ["", "straddle", "X", None])
+def test_right_code_rejects_unknown(right):
+    with pytest.raises(ValueError, match="Unknown option right"):
+        _right_code(right)
+
+
+def _decimal_round_to_tick(price: Decimal, buy: bool) -> Decimal:
+    """The Decimal-division rounding _round_to_tick replaced; kept as the reference."""
+    tick = Decimal("0.05") if price >= 3 else Decimal("0.01")
+    rounding = "ROUND_CEILING" if buy else "ROUND_FLOOR"
+    return (price / tick).to_integral_value(rounding=rounding) * tick
+
+
+@pytest.mark.parametrize(
+    ("price", "buy", "expected"),
+    [
+        # Sub-$3: whole cents
+        ("0.50", True, "0.50"),
+        ("1.234", True, "1.24"),
+        ("1.234", False, "1.23"),
+        ("2.345", True, "2.35"),
+        ("2.345", False, "2.34"),
+        ("2.999", True, "3.00"),
+        ("2.999", False, "2.99"),
+        # $3 and up: nickels
+        ("3", True, "3.00"),
+        ("3.01", True, "3.05"),
+        ("3.01", False, "3.00"),
+        ("4.025", True, "4.05"),  # half-tick
+        ("4.025", False, "4.00"),
+        ("4.075", True, "4.10"),
+        ("4.075", False, "4.05"),
+        ("7.2", True, "7.20"),
+        ("12.37", True, "12.40"),
+        ("12.37", False, "12.35"),
+        ("724", False, "724.00"),
+    ],
+)
+def test_round_to_tick(price: str, buy: bool, expected: str):
+    rounded = _round_to_tick(Decimal(price), buy)
+    assert str(rounded) == expected
+    assert rounded == _decimal_round_to_tick(Decimal(price), buy)
+
+
+@pytest.mark.parametrize(
+    ("s", "expected"),
+    [
+        ("20260116", _dt.date(2026, 1, 16)),
+        ("20241231", _dt.date(2024, 12, 31)),
+        ("20240229", _dt.date(2024, 2, 29)),
+        ("20250229", None),  # not a leap year
+        ("20261301", None),
+        ("20260100", None),
+        ("202601", None),  # contract month, not a date
+        ("2026-01-16", None),
+        ("2026011a", None),
+        ("", None),
+    ],
+)
+def test_parse_ib_date(s: str, expected: _dt.date | None):
+    assert _parse_ib_date(s) == expected
+
+
+# ---------------------------------------------------------------------------
+# Connection keep-alive / reconnect
+# ---------------------------------------------------------------------------
+
+
+class _FakeIB:
+    """Stands in for ib_async.IB: connects instantly, drops on demand."""
+
+    created: list[_FakeIB] = []
+
+    def __init__(self):
+        self.disconnectedEvent = Event("disconnectedEvent")
+        self.connected = False
+        _FakeIB.created.append(self)
+
+    async def connectAsync(self, **_kwargs):  # noqa: N802 (ib_async API)
+        self.connected = True
+
+    def isConnected(self) -> bool:  # noqa: N802 (ib_async API)
+        return self.connected
+
+    def managedAccounts(self) -> list[str]:  # noqa: N802 (ib_async API)
+        return ["DU1"]
+
+    async def reqAccountUpdatesAsync(self, account: str):  # noqa: N802 (ib_async API)
+        pass
+
+    async def reqCurrentTimeAsync(self):  # noqa: N802 (ib_async API)
+        return None
+
+    def disconnect(self):
+        if self.connected:
+            self.connected = False
+            self.disconnectedEvent.emit()
+
+
+@pytest.fixture
+def fake_ib(monkeypatch):
+    _FakeIB.created = []
+    monkeypatch.setattr(client_mod, "IB", _FakeIB)
+    monkeypatch.setattr(client_mod, "_HANDSHAKE_SECS", 0)
+    monkeypatch.setattr(client_mod, "_RECONNECT_DELAY_SECS", 0)
+    return _FakeIB
+
+
+async def _until(predicate, timeout: float = 1.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_connect_is_noop_when_connected(fake_ib):
+    client = IBClient()
+    await client.connect()
+    await client.connect()
+
+    assert len(fake_ib.created) == 1
+    assert len(fake_ib.created[0].disconnectedEvent) == 1
+    await client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_dropped_connection_is_reestablished(fake_ib):
+    client = IBClient()
+    await client.connect()
+
+    fake_ib.created[0].disconnect()  # IB drops the session
+    await _until(lambda: client._reconnect is not None and client._reconnect.done())
+
+    assert len(fake_ib.created) == 2
+    assert client._ib is fake_ib.created[1] and client._ib.isConnected()
+    assert len(fake_ib.created[1].disconnectedEvent) == 1
+    await client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_manual_connect_during_reconnect_opens_one_session(fake_ib):
+    client = IBClient()
+    await client.connect()
+
+    fake_ib.created[0].disconnect()
+    await client.connect()  # races the background reconnect
+    await _until(lambda: client._reconnect is None or client._reconnect.done())
+
+    live = [ib for ib in fake_ib.created if ib.isConnected()]
+    assert live == [client._ib]
+    assert len(client._ib.disconnectedEvent) == 1
+    await client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_does_not_reconnect(fake_ib):
+    client = IBClient()
+    await client.connect()
+    await client.disconnect()
+    await asyncio.sleep(0)
+
+    assert len(fake_ib.created) == 1
+    assert client._keepalive is None and client._reconnect is None
+
+
+# ---------------------------------------------------------------------------
+# Batched option quotes
+# ---------------------------------------------------------------------------
+
+
+class _QualifiedContract:
+    def __init__(self, con_id: int):
+        self.conId = con_id
+
+
+@pytest.mark.asyncio
+async def test_get_option_quotes_isolates_failures(monkeypatch):
+    """One strike failing to quote yields None for it, not for the whole batch."""
+    specs = [
+        ContractSpec(
+            ticker="NVDA", right="call", strike=Decimal(strike),
+            expiry=_dt.date(2026, 1, 16),
+            entry_price_low=Decimal("1"), entry_price_high=Decimal("2"),
+        )
+        for strike in ("140", "145", "150", "155")
+    ]
+    quote = OptionQuote(
+        bid=Decimal("1"), ask=Decimal("1.1"), last=Decimal("1"), mid=Decimal("1.05"),
+        volume=1, open_interest=1,
+    )
+
+    async def qualified(contracts):
+        # 155 can't be qualified
+        return [_QualifiedContract(i) for i in range(3)] + [None]
+
+    async def stream(spec, _contract):
+        if spec.strike == Decimal("145"):
+            raise TimeoutError("no ticks")
+        return quote
+
+    client = IBClient()
+    client._ib = _FakeIB()
+    client._ib.reqMarketDataType = lambda _kind: None
+    monkeypatch.setattr(client, "_qualified_options", qualified)
+    monkeypatch.setattr(client, "_stream_quote", stream)
+
+    assert await client.get_option_quotes(specs) == [quote, None, quote, None]
@@ -7,6 +7,7 @@ zero-quote rejection, notifier integration, and position sync.
 
 from __future__ import annotations
 
+import asyncio
 import datetime as _dt
 from decimal import Decimal
 from unittest.mock import AsyncMock, call
@@ -116,6 +117,7 @@ def _make_ib_portfolio_item(
 def mock_db():
     db = AsyncMock()
     db.get_approved_recommendations.return_value = []
+    db.claim_recommendation.return_value = True
     db.get_open_positions.return_value = []
     db.get_total_options_exposure.return_value = Decimal("0")
     db.insert_position.return_value = 1
@@ -178,11 +180,9 @@ async def test_execute_recommendation_success(manager, mock_db, mock_ib):
 
     await manager._tick()
 
-    # Status transitions: executing → filled
-    assert mock_db.update_recommendation_status.await_count == 2
-    calls = mock_db.update_recommendation_status.await_args_list
-    assert calls[0] == call(1, "executing")
-    assert calls[1] == call(1, "filled")
+    # Status transitions: claimed (approved → executing) → filled
+    mock_db.claim_recommendation.assert_awaited_once_with(1)
+    assert mock_db.update_recommendation_status.await_args_list == [call(1, "filled")]
 
     # Position inserted with correct values
     mock_db.insert_position.assert_awaited_once()
@@ -240,6 +240,61 @@ async def test_execute_recommendation_order_failure(manager, mock_db, mock_ib):
     assert "Order rejected" in calls[-1][0][2]
 
 
+@pytest.mark.asyncio
+async def test_execute_recommendations_share_allocation(manager, mock_db, mock_ib):
+    """A batch fetches equity/exposure once; earlier fills count against later recs."""
+    mock_db.get_approved_recommendations.return_value = [
+        _make_rec(rec_id=1, position_size_usd=Decimal("15000")),
+        _make_rec(rec_id=2, position_size_usd=Decimal("10000")),
+    ]
+    mock_ib.get_option_quote.return_value = _make_quote(Decimal("9.00"))
+    # 15 x $9.00 x 100 = $13,500 filled; + $10,000 > $20,000 (10% of $200k)
+    mock_ib.place_order.return_value = _make_fill("BUY", 15, Decimal("9.00"))
+
+    await manager._tick()
+
+    mock_ib.account_summary.assert_awaited_once()
+    mock_db.get_total_options_exposure.assert_awaited_once()
+    mock_ib.place_order.assert_awaited_once()
+    calls = mock_db.update_recommendation_status.await_args_list
+    assert calls[-1][0][:2] == (2, "failed")
+
+
+@pytest.mark.asyncio
+async def test_execute_recommendation_skips_unclaimed(manager, mock_db, mock_ib):
+    """A rec another executor already claimed is neither ordered nor marked failed."""
+    mock_db.claim_recommendation.return_value = False
+
+    await manager._execute_recommendation(_make_rec())
+
+    mock_ib.place_order.assert_not_awaited()
+    mock_db.update_recommendation_status.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_executions_place_one_order(manager, mock_db, mock_ib):
+    """The poll loop and a direct execution racing on one approval place one BUY."""
+    claimed: set[int] = set()
+
+    async def claim(rec_id):
+        await asyncio.sleep(0)
+        if rec_id in claimed:
+            return False
+        claimed.add(rec_id)
+        return True
+
+    rec = _make_rec()
+    mock_db.claim_recommendation.side_effect = claim
+    mock_db.get_approved_recommendations.return_value = [rec]
+    mock_ib.get_option_quote.return_value = _make_quote(Decimal("9.00"))
+    mock_ib.place_order.return_value = _make_fill("BUY", 2, Decimal("9.00"))
+
+    await asyncio.gather(manager._tick(), manager.execute_recommendation(rec))
+
+    mock_ib.place_order.assert_awaited_once()
+    assert mock_db.claim_recommendation.await_count == 2
+
+
 # ---------------------------------------------------------------------------
 # Hard stop
 # ---------------------------------------------------------------------------
@@ -497,6 +552,33 @@ async def test_tick_processes_multiple_positions(manager, mock_db, mock_ib):
     assert mock_db.update_position_price.await_count == 2
 
 
+@pytest.mark.asyncio
+async def test_tick_quotes_positions_concurrently(mock_db, mock_ib, config):
+    """Position quotes overlap, bounded by max_concurrent_quotes."""
+    config.max_concurrent_quotes = 2
+    manager = PositionManager(db=mock_db, ib_client=mock_ib, config=config)
+    mock_db.get_open_positions.return_value = [
+        _make_position(pos_id=i, pnl=Decimal("100")) for i in range(1, 6)
+    ]
+
+    in_flight = peak = 0
+
+    async def quote(_contract):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return _make_quote(Decimal("9.50"))
+
+    mock_ib.get_option_quote.side_effect = quote
+
+    await manager._tick()
+
+    assert peak == 2
+    assert mock_db.update_position_price.await_count == 5
+
+
 # ---------------------------------------------------------------------------
 # Position sync from IB
 # ---------------------------------------------------------------------------
@@ -532,8 +614,8 @@ async def test_sync_updates_existing_position(manager, mock_db, mock_ib):
 
     await manager._sync_positions()
 
-    mock_db.update_position_price.assert_awaited_once_with(
-        1, Decimal("11.00"), Decimal("400")
+    mock_db.update_position_prices.assert_awaited_once_with(
+        [(1, Decimal("11.00"), Decimal("400"))]
     )
     mock_db.insert_position.assert_not_awaited()
 
@@ -567,7 +649,7 @@ async def test_sync_backfills_con_id(manager, mock_db, mock_ib):
     await manager._sync_positions()
 
     mock_db.update_position_con_id.assert_awaited_once_with(3, 77777)
-    mock_db.update_position_price.assert_awaited_once()
+    mock_db.update_position_prices.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -585,7 +667,7 @@ async def test_sync_skips_non_options(manager, mock_db, mock_ib):
     await manager._sync_positions()
 
     mock_db.insert_position.assert_not_awaited()
-    mock_db.update_position_price.assert_not_awaited()
+    mock_db.update_position_prices.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -597,5 +679,5 @@ async def test_sync_empty_portfolio(manager, mock_db, mock_ib):
     await manager._sync_positions()
 
     mock_db.insert_position.assert_not_awaited()
-    mock_db.update_position_price.assert_not_awaited()
+    mock_db.update_position_prices.assert_not_awaited()
     mock_db.close_position.assert_not_awaited()
@@ -0,0 +1,57 @@
+"""Tests for the prompt template compiler in agents.base."""
+
+from __future__ import annotations
+
+import pytest
+
+from agents.base import _PROMPT_CACHE, _compile_prompt, _render_prompt
+
+
+def _render(template: str, **values) -> str:
+    return _render_prompt(_compile_prompt(template), values)
+
+
+@pytest.mark.parametrize(
+    ("template", "values", "expected"),
+    [
+        ("no placeholders", {}, "no placeholders"),
+        ("{input}", {"input": "x"}, "x"),
+        ("A {a} B {b} C", {"a": 1, "b": 2}, "A 1 B 2 C"),
+        ("{a}{a}", {"a": "z"}, "zz"),
+        ("{missing} stays", {}, "{missing} stays"),
+        # Literal braces that are not bare {name} placeholders pass through
+        ('{"ticker": "AAPL"} then {input}', {"input": "x"}, '{"ticker": "AAPL"} then x'),
+        ("{{input}}", {"input": "x"}, "{x}"),
+        ("{ input } {in-put} {}", {"input": "x"}, "{ input } {in-put} {}"),
+        ("set: {1, 2}", {}, "set: {1, 2}"),
+        # Substituted values are never re-scanned for placeholders
+        ("{a} {b}", {"a": "{b}", "b": "B"}, "{b} B"),
+        ("{input}", {"input": '{"k": "{v}"}'}, '{"k": "{v}"}'),
+    ],
+)
+def test_render_prompt(template: str, values: dict, expected: str):
+    assert _render(template, **values) == expected
+
+
+def test_compile_prompt_alternates_literals_and_names():
+    assert _compile_prompt("A {a} B {b}") == ["A ", "a", " B ", "b", ""]
+
+
+def test_render_prompt_leaves_compiled_template_untouched():
+    segments = _compile_prompt("{a}")
+    _render_prompt(segments, {"a": "x"})
+    assert segments == ["", "a", ""]
+
+
+def test_render_matches_str_replace_on_shipped_prompts():
+    """The single-pass render agrees with the str.replace loop it replaced."""
+    values = {"input": "INPUT", "historical_context": "HIST", "system_feedback": "FB"}
+    assert _PROMPT_CACHE
+    for segments in _PROMPT_CACHE.values():
+        template = "".join(
+            seg if i % 2 == 0 else f"{{{seg}}}" for i, seg in enumerate(segments)
+        )
+        expected = template
+        for key, value in values.items():
+            expected = expected.replace(f"{{{key}}}", value)
+        assert _render_prompt(segments, values) == expected
@@ -0,0 +1,69 @@
+"""Tests for dashboard row serialization: type dispatch and JSON column decoding."""
+
+from __future__ import annotations
+
+import datetime as _dt
+from decimal import Decimal
+
+import orjson
+import pytest
+
+from dashboard.serialization import JSON_COLUMNS, dumps, serialize_row
+
+
+def test_serialize_row_converts_decimals_only():
+    ts = _dt.datetime(2026, 1, 16, 14, 30, tzinfo=_dt.UTC)
+    row = {
+        "price": Decimal("1.25"),
+        "qty": 3,
+        "ratio": 0.5,
+        "ticker": "AAPL",
+        "opened_at": ts,
+        "expiry": _dt.date(2026, 2, 20),
+        "note": None,
+        "ok": True,
+    }
+
+    out = serialize_row(row)
+
+    assert out["price"] == "1.25"
+    assert {k: v for k, v in out.items() if k != "price"} == {
+        k: v for k, v in row.items() if k != "price"
+    }
+    assert out["opened_at"] is ts
+
+
+def test_serialize_row_leaves_json_text_alone_by_default():
+    out = serialize_row({"result": '{"a": 1}'})
+    assert out == {"result": '{"a": 1}'}
+
+
+def test_serialize_row_decodes_json_columns():
+    row = {
+        "result": '{"a": 1}',
+        "risks": '["x", "y"]',
+        "greeks": {"delta": 0.4},  # already decoded by the pool codec
+        "summary": "plain text",
+        "scores": "{not json",
+        "ticker": '{"not": "a json column"}',
+    }
+
+    out = serialize_row(row, parse_json=True)
+
+    assert out["result"] == {"a": 1}
+    assert out["risks"] == ["x", "y"]
+    assert out["greeks"] == {"delta": 0.4}
+    assert out["summary"] == "plain text"
+    assert out["scores"] == "{not json"
+    assert out["ticker"] == '{"not": "a json column"}'
+
+
+def test_json_columns_cover_decoded_keys():
+    assert {"result", "risks", "greeks", "summary", "scores"} <= JSON_COLUMNS
+    assert "ticker" not in JSON_COLUMNS
+
+
+def test_dumps_renders_decimals_as_strings():
+    assert orjson.loads(dumps({"p": Decimal("0.10")})) == {"p": "0.10"}
+    with pytest.raises(TypeError):
+        dumps({"s": {1, 2}})
@@ -0,0 +1,179 @@
+"""Tests for Database's batched workflow step-log writer, against a fake pool."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+
+import pytest
+
+import db.repositories as repositories
+from db.repositories import Database
+
+
+class _FakeConn:
+    """A pooled connection: records rows written inside its transaction."""
+
+    def __init__(self, pool: _FakePool):
+        self.pool = pool
+
+    def transaction(self):
+        return contextlib.nullcontext()
+
+    async def executemany(self, _query, rows):
+        self.pool.txn_batches.append(list(rows))
+
+    async def execute(self, _query, run_id, status, _result):
+        self.pool.completed.append((run_id, status))
+
+
+class _FakePool:
+    """Records the writer's executemany batches.
+
+    Fails the first `failures` calls, and every batch holding a row of a run
+    in `failing_runs`.
+    """
+
+    def __init__(self, failures: int = 0, failing_runs: frozenset[int] = frozenset()):
+        self.batches: list[list[tuple]] = []
+        self.txn_batches: list[list[tuple]] = []
+        self.completed: list[tuple[int, str]] = []
+        self.failures = failures
+        self.failing_runs = failing_runs
+        # When set, the writer's inserts wait for it
+        self.release: asyncio.Event | None = None
+
+    async def executemany(self, _query, rows):
+        if self.release is not None:
+            await self.release.wait()
+        if self.failures or any(row[0] in self.failing_runs for row in rows):
+            self.failures = max(self.failures - 1, 0)
+            raise OSError("connection reset")
+        self.batches.append(list(rows))
+
+    @contextlib.asynccontextmanager
+    async def acquire(self):
+        yield _FakeConn(self)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch):
+    monkeypatch.setattr(repositories, "STEP_LOG_RETRY_SECS", 0)
+
+
+async def _log(db: Database, run_id: int, step_id: str) -> None:
+    await db.log_step(run_id, step_id, "agent", 1, {}, None, True, 10)
+
+
+@pytest.mark.asyncio
+async def test_step_logs_written_in_one_batch():
+    pool = _FakePool()
+    db = Database(pool)
+    for i in range(5):
+        await _log(db, 1, f"s{i}")
+
+    await db.flush_step_logs()
+
+    assert len(pool.batches) == 1
+    assert [row[1] for row in pool.batches[0]] == ["s0", "s1", "s2", "s3", "s4"]
+
+
+@pytest.mark.asyncio
+async def test_step_log_write_retried_after_failure():
+    pool = _FakePool(failures=2)
+    db = Database(pool)
+    await _log(db, 1, "s0")
+
+    await db.flush_step_logs()
+
+    assert pool.batches == [[(1, "s0", "agent", 1, {}, None, True, 10)]]
+
+
+@pytest.mark.asyncio
+async def test_step_log_write_error_raised_from_flush():
+    pool = _FakePool(failures=repositories.STEP_LOG_RETRIES + 1)
+    db = Database(pool)
+    await _log(db, 1, "s0")
+
+    with pytest.raises(OSError, match="connection reset"):
+        await db.flush_step_logs()
+    # Reported once
+    await db.flush_step_logs()
+    assert pool.batches == []
+
+
+@pytest.mark.asyncio
+async def test_complete_workflow_run_writes_only_its_own_rows():
+    pool = _FakePool()
+    db = Database(pool)
+    await _log(db, 1, "a")
+    await _log(db, 2, "b")
+    await _log(db, 1, "c")
+
+    await db.complete_workflow_run(1)
+    await db.flush_step_logs()
+
+    assert pool.txn_batches == [[
+        (1, "a", "agent", 1, {}, None, True, 10),
+        (1, "c", "agent", 1, {}, None, True, 10),
+    ]]
+    assert [row[1] for batch in pool.batches for row in batch] == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_dropped_rows_raise_only_for_their_own_run():
+    pool = _FakePool(failing_runs=frozenset({1}))
+    db = Database(pool)
+    await _log(db, 1, "a")
+    await db._step_logs.join()  # run 1's batch is dropped
+    await _log(db, 2, "b")
+    await db._step_logs.join()
+
+    # Run 2 completes normally despite run 1's dropped batch
+    await db.complete_workflow_run(2)
+    # Run 1 is still marked finished; its lost rows are reported after
+    with pytest.raises(OSError, match="connection reset"):
+        await db.complete_workflow_run(1)
+
+    assert pool.completed == [(2, "completed"), (1, "completed")]
+    assert pool.batches == [[(2, "b", "agent", 1, {}, None, True, 10)]]
+
+
+@pytest.mark.asyncio
+async def test_complete_workflow_run_does_not_wait_on_other_runs():
+    pool = _FakePool()
+    pool.release = asyncio.Event()
+    db = Database(pool)
+    await _log(db, 2, "b")
+    await asyncio.sleep(0.1)  # the writer now holds run 2's batch, stuck in executemany
+    await _log(db, 1, "a")
+
+    await asyncio.wait_for(db.complete_workflow_run(1), timeout=1)
+
+    assert pool.completed == [(1, "completed")]
+    assert pool.batches == []
+    pool.release.set()
+    await db.flush_step_logs()
+    assert [row[1] for batch in pool.batches for row in batch] == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_complete_workflow_run_waits_for_its_own_held_rows():
+    pool = _FakePool()
+    pool.release = asyncio.Event()
+    db = Database(pool)
+    await _log(db, 1, "a")
+    await asyncio.sleep(0.1)  # the writer holds step "a"
+    await _log(db, 1, "b")
+
+    completing = asyncio.create_task(db.complete_workflow_run(1))
+    await asyncio.sleep(0.1)
+    assert not completing.done()
+
+    pool.release.set()
+    await completing
+    assert [row[1] for batch in pool.batches for row in batch] == ["a"]
+    assert [row[1] for batch in pool.txn_batches for row in batch] == ["b"]
@@ -0,0 +1,8 @@
+-- V019: Track watchlist modification time
+-- The dashboard serves Last-Modified from MAX(updated_at) so polling
+-- clients can get a 304 without the rows being read.
+
+ALTER TABLE options_watchlist ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ DEFAULT NOW();
+UPDATE options_watchlist SET updated_at = added_at WHERE added_at IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_options_watchlist_updated_at ON options_watchlist(updated_at);
@@ -0,0 +1,33 @@
+-- V020: Indexes matched to the hot repository queries' WHERE / ORDER BY
+-- Partial indexes keep only the live rows (open positions, pending/approved
+-- recommendations), so they stay small as history accumulates and the planner
+-- can read them in order instead of sorting.
+-- CONCURRENTLY avoids blocking the position manager's writes; migrate.sh runs
+-- each file through psql in autocommit mode, which it requires.
+
+-- get_open_positions: WHERE status = 'open' ORDER BY opened_at
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_options_positions_open_opened_at
+    ON options_positions(opened_at) WHERE status = 'open';
+
+-- find_position_by_contract: contract match among open positions, newest first
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_options_positions_open_contract
+    ON options_positions(ticker, "right", strike, expiry, opened_at DESC)
+    WHERE status = 'open';
+
+-- get_approved_recommendations: WHERE status = 'approved' ORDER BY approved_at
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_trade_recommendations_approved_at
+    ON trade_recommendations(approved_at) WHERE status = 'approved';
+
+-- get_pending_recommendations: WHERE status = 'pending_review' ORDER BY created_at DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_trade_recommendations_pending_created
+    ON trade_recommendations(created_at DESC) WHERE status = 'pending_review';
+
+-- recent_runs / dashboard /workflows: ORDER BY started_at DESC LIMIT n
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_workflow_runs_started_at
+    ON workflow_runs(started_at DESC);
+
+-- Per-run step aggregation (WHERE run_id = ? ORDER BY id); supersedes the
+-- single-column run_id index
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_workflow_step_logs_run_id_id
+    ON workflow_step_logs(run_id, id);
+DROP INDEX CONCURRENTLY IF EXISTS idx_workflow_step_logs_run_id;
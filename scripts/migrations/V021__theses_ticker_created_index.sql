@@ -0,0 +1,9 @@
+-- V021: Per-ticker thesis history in creation order
+-- The analyst's history lookup and the dashboard's per-ticker thesis list both
+-- filter on ticker and read newest first; this serves them (and keyset paging
+-- on created_at) straight from the index with no sort. It supersedes the
+-- single-column ticker index.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_theses_ticker_created
+    ON theses(ticker, created_at DESC);
+DROP INDEX CONCURRENTLY IF EXISTS idx_theses_ticker;
@@ -0,0 +1,39 @@
+-- V022: Precomputed research-memory stats
+-- The dashboard polls these aggregates over research_summaries, theses and
+-- trade_recommendations; reading one precomputed row keeps that cost flat as
+-- the tables grow. The dashboard refreshes the view every 30s.
+-- REFRESH ... CONCURRENTLY needs a unique index on a plain column, hence the
+-- constant `singleton` column.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS research_memory_stats AS
+SELECT
+    1 AS singleton,
+    (SELECT COUNT(*) FROM research_summaries) AS total_research,
+    t.total AS total_theses,
+    t.with_outcome AS theses_with_outcome,
+    t.winning AS winning_theses,
+    t.losing AS losing_theses,
+    t.outcome_pnl AS total_outcome_pnl,
+    t.tickers AS tickers_analyzed,
+    r.total AS total_recommendations,
+    r.approved AS approved_recommendations,
+    r.filled AS filled_recommendations
+FROM (
+    SELECT
+        COUNT(*) AS total,
+        COUNT(*) FILTER (WHERE outcome_realized_pnl IS NOT NULL) AS with_outcome,
+        COUNT(*) FILTER (WHERE outcome_realized_pnl > 0) AS winning,
+        COUNT(*) FILTER (WHERE outcome_realized_pnl <= 0) AS losing,
+        COALESCE(SUM(outcome_realized_pnl), 0) AS outcome_pnl,
+        COUNT(DISTINCT ticker) AS tickers
+    FROM theses
+) t, (
+    SELECT
+        COUNT(*) AS total,
+        COUNT(*) FILTER (WHERE status = 'approved') AS approved,
+        COUNT(*) FILTER (WHERE status = 'filled') AS filled
+    FROM trade_recommendations
+) r;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_research_memory_stats_singleton
+    ON research_memory_stats(singleton);
@@ -0,0 +1,47 @@
+-- V023: Keep the watchlist's Last-Modified honest for every writer
+-- V019's updated_at was only bumped by the Python add_to_watchlist upsert, so
+-- seeds, manual SQL and Rust-side writes left MAX(updated_at) unchanged and
+-- the dashboard answered 304 for changed data. Deletes can't move a MAX at all.
+-- Triggers now maintain updated_at on UPDATE and stamp a per-table
+-- modification time on any INSERT/UPDATE/DELETE/TRUNCATE; the dashboard reads
+-- the stamp.
+
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at := NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS options_watchlist_set_updated_at ON options_watchlist;
+CREATE TRIGGER options_watchlist_set_updated_at
+    BEFORE UPDATE ON options_watchlist
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+CREATE TABLE IF NOT EXISTS table_modified_at (
+    table_name TEXT PRIMARY KEY,
+    modified_at TIMESTAMPTZ NOT NULL
+);
+
+-- clock_timestamp(), not NOW(): the stamp should be as close to commit as
+-- possible so a long transaction can't publish a time clients already passed
+CREATE OR REPLACE FUNCTION touch_table_modified_at() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO table_modified_at (table_name, modified_at)
+    VALUES (TG_TABLE_NAME, clock_timestamp())
+    ON CONFLICT (table_name) DO UPDATE SET modified_at = EXCLUDED.modified_at;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS options_watchlist_modified_at ON options_watchlist;
+CREATE TRIGGER options_watchlist_modified_at
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON options_watchlist
+    FOR EACH STATEMENT EXECUTE FUNCTION touch_table_modified_at();
+
+INSERT INTO table_modified_at (table_name, modified_at)
+SELECT 'options_watchlist', COALESCE(MAX(updated_at), NOW()) FROM options_watchlist
+ON CONFLICT (table_name) DO NOTHING;
+
+-- Last-Modified no longer reads MAX(updated_at)
+DROP INDEX IF EXISTS idx_options_watchlist_updated_at;
@@ -0,0 +1,17 @@
+-- V024: ISO 8601 timestamps for Postgres-built JSON
+-- The dashboard splices JSON built by json_agg/json_build_object straight into
+-- its responses. Postgres renders timestamptz in the session TimeZone and trims
+-- trailing zeros from fractional seconds ("...:05.25+00:00"); rows encoded in
+-- Python (orjson over asyncpg's UTC datetimes) read "...:05.250000+00:00", and
+-- drop the fraction entirely when it is zero. iso_utc() renders the latter
+-- regardless of session settings.
+
+CREATE OR REPLACE FUNCTION iso_utc(ts TIMESTAMPTZ) RETURNS TEXT AS $$
+    SELECT to_char(
+        ts AT TIME ZONE 'UTC',
+        CASE WHEN date_part('microseconds', ts)::bigint % 1000000 = 0
+            THEN 'YYYY-MM-DD"T"HH24:MI:SS"+00:00"'
+            ELSE 'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"'
+        END
+    )
+$$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE;